@@ -2,6 +2,7 @@
 
 import json
 from pathlib import Path
+from typing import Literal
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
@@ -59,15 +60,47 @@ class Settings(BaseSettings):
     api_prefix: str = "/api"
     admin_api_key: str = ""
 
+    # Pitch analysis
+    analyze_workers: int = 2  # Process pool size for /analyze/batch (0 = run in threadpool)
+    analyze_batch_concurrency: int = 2  # Concurrent /analyze/batch requests before returning 503
+    analyze_threads: int = 4  # Dedicated threads for /analyze
+    analyze_queue_size: int = 32  # Queued /analyze requests before returning 503
+    analyze_cache_enabled: bool = True
+    analyze_cache_max_mb: int = 64  # In-process LRU budget for cached /analyze responses
+    analyze_cache_redis: bool = False  # Also share cached responses across workers via Redis
+    token_cache_size: int = 50000  # Memoized per-token analyses per process (0 = disabled)
+
+    # Pitch comparison
+    dtw_band: int = 0  # Sakoe-Chiba radius in pitch frames for compare DTW (0 = exact)
+    audio_workers: int = 2  # Process pool for pitch extraction/compare (0 = run in threadpool)
+    audio_task_timeout_seconds: float = 30.0  # Per-task limit in the audio pool
+    # Pitch tracker per use: "praat" (Parselmouth) or "yin" (NumPy, see scripts/benchmark_pitch.py)
+    compare_pitch_engine: Literal["praat", "yin"] = "praat"  # User recordings in /compare
+    native_pitch_engine: Literal["praat", "yin"] = "praat"  # TTS audio (/tts/with-pitch, /compare)
+    yin_sample_rate: int = 16000  # YIN decimates faster audio to this rate (0 = no decimation)
+    compare_vad_trim: bool = True  # Trim leading/trailing silence from user recordings before tracking
+    live_score_interval_seconds: float = 0.5  # Minimum time between partial scores on /compare/live
+    live_max_sessions: int = 16  # Open /compare/live sockets per worker before refusing new ones
+
     # Azure Speech AI (TTS)
     azure_speech_key: str = ""
     azure_speech_region: str = "eastus"
+    tts_pool_size: int = 2  # Idle pre-connected synthesizers kept per voice (0 = new one per request)
+    tts_pool_max_idle_seconds: float = 240.0  # Reconnect pooled synthesizers idle longer than this
+
+    # In-process TTS audio cache (L0, in front of Redis)
+    tts_memory_cache_mb: int = 64  # LRU budget for hot clips per process (0 = disabled)
+    tts_memory_cache_max_entry_kb: int = 1024  # Clips larger than this skip the memory cache
 
     # Redis Cache (hot)
     # redis_enabled defaults to False; set REDIS_ENABLED=true or provide REDIS_URL to enable
     redis_url: str = ""
     redis_enabled: bool = False
     redis_ttl_seconds: int = 86400  # 1 day in Redis
+    redis_max_connections: int = 32  # Async Redis connection pool size per worker
+    tts_single_flight: bool = True  # Coalesce concurrent identical TTS cache misses into one synthesis
+    tts_single_flight_redis: bool = False  # Also coalesce across workers with a Redis lock
+    tts_single_flight_timeout_seconds: float = 15.0  # Waiters synthesize themselves after this
 
     # Cloudflare R2 (cold storage)
     r2_enabled: bool = False
@@ -75,6 +108,12 @@ class Settings(BaseSettings):
     r2_access_key_id: str = ""
     r2_secret_access_key: str = ""
     r2_bucket_name: str = "mierutone-tts-cache"
+    r2_write_behind: bool = True  # Upload to R2 from a background queue instead of in the request
+    r2_write_queue_mb: int = 64  # Pending upload budget; when full, uploads happen in the request
+    r2_write_batch_size: int = 8  # Uploads taken (and run concurrently) per batch
+    r2_write_max_attempts: int = 5  # Per upload, with exponential backoff between attempts
+    r2_write_retry_base_seconds: float = 0.5
+    r2_write_drain_seconds: float = 10.0  # Shutdown waits this long for pending uploads
 
     # Supabase (Auth + Database)
     supabase_url: str = ""
@@ -1,15 +1,59 @@
 """MieruTone - FastAPI Backend."""
 
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.routers import analyze, tts, compare, history, user, achievements, decks
+from app.services.analyze_cache import dictionary_version
+from app.services.analyze_executor import shutdown_analyze_executor
+from app.services.analyze_pool import shutdown_analyze_pool
+from app.services.audio_pool import shutdown_audio_pool
+from app.services.cache import close_async_redis
+from app.services.pitch.lookup import get_lexicon
+from app.services.r2_writer import shutdown_r2_writer
+from app.services.tts import shutdown_synthesizer_pool, warm_synthesizer_pool
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Load read-only data before serving and release resources on shutdown."""
+    # Load the Kanjium lexicon up front so the first analyze request doesn't pay for it
+    try:
+        lexicon = get_lexicon()
+        logger.info(f"Pitch lexicon loaded ({lexicon.size:,} entries)")
+    except FileNotFoundError as e:
+        logger.warning(f"Pitch lexicon not loaded: {e}")
+    # Hash pitch.db once for analysis cache keys
+    logger.info(f"Dictionary version {dictionary_version()}")
+    # Open Azure connections now so the first TTS cache miss only pays for synthesis
+    try:
+        connected = await run_in_threadpool(warm_synthesizer_pool)
+        if connected:
+            logger.info(f"TTS synthesizer pool warmed ({connected} connections)")
+    except Exception as e:
+        logger.warning(f"TTS synthesizer pool not warmed: {e}")
+    yield
+    shutdown_analyze_executor()
+    shutdown_analyze_pool()
+    shutdown_audio_pool()
+    shutdown_synthesizer_pool()
+    await close_async_redis()
+    # Upload what's still queued for R2 before exiting
+    await run_in_threadpool(shutdown_r2_writer)
+
 
 app = FastAPI(
     title=settings.app_name,
     description="Japanese pitch accent analyzer API",
     version=settings.app_version,
+    lifespan=lifespan,
 )
 
 # CORS middleware - allow configured frontend origins
@@ -19,6 +63,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Cache", "X-TTS-Key"],  # Readable by the frontend (X-TTS-Key → /api/compare)
 )
 
 # Include routers
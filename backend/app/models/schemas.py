@@ -1,6 +1,6 @@
 """Pydantic schemas for API requests and responses."""
 
-from typing import Literal
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field
 
@@ -86,3 +86,14 @@ class AnalyzeResponse(BaseModel):
     # Homophone mode: when input is pure hiragana, show all kanji options
     is_homophone_lookup: bool = False
     homophones: list[HomophoneCandidate] | None = None
+
+
+class AnalyzeBatchRequest(BaseModel):
+    """Request body for /analyze/batch endpoint (deck imports, subtitle files)."""
+    # Same per-text limit as /analyze, plus a cap on texts per request
+    texts: list[Annotated[str, Field(max_length=10000)]] = Field(..., min_length=1, max_length=500)
+
+
+class AnalyzeBatchResponse(BaseModel):
+    """Response body for /analyze/batch endpoint, in input order."""
+    results: list[AnalyzeResponse]
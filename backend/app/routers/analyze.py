@@ -1,18 +1,121 @@
 """Analyze router - pitch accent analysis endpoint."""
 
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import logging
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import AsyncIterator, Iterator
 
-from app.core.auth import get_current_user, TokenData
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+
+from app.core.auth import get_current_user, require_admin_key, TokenData
+from app.core.config import settings
 from app.core.supabase import get_supabase_client
-from app.models.schemas import AnalyzeRequest, AnalyzeResponse
-from app.services.pitch_analyzer import analyze_text, is_homophone_lookup_candidate, lookup_homophones
+from app.models.schemas import (
+    AnalyzeRequest,
+    AnalyzeResponse,
+    AnalyzeBatchRequest,
+    AnalyzeBatchResponse,
+    HomophoneCandidate,
+    WordPitch,
+)
+from app.services.analyze_cache import (
+    get_cached_analysis,
+    save_analysis,
+    get_analyze_cache_stats,
+    clear_analyze_cache,
+)
+from app.services.analyze_executor import (
+    BoundedExecutor,
+    get_analyze_executor,
+    get_analyze_executor_stats,
+    ExecutorSaturated,
+)
+from app.services.analyze_pool import analyze_batch
+from app.services.pitch_analyzer import (
+    analyze_text,
+    iter_analyze_text,
+    is_homophone_lookup_candidate,
+    lookup_homophones,
+    get_token_cache_stats,
+    clear_token_cache,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/analyze", tags=["analyze"])
 
+# Words analyzed per executor task in /analyze/stream
+STREAM_CHUNK_WORDS = 64
+# Wait before retrying a stream chunk on a saturated executor
+STREAM_RETRY_SECONDS = 0.05
+
+
+def _analyze_blocking(text: str) -> tuple[list[HomophoneCandidate] | None, list[WordPitch]]:
+    """Run homophone lookup or standard analysis (CPU-bound, off the event loop).
+
+    Returns:
+        Tuple of (homophones if homophone mode applies else None, words).
+
+    Raises:
+        ValueError: If text exceeds maximum length.
+    """
+    # Check if this is a homophone lookup candidate (short, pure hiragana)
+    is_candidate, normalized_reading = is_homophone_lookup_candidate(text)
+
+    if is_candidate:
+        homophones = lookup_homophones(normalized_reading)
+
+        # Only use homophone mode if we found multiple candidates (>=2)
+        # Otherwise fall back to standard tokenization
+        if len(homophones) >= 2:
+            return homophones, []
+
+    # Standard mode: tokenize and analyze
+    return None, analyze_text(text)
+
+
+def _next_chunk(words: Iterator[WordPitch]) -> list[WordPitch]:
+    """Advance a streaming analysis by up to STREAM_CHUNK_WORDS words."""
+    return list(islice(words, STREAM_CHUNK_WORDS))
+
+
+async def _run_stream_chunk(executor: BoundedExecutor, words: Iterator[WordPitch]) -> list[WordPitch]:
+    """Analyze the next stream chunk on the executor.
+
+    The response has already started, so a saturated executor can no
+    longer become a 503 - wait for a free slot instead.
+    """
+    while True:
+        try:
+            chunk, _ = await executor.run(_next_chunk, words)
+            return chunk
+        except ExecutorSaturated:
+            await asyncio.sleep(STREAM_RETRY_SECONDS)
+
+
+def _save_history(user: TokenData | None, text: str, word_count: int) -> None:
+    """Auto-save to history if user is authenticated (BE-4)."""
+    if not user:
+        return
+    try:
+        supabase = get_supabase_client(user.access_token)
+        supabase.table("analysis_history").insert(
+            {
+                "user_id": user.user_id,
+                "text": text,
+                "word_count": word_count,
+            }
+        ).execute()
+    except Exception:
+        pass  # Don't fail analysis if history save fails
+
 
 @router.post("", response_model=AnalyzeResponse)
 async def analyze(
     request: AnalyzeRequest,
+    response: Response,
     user: TokenData | None = Depends(get_current_user),
 ) -> AnalyzeResponse:
     """Analyze Japanese text and return pitch accent information.
@@ -24,6 +127,12 @@ async def analyze(
     Standard mode: For kanji input, long hiragana sentences, or
     hiragana with only 0-1 matches, performs tokenization and lookup.
 
+    Responses are served from the analysis cache when the same text was
+    analyzed before. Otherwise analysis runs on the bounded analysis
+    executor; when it is saturated the request fails fast with 503.
+    Queue-wait and run times (or a cache hit) are reported in the
+    Server-Timing header.
+
     Args:
         request: Request containing Japanese text to analyze.
 
@@ -37,60 +146,198 @@ async def analyze(
 
     text = request.text.strip()
 
-    # Check if this is a homophone lookup candidate (short, pure hiragana)
-    is_candidate, normalized_reading = is_homophone_lookup_candidate(text)
+    cached = await get_cached_analysis(text)
+    if cached is not None:
+        response.headers["Server-Timing"] = "cache;desc=hit"
+        _save_history(user, request.text, len(cached.homophones or cached.words))
+        return cached.model_copy(update={"text": request.text})
 
-    if is_candidate:
-        homophones = lookup_homophones(normalized_reading)
+    try:
+        (homophones, words), timing = await get_analyze_executor().run(_analyze_blocking, text)
+    except ExecutorSaturated as e:
+        logger.warning(f"Analyze rejected: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Analysis server busy - please try again",
+            headers={"Retry-After": "1"},
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        # Only use homophone mode if we found multiple candidates (>=2)
-        # Otherwise fall back to standard tokenization
-        if len(homophones) >= 2:
-            # Auto-save to history if user is authenticated (BE-4)
-            if user:
-                try:
-                    supabase = get_supabase_client(user.access_token)
-                    supabase.table("analysis_history").insert(
-                        {
-                            "user_id": user.user_id,
-                            "text": request.text,
-                            "word_count": len(homophones),
-                        }
-                    ).execute()
-                except Exception:
-                    pass
-
-            return AnalyzeResponse(
-                text=request.text,
-                words=[],  # Empty in homophone mode
-                is_homophone_lookup=True,
-                homophones=homophones,
-            )
-        # Fall through to standard analysis if 0-1 homophones found
+    response.headers["Server-Timing"] = (
+        f"queue;dur={timing.queue_ms:.1f}, analyze;dur={timing.run_ms:.1f}"
+    )
+    logger.debug(
+        f"Analyze {len(text)} chars: queue={timing.queue_ms:.1f}ms run={timing.run_ms:.1f}ms"
+    )
+
+    _save_history(user, request.text, len(homophones) if homophones else len(words))
+
+    if homophones:
+        result = AnalyzeResponse(
+            text=request.text,
+            words=[],  # Empty in homophone mode
+            is_homophone_lookup=True,
+            homophones=homophones,
+        )
+    else:
+        result = AnalyzeResponse(
+            text=request.text,
+            words=words,
+            is_homophone_lookup=False,
+            homophones=None,
+        )
+
+    await save_analysis(text, result)
+    return result
+
+
+@router.post("/stream")
+async def analyze_stream(
+    request: AnalyzeRequest,
+    user: TokenData | None = Depends(get_current_user),
+) -> StreamingResponse:
+    """Analyze Japanese text, streaming one WordPitch per line (NDJSON).
+
+    For long pasted texts: words are written as soon as each chunk of
+    STREAM_CHUNK_WORDS tokens is processed, so the client can render
+    progressively and the server never holds the full result. Always
+    standard mode (no homophone lookup).
+
+    Chunks run on the bounded analysis executor like /analyze; if it is
+    saturated before the first chunk the request fails fast with 503.
+
+    Args:
+        request: Request containing Japanese text to analyze.
+
+    Returns:
+        application/x-ndjson stream of WordPitch objects.
+    """
+    text = request.text.strip()
+    if not text:
+        raise HTTPException(status_code=400, detail="Text cannot be empty")
 
-    # Standard mode: tokenize and analyze
     try:
-        words = analyze_text(text)
+        words = iter_analyze_text(text)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    # Auto-save to history if user is authenticated (BE-4)
-    if user:
-        try:
-            supabase = get_supabase_client(user.access_token)
-            supabase.table("analysis_history").insert(
-                {
-                    "user_id": user.user_id,
-                    "text": request.text,
-                    "word_count": len(words),
-                }
-            ).execute()
-        except Exception:
-            pass  # Don't fail analysis if history save fails
-
-    return AnalyzeResponse(
-        text=request.text,
-        words=words,
-        is_homophone_lookup=False,
-        homophones=None,
+    # Analyze the first chunk up front so a saturated executor is still a 503
+    executor = get_analyze_executor()
+    try:
+        first, _ = await executor.run(_next_chunk, words)
+    except ExecutorSaturated as e:
+        logger.warning(f"Analyze stream rejected: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Analysis server busy - please try again",
+            headers={"Retry-After": "1"},
+        )
+
+    async def ndjson_lines() -> AsyncIterator[str]:
+        chunk = first
+        word_count = 0
+        while chunk:
+            for word in chunk:
+                word_count += 1
+                yield word.model_dump_json() + "\n"
+            chunk = await _run_stream_chunk(executor, words)
+        _save_history(user, request.text, word_count)
+
+    return StreamingResponse(
+        ndjson_lines(),
+        media_type="application/x-ndjson",
+        # Disable proxy buffering so lines reach the client immediately
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/batch", response_model=AnalyzeBatchResponse)
+async def analyze_texts_batch(request: AnalyzeBatchRequest) -> AnalyzeBatchResponse:
+    """Analyze many texts at once (deck import, subtitle files).
+
+    Texts are fanned out across the analysis process pool and always
+    analyzed in standard mode (no homophone lookup). Results are returned
+    in input order. When analyze_batch_concurrency batches are already
+    running the request fails fast with 503.
+
+    Args:
+        request: Request containing the texts to analyze.
+
+    Returns:
+        AnalyzeBatchResponse with one AnalyzeResponse per input text.
+    """
+    texts = [text.strip() for text in request.texts]
+
+    try:
+        results = await analyze_batch(texts)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExecutorSaturated as e:
+        logger.warning(f"Analyze batch rejected: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Analysis server busy - please try again",
+            headers={"Retry-After": "1"},
+        )
+    except BrokenProcessPool as e:
+        logger.error(f"Analyze pool failed: {e}")
+        raise HTTPException(status_code=503, detail="Analysis temporarily unavailable")
+
+    return AnalyzeBatchResponse(
+        results=[
+            AnalyzeResponse(text=original, words=words)
+            for original, words in zip(request.texts, results)
+        ]
     )
+
+
+@router.get("/cache/stats")
+async def analyze_cache_stats(_: None = Depends(require_admin_key)) -> dict:
+    """Get analysis result and token cache statistics, plus executor load."""
+    stats = get_analyze_cache_stats()
+    total_requests = stats.hits + stats.misses
+    tokens = get_token_cache_stats()
+    total_tokens = tokens.hits + tokens.misses
+    executor = get_analyze_executor_stats()
+    return {
+        "hits": stats.hits,
+        "misses": stats.misses,
+        "hit_rate": f"{stats.hits / total_requests * 100:.1f}%" if total_requests > 0 else "0%",
+        "memory": {
+            "hits": stats.memory_hits,
+            "entries": stats.entries,
+            "size_mb": round(stats.size_bytes / (1024 * 1024), 2),
+            "max_mb": round(stats.max_bytes / (1024 * 1024), 2),
+        },
+        "redis": {
+            "enabled": settings.analyze_cache_redis,
+            "hits": stats.redis_hits,
+        },
+        "tokens": {
+            "hits": tokens.hits,
+            "misses": tokens.misses,
+            "hit_rate": f"{tokens.hits / total_tokens * 100:.1f}%" if total_tokens > 0 else "0%",
+            "entries": tokens.entries,
+            "max_entries": tokens.max_entries,
+        },
+        "executor": {
+            "workers": executor.workers,
+            "max_queue": executor.max_queue,
+            "in_flight": executor.in_flight,
+            "completed": executor.completed,
+            "rejected": executor.rejected,
+        } if executor is not None else None,
+    }
+
+
+@router.delete("/cache")
+async def clear_analysis_cache(_: None = Depends(require_admin_key)) -> dict:
+    """Clear the in-process analysis and token caches (Redis entries expire by TTL)."""
+    result = clear_analyze_cache()
+    token_entries = clear_token_cache()
+    return {
+        "memory_entries_deleted": result["memory_entries"],
+        "token_entries_deleted": token_entries,
+        "message": f"Cleared {result['memory_entries']} cached analyses",
+    }
@@ -1,22 +1,289 @@
 """Compare router - pitch comparison endpoint."""
 
+import asyncio
 import base64
 import binascii
+import json
 import logging
+import re
+from concurrent.futures.process import BrokenProcessPool
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, WebSocket, WebSocketDisconnect
 from fastapi.concurrency import run_in_threadpool
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.core.auth import get_current_user, TokenData
+from app.core.config import settings
 from app.core.supabase import get_supabase_client
-from app.services.audio_compare import compare_audio, get_score_feedback, CompareError, MAX_AUDIO_SIZE
-from app.services.tts import synthesize_speech, TTSError
+from app.services.analyze_cache import get_cached_analysis
+from app.services.analyze_executor import get_analyze_executor, ExecutorSaturated
+from app.services.audio_compare import (
+    get_score_feedback,
+    ComparisonResult,
+    CompareError,
+    MultiComparisonResult,
+    TimedPitch,
+    MAX_AUDIO_SIZE,
+)
+from app.services.audio_pool import (
+    extract_pitch_in_pool,
+    compare_pitch_in_pool,
+    compare_pitch_multi_in_pool,
+    AudioTaskTimeout,
+)
+from app.services.live_compare import LiveCompareSession
+from app.models.schemas import WordPitch
+from app.services.pitch_analyzer import analyze_text
+from app.services.segment_score import (
+    MoraSegment,
+    SegmentedComparisonResult,
+    mora_segments,
+    score_segments,
+    segment_window,
+    voiced_segment_index,
+)
+from app.services.target_contour import build_target_contour
+from app.services.tts import (
+    synthesize_speech_async,
+    get_speech_timings,
+    get_native_pitch,
+    get_native_pitch_by_key,
+    get_cached_native_pitches,
+    TTSError,
+    AZURE_VOICES,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/compare", tags=["compare"])
 
+# What the user is scored against:
+# - tts: pitch of native TTS audio (Azure, cached)
+# - target: synthetic contour from pitch accent analysis (no TTS call)
+CompareMode = Literal["tts", "target"]
+
+# Recordings per /compare/batch request (one deck practice session)
+MAX_BATCH_RECORDINGS = 30
+
+# Content key of a TTS clip, as returned by /tts (X-TTS-Key) and /tts/with-pitch
+TTS_KEY_PATTERN = r"^[0-9a-f]{16}$"
+
+
+async def _native_pitch(text: str, tts_key: str | None = None) -> list[float]:
+    """Get the voiced pitch of native audio for text.
+
+    With tts_key (the clip the client just played), the contour comes
+    straight from the cache - no synthesis. Otherwise, or if the key has
+    been evicted, the default voice is synthesized (or fetched cached).
+    """
+    if tts_key:
+        timed_pitch = await get_native_pitch_by_key(tts_key)
+        if timed_pitch is not None:
+            return timed_pitch.pitch_values
+        logger.info(f"TTS key {tts_key} not cached, synthesizing native audio")
+
+    native_audio, _ = await synthesize_speech_async(text)
+    timed_pitch = await get_native_pitch(text, native_audio)
+    return timed_pitch.pitch_values
+
+
+async def _voices_pitch(text: str, voices: list[str]) -> dict[str, list[float]]:
+    """Voiced native pitch per voice.
+
+    Cached contours come from one multi-key lookup; the remaining voices
+    are synthesized (or fetched cached) concurrently.
+    """
+    cached = await get_cached_native_pitches(text, voices)
+
+    async def voice_pitch(voice: str) -> list[float]:
+        if voice in cached:
+            return cached[voice].pitch_values
+        native_audio, _ = await synthesize_speech_async(text, voice)
+        timed_pitch = await get_native_pitch(text, native_audio, voice)
+        return timed_pitch.pitch_values
+
+    contours = await asyncio.gather(*(voice_pitch(voice) for voice in voices))
+    return dict(zip(voices, contours))
+
+
+def _check_voices(voices: list[str] | None, mode: CompareMode) -> list[str] | None:
+    """Validate a multi-voice request; returns the voices deduplicated in order."""
+    if not voices:
+        return None
+    if mode != "tts":
+        raise HTTPException(status_code=400, detail="voices can only be used with mode 'tts'")
+    unknown = [voice for voice in voices if voice not in AZURE_VOICES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown voices: {', '.join(unknown)}")
+    return list(dict.fromkeys(voices))
+
+
+def _check_segments(segments: bool, mode: CompareMode, voices: list[str] | None) -> None:
+    """Segmented scoring needs native word timings: one TTS voice only."""
+    if segments and (mode != "tts" or voices):
+        raise HTTPException(status_code=400, detail="segments can only be used with mode 'tts' and a single voice")
+
+
+def _check_tts_key(tts_key: str | None, mode: CompareMode, voices: list[str] | None, segments: bool) -> None:
+    """A tts_key names one clip: plain single-voice TTS comparison only."""
+    if tts_key and (mode != "tts" or voices or segments):
+        raise HTTPException(
+            status_code=400,
+            detail="tts_key can only be used with mode 'tts', a single voice and no segments",
+        )
+
+
+async def _analyzed_words(text: str) -> list[WordPitch]:
+    """Pitch accent analysis of text.
+
+    Reuses a cached /analyze result when there is one; otherwise runs
+    analysis on the bounded analysis executor.
+    """
+    text = text.strip()
+    cached = await get_cached_analysis(text)
+    if cached is not None and cached.words:
+        return cached.words
+    words, _ = await get_analyze_executor().run(analyze_text, text)
+    return words
+
+
+async def _target_pitch(text: str) -> list[float]:
+    """Expected contour from the text's pitch accents (no TTS)."""
+    return build_target_contour(await _analyzed_words(text))
+
+
+async def _segmented_native(text: str) -> tuple[TimedPitch, list[MoraSegment], list[WordPitch]]:
+    """Native contour with the time span of every mora.
+
+    Audio and word boundaries come from the TTS caches (synthesized with
+    timings on a miss); the analysis gives each word's morae.
+
+    Raises:
+        ValueError: If the text has no morae to score.
+    """
+    native_audio, timings = await run_in_threadpool(get_speech_timings, text)
+    native_pitch, words = await asyncio.gather(get_native_pitch(text, native_audio), _analyzed_words(text))
+    segments = mora_segments(text, words, timings, native_pitch.duration_ms)
+    if not segments:
+        raise ValueError("No Japanese morae to score")
+    return native_pitch, segments, words
+
+
+def _reference_pitch(text: str, mode: CompareMode, tts_key: str | None = None):
+    """Coroutine producing the contour the user is scored against."""
+    return _target_pitch(text) if mode == "target" else _native_pitch(text, tts_key)
+
+
+async def _compare_pipelined(
+    text: str,
+    user_audio: bytes,
+    mode: CompareMode = "tts",
+    tts_key: str | None = None,
+    voices: list[str] | None = None,
+    segments: bool = False,
+) -> tuple[ComparisonResult, TimedPitch]:
+    """Compare user audio against native TTS or a synthetic target.
+
+    User pitch extraction starts immediately, in parallel with building
+    the reference contour (TTS synthesis or cache fetch plus native
+    pitch lookup, or pitch accent analysis); DTW runs once both contours
+    are ready. Latency is max(reference, user), not the sum. A tts_key
+    lets the native branch reuse the cached clip's contour directly.
+
+    With voices, the user contour (extracted once) is scored against
+    every voice's native contour in one batched DTW, and the result is a
+    MultiComparisonResult for the best-matching voice.
+
+    With segments, DTW is restricted to a window around each native
+    mora's expected position and the result is a SegmentedComparisonResult
+    with per-mora and per-word scores and timings.
+
+    Returns:
+        Tuple of (comparison, user TimedPitch - carries the VAD trim offsets).
+
+    Raises:
+        TTSError: If native synthesis fails.
+        ExecutorSaturated / ValueError: From text analysis (target mode).
+        CompareError: If user pitch extraction fails.
+        AudioTaskTimeout / BrokenProcessPool: From the audio pool.
+    """
+    user_task = asyncio.create_task(
+        extract_pitch_in_pool(user_audio, settings.compare_pitch_engine, settings.compare_vad_trim)
+    )
+    if voices:
+        native_task = asyncio.create_task(_voices_pitch(text, voices))
+    elif segments:
+        native_task = asyncio.create_task(_segmented_native(text))
+    else:
+        native_task = asyncio.create_task(_reference_pitch(text, mode, tts_key))
+    try:
+        native_pitch, user_pitch = await asyncio.gather(native_task, user_task)
+    except BaseException:
+        # First failure wins - don't leave the other branch running
+        user_task.cancel()
+        native_task.cancel()
+        raise
+
+    if voices:
+        result = await compare_pitch_multi_in_pool(native_pitch, user_pitch.pitch_values)
+    elif segments:
+        native_timed, mora_spans, words = native_pitch
+        segment_index = voiced_segment_index(native_timed.full_curve, mora_spans, native_timed.time_step_ms)
+        window = segment_window(segment_index, len(user_pitch.pitch_values))
+        result = await compare_pitch_in_pool(native_timed.pitch_values, user_pitch.pitch_values, window)
+        result = score_segments(
+            result,
+            segment_index,
+            mora_spans,
+            words,
+            user_pitch.full_curve,
+            user_pitch.trim_start_ms,
+            user_pitch.time_step_ms,
+        )
+    else:
+        result = await compare_pitch_in_pool(native_pitch, user_pitch.pitch_values)
+    return result, user_pitch
+
+
+async def _run_compare(
+    text: str,
+    user_audio: bytes,
+    context: str,
+    mode: CompareMode = "tts",
+    tts_key: str | None = None,
+    voices: list[str] | None = None,
+    segments: bool = False,
+) -> tuple[ComparisonResult, TimedPitch]:
+    """Run the pipelined compare, mapping failures to HTTP errors."""
+    try:
+        return await _compare_pipelined(text, user_audio, mode, tts_key, voices, segments)
+    except TTSError as e:
+        logger.error(f"TTS failed for {context}: {e}")
+        raise HTTPException(status_code=503, detail="Speech synthesis temporarily unavailable")
+    except ExecutorSaturated as e:
+        logger.warning(f"Target analysis rejected ({context}): {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Analysis server busy - please try again",
+            headers={"Retry-After": "1"},
+        )
+    except ValueError as e:
+        # Text too long, or no morae to build a target from
+        raise HTTPException(status_code=400, detail=str(e))
+    except CompareError as e:
+        logger.warning(f"Compare error ({context}): {e}")
+        raise HTTPException(status_code=422, detail="Could not process audio - please try recording again")
+    except AudioTaskTimeout as e:
+        logger.error(f"Compare timeout ({context}): {e}")
+        raise HTTPException(status_code=504, detail="Comparison timed out - please try again")
+    except BrokenProcessPool as e:
+        logger.error(f"Audio pool failed ({context}): {e}")
+        raise HTTPException(status_code=503, detail="Comparison temporarily unavailable")
+    except Exception as e:
+        logger.exception(f"Unexpected comparison error ({context}): {e}")
+        raise HTTPException(status_code=500, detail="Comparison failed - please try again")
+
 
 def _is_valid_audio(data: bytes) -> bool:
     """Check if data has a valid audio file signature."""
@@ -37,10 +304,51 @@ def _is_valid_audio(data: bytes) -> bool:
     return False
 
 
+async def _read_upload(upload: UploadFile) -> bytes:
+    """Read an uploaded recording, rejecting anything that isn't plausible audio."""
+    try:
+        data = await upload.read()
+    except Exception:
+        raise HTTPException(status_code=400, detail="Failed to read audio file")
+
+    if len(data) < 44:
+        raise HTTPException(status_code=400, detail="Audio file too small - upload may have failed")
+    if len(data) > MAX_AUDIO_SIZE:
+        raise HTTPException(status_code=413, detail="Audio file too large")
+    if not _is_valid_audio(data):
+        raise HTTPException(status_code=400, detail="Invalid audio format - expected WAV, WebM, MP4, or OGG")
+    return data
+
+
 class CompareRequest(BaseModel):
     """Request for comparison with base64 audio."""
     text: str  # The Japanese text being practiced
     user_audio_base64: str  # User's recording as base64
+    mode: CompareMode = "tts"  # "target" scores against the accent pattern without TTS
+    # Key of the native clip the user heard (X-TTS-Key); skips re-synthesis
+    tts_key: str | None = Field(default=None, pattern=TTS_KEY_PATTERN)
+    # Score against several voices (keys of AZURE_VOICES) and keep the best
+    voices: list[str] | None = Field(default=None, max_length=len(AZURE_VOICES))
+    segments: bool = False  # Also score each mora and word (tts mode, single voice)
+
+
+class MoraScore(BaseModel):
+    """Score of one native mora, with where it is in each recording (ms)."""
+    mora: str
+    word_index: int
+    start_ms: float
+    end_ms: float
+    score: int | None  # None if the mora has no voiced native frames
+    user_start_ms: float | None
+    user_end_ms: float | None
+
+
+class WordScore(BaseModel):
+    """Score of one word, spanning its morae in the native clip (ms)."""
+    surface: str
+    start_ms: float
+    end_ms: float
+    score: int | None
 
 
 class CompareResponse(BaseModel):
@@ -51,6 +359,35 @@ class CompareResponse(BaseModel):
     user_pitch: list[float]
     aligned_native: list[float]
     aligned_user: list[float]
+    # Leading/trailing non-speech trimmed from the user recording (ms)
+    user_trim_start_ms: int = 0
+    user_trim_end_ms: int = 0
+    # Multi-voice requests: best-matching voice and every voice's score
+    voice: str | None = None
+    voice_scores: dict[str, int] | None = None
+    # Segmented requests: per-mora and per-word scores and timings
+    morae: list[MoraScore] | None = None
+    words: list[WordScore] | None = None
+
+
+def _compare_response(result: ComparisonResult, user_pitch: TimedPitch) -> CompareResponse:
+    """Build the response for a finished comparison."""
+    multi = isinstance(result, MultiComparisonResult)
+    segmented = isinstance(result, SegmentedComparisonResult)
+    return CompareResponse(
+        score=result.score,
+        feedback=get_score_feedback(result.score),
+        native_pitch=result.native_pitch,
+        user_pitch=result.user_pitch,
+        aligned_native=result.aligned_native,
+        aligned_user=result.aligned_user,
+        user_trim_start_ms=user_pitch.trim_start_ms,
+        user_trim_end_ms=user_pitch.trim_end_ms,
+        voice=result.voice if multi else None,
+        voice_scores=result.voice_scores if multi else None,
+        morae=[MoraScore(**vars(mora)) for mora in result.morae] if segmented else None,
+        words=[WordScore(**vars(word)) for word in result.words] if segmented else None,
+    )
 
 
 @router.post("", response_model=CompareResponse)
@@ -60,10 +397,13 @@ async def compare_pronunciation(
 ) -> CompareResponse:
     """Compare user's pronunciation with native TTS.
 
-    1. Generates native audio using TTS
-    2. Extracts pitch from both audios
-    3. Aligns using DTW
-    4. Calculates similarity score
+    1. Generates native audio using TTS (cached pitch contour if available;
+       with tts_key the clip the user already heard is reused; with voices
+       every listed voice), or in target mode builds the expected contour
+       from pitch accent analysis of the text - no TTS call
+    2. Extracts user pitch - concurrently with step 1
+    3. Aligns using DTW (one batched DTW across voices)
+    4. Calculates similarity score (the best voice's, if several)
 
     Args:
         request: Text and user's audio recording.
@@ -93,22 +433,14 @@ async def compare_pronunciation(
     if not _is_valid_audio(user_audio):
         raise HTTPException(status_code=400, detail="Invalid audio format - expected WAV, WebM, MP4, or OGG")
 
-    # 2. Generate native audio via TTS (run in threadpool - blocking I/O)
-    try:
-        native_audio, _ = await run_in_threadpool(synthesize_speech, request.text)
-    except TTSError as e:
-        logger.error(f"TTS failed for compare: {e}")
-        raise HTTPException(status_code=503, detail="Speech synthesis temporarily unavailable")
+    voices = _check_voices(request.voices, request.mode)
+    _check_segments(request.segments, request.mode, voices)
+    _check_tts_key(request.tts_key, request.mode, voices, request.segments)
 
-    # 3. Compare (run in threadpool - CPU-bound)
-    try:
-        result = await run_in_threadpool(compare_audio, native_audio, user_audio)
-    except CompareError as e:
-        logger.warning(f"Compare error (user input issue): {e}")
-        raise HTTPException(status_code=422, detail="Could not process audio - please try recording again")
-    except Exception as e:
-        logger.exception(f"Unexpected comparison error: {e}")
-        raise HTTPException(status_code=500, detail="Comparison failed - please try again")
+    # 2-4. Build the reference and extract user pitch concurrently, then align
+    result, user_pitch = await _run_compare(
+        request.text, user_audio, "compare", request.mode, request.tts_key, voices, request.segments
+    )
 
     # Auto-save score if user is authenticated (BE-5)
     if user:
@@ -124,55 +456,34 @@ async def compare_pronunciation(
         except Exception:
             pass  # Don't fail comparison if history save fails
 
-    return CompareResponse(
-        score=result.score,
-        feedback=get_score_feedback(result.score),
-        native_pitch=result.native_pitch,
-        user_pitch=result.user_pitch,
-        aligned_native=result.aligned_native,
-        aligned_user=result.aligned_user,
-    )
+    return _compare_response(result, user_pitch)
 
 
 @router.post("/upload", response_model=CompareResponse)
 async def compare_with_upload(
     text: str = Form(...),
     user_audio: UploadFile = File(...),
+    mode: CompareMode = Form("tts"),
+    tts_key: str | None = Form(None, pattern=TTS_KEY_PATTERN),
+    voices: list[str] | None = Form(None),
+    segments: bool = Form(False),
     user: TokenData | None = Depends(get_current_user),
 ) -> CompareResponse:
     """Compare using file upload instead of base64.
 
     Alternative endpoint for larger audio files.
     """
-    # 1. Generate native audio via TTS (run in threadpool - blocking I/O)
-    try:
-        native_audio, _ = await run_in_threadpool(synthesize_speech, text)
-    except TTSError as e:
-        logger.error(f"TTS failed for compare upload: {e}")
-        raise HTTPException(status_code=503, detail="Speech synthesis temporarily unavailable")
-
-    # 2. Read and validate uploaded file
-    try:
-        user_audio_bytes = await user_audio.read()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Failed to read audio file")
+    # 1. Read and validate uploaded file
+    user_audio_bytes = await _read_upload(user_audio)
 
-    if len(user_audio_bytes) < 44:
-        raise HTTPException(status_code=400, detail="Audio file too small - upload may have failed")
-    if len(user_audio_bytes) > MAX_AUDIO_SIZE:
-        raise HTTPException(status_code=413, detail="Audio file too large")
-    if not _is_valid_audio(user_audio_bytes):
-        raise HTTPException(status_code=400, detail="Invalid audio format - expected WAV, WebM, MP4, or OGG")
+    voices = _check_voices(voices, mode)
+    _check_segments(segments, mode, voices)
+    _check_tts_key(tts_key, mode, voices, segments)
 
-    # 3. Compare (run in threadpool - CPU-bound)
-    try:
-        result = await run_in_threadpool(compare_audio, native_audio, user_audio_bytes)
-    except CompareError as e:
-        logger.warning(f"Compare error (upload): {e}")
-        raise HTTPException(status_code=422, detail="Could not process audio - please try recording again")
-    except Exception as e:
-        logger.exception(f"Unexpected comparison error (upload): {e}")
-        raise HTTPException(status_code=500, detail="Comparison failed - please try again")
+    # 2. Build the reference and extract user pitch concurrently, then align
+    result, user_pitch = await _run_compare(
+        text, user_audio_bytes, "compare upload", mode, tts_key, voices, segments
+    )
 
     # Auto-save score if user is authenticated (BE-5)
     if user:
@@ -188,11 +499,216 @@ async def compare_with_upload(
         except Exception:
             pass  # Don't fail comparison if history save fails
 
-    return CompareResponse(
-        score=result.score,
-        feedback=get_score_feedback(result.score),
-        native_pitch=result.native_pitch,
-        user_pitch=result.user_pitch,
-        aligned_native=result.aligned_native,
-        aligned_user=result.aligned_user,
+    return _compare_response(result, user_pitch)
+
+
+class CompareBatchItem(BaseModel):
+    """Score for one recording of a batch, in input order."""
+    text: str
+    score: int | None = None
+    feedback: str | None = None
+    error: str | None = None  # Why this recording could not be scored
+
+
+class CompareBatchResponse(BaseModel):
+    """Response for /compare/batch."""
+    results: list[CompareBatchItem]
+
+
+async def _compare_batch_item(
+    text: str,
+    recording: UploadFile,
+    mode: CompareMode,
+    limit: asyncio.Semaphore,
+) -> CompareBatchItem:
+    """Score one recording of a batch; failures become a per-item error."""
+    try:
+        user_audio = await _read_upload(recording)
+        async with limit:
+            result, _ = await _run_compare(text, user_audio, "compare batch", mode)
+    except HTTPException as e:
+        return CompareBatchItem(text=text, error=e.detail)
+    return CompareBatchItem(text=text, score=result.score, feedback=get_score_feedback(result.score))
+
+
+@router.post("/batch", response_model=CompareBatchResponse)
+async def compare_batch(
+    texts: list[str] = Form(...),
+    recordings: list[UploadFile] = File(...),
+    mode: CompareMode = Form("tts"),
+    user: TokenData | None = Depends(get_current_user),
+) -> CompareBatchResponse:
+    """Score a practice session's recordings in one request.
+
+    texts[i] is the text practiced in recordings[i] (repeat both form
+    fields in the same order). Items are compared concurrently - each
+    one pipelined like /compare/upload - spread across the audio pool,
+    and scores are saved to history in a single insert.
+
+    A recording that can't be scored gets an error instead of failing the
+    whole batch.
+
+    Returns:
+        One CompareBatchItem per recording, in input order.
+    """
+    if len(texts) != len(recordings):
+        raise HTTPException(status_code=400, detail="Need exactly one text per recording")
+    if len(recordings) > MAX_BATCH_RECORDINGS:
+        raise HTTPException(status_code=400, detail=f"Too many recordings (max {MAX_BATCH_RECORDINGS})")
+
+    # Keep the pool busy without queueing every item at once - queue time
+    # counts against the per-task timeout and uploads sit in shared memory
+    limit = asyncio.Semaphore(max(1, settings.audio_workers) * 2)
+    results = await asyncio.gather(
+        *(_compare_batch_item(text, recording, mode, limit) for text, recording in zip(texts, recordings))
     )
+
+    # Auto-save scores if user is authenticated (BE-5), one round-trip for the session
+    scored = [item for item in results if item.score is not None]
+    if user and scored:
+        try:
+            supabase = get_supabase_client(user.access_token)
+            supabase.table("comparison_scores").insert(
+                [{"user_id": user.user_id, "text": item.text, "score": item.score} for item in scored]
+            ).execute()
+        except Exception:
+            pass  # Don't fail comparison if history save fails
+
+    return CompareBatchResponse(results=results)
+
+
+async def _send_live_error(websocket: WebSocket, detail: str, code: int) -> None:
+    """Report a live-compare failure and close the socket."""
+    try:
+        await websocket.send_json({"type": "error", "detail": detail})
+        await websocket.close(code=code)
+    except (WebSocketDisconnect, RuntimeError):
+        pass  # Client already gone
+
+
+# Open /compare/live sockets in this worker (only touched on the event loop)
+_live_sessions = 0
+
+
+@router.websocket("/live")
+async def compare_live(websocket: WebSocket) -> None:
+    """Live comparison: stream PCM while speaking, get feedback as you go.
+
+    Protocol (JSON text messages, PCM as binary messages):
+    1. Client sends {"text": "...", "sample_rate": 16000, "mode": "tts"}.
+       The reference contour (native TTS pitch, or the synthetic target
+       with "mode": "target") starts resolving immediately. An optional
+       "tts_key" reuses the cached clip the user just heard.
+    2. Client sends 16-bit little-endian mono PCM chunks while recording.
+       Server replies to each with {"type": "pitch", "frame_index",
+       "pitch" (new 10ms frames in Hz, 0 = unvoiced), "score" (partial
+       open-end DTW score, or null)}. Once native pitch is known it is
+       sent once as {"type": "native", "native_pitch"}.
+    3. Client sends {"type": "end"}. Server replies {"type": "result", ...}
+       with the CompareResponse fields and closes.
+
+    Errors are sent as {"type": "error", "detail"} before closing.
+    User pitch is tracked with YIN (the incremental engine); scores are
+    not saved to history. Beyond settings.live_max_sessions open sockets
+    new ones are refused with close code 1013.
+    """
+    global _live_sessions
+
+    await websocket.accept()
+    if _live_sessions >= settings.live_max_sessions:
+        logger.warning(f"Live compare rejected: {_live_sessions} sessions open")
+        await _send_live_error(websocket, "Too many live sessions - please try again", code=1013)
+        return
+
+    _live_sessions += 1
+    native_task = None
+    try:
+        try:
+            start = await websocket.receive_json()
+            if not isinstance(start, dict):
+                raise ValueError("expected a JSON object")
+            text = str(start["text"]).strip()
+            session = LiveCompareSession(int(start.get("sample_rate", 16000)))
+            mode = start.get("mode", "tts")
+            tts_key = start.get("tts_key")
+            if not text:
+                raise ValueError("text is required")
+            if mode not in ("tts", "target"):
+                raise ValueError(f"unknown mode {mode!r}")
+            if tts_key is not None and not re.fullmatch(TTS_KEY_PATTERN, str(tts_key)):
+                raise ValueError("invalid tts_key")
+            if tts_key is not None and mode != "tts":
+                raise ValueError("tts_key can only be used with mode 'tts'")
+        except (KeyError, TypeError, ValueError, json.JSONDecodeError) as e:
+            await _send_live_error(websocket, f"Invalid start message: {e}", code=1008)
+            return
+
+        native_task = asyncio.create_task(_reference_pitch(text, mode, tts_key))
+
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+            if session.native_pitch is None and native_task.done():
+                session.set_native_pitch(native_task.result())
+                await websocket.send_json({"type": "native", "native_pitch": session.native_pitch})
+
+            if message.get("bytes") is not None:
+                update = await run_in_threadpool(session.push, message["bytes"])
+                await websocket.send_json({
+                    "type": "pitch",
+                    "frame_index": update.frame_index,
+                    "pitch": update.pitch,
+                    "score": update.score,
+                })
+            elif message.get("text") is not None:
+                try:
+                    control = json.loads(message["text"])
+                    if not isinstance(control, dict):
+                        raise ValueError("expected a JSON object")
+                except ValueError as e:  # Includes json.JSONDecodeError
+                    await _send_live_error(websocket, f"Invalid message: {e}", code=1008)
+                    return
+                if control.get("type") == "end":
+                    break
+
+        # Recording stopped - native is usually resolved by now
+        if session.native_pitch is None:
+            session.set_native_pitch(await native_task)
+        _, result = await run_in_threadpool(session.finish)
+
+        response = CompareResponse(
+            score=result.score,
+            feedback=get_score_feedback(result.score),
+            native_pitch=result.native_pitch,
+            user_pitch=result.user_pitch,
+            aligned_native=result.aligned_native,
+            aligned_user=result.aligned_user,
+        )
+        await websocket.send_json({"type": "result", **response.model_dump()})
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        pass
+    except TTSError as e:
+        logger.error(f"TTS failed for live compare: {e}")
+        await _send_live_error(websocket, "Speech synthesis temporarily unavailable", code=1011)
+    except ExecutorSaturated as e:
+        logger.warning(f"Target analysis rejected (live): {e}")
+        await _send_live_error(websocket, "Analysis server busy - please try again", code=1013)
+    except ValueError as e:
+        await _send_live_error(websocket, str(e), code=1008)
+    except CompareError as e:
+        logger.warning(f"Compare error (live): {e}")
+        await _send_live_error(websocket, "Could not process audio - please try recording again", code=1008)
+    except AudioTaskTimeout as e:
+        logger.error(f"Compare timeout (live): {e}")
+        await _send_live_error(websocket, "Comparison timed out - please try again", code=1011)
+    except Exception as e:
+        logger.exception(f"Unexpected live comparison error: {e}")
+        await _send_live_error(websocket, "Comparison failed - please try again", code=1011)
+    finally:
+        _live_sessions -= 1
+        if native_task is not None and not native_task.done():
+            native_task.cancel()
@@ -15,8 +15,10 @@ logger = logging.getLogger(__name__)
 TTS_TIMEOUT_SECONDS = 30
 
 from app.services.tts import (
-    synthesize_speech,
+    synthesize_speech_async,
     synthesize_speech_with_timings,
+    get_native_pitch,
+    tts_cache_key,
     get_available_voices,
     check_azure_health,
     add_emphasis,
@@ -25,7 +27,8 @@ from app.services.tts import (
     DEFAULT_FEMALE,
 )
 from app.services.cache import get_cache_stats, clear_cache, health_check as cache_health_check
-from app.services.audio_compare import extract_pitch_timed, CompareError
+from app.services.audio_compare import CompareError
+from app.services.audio_pool import AudioTaskTimeout
 from app.core.auth import require_admin_key
 
 router = APIRouter(prefix="/tts", tags=["tts"])
@@ -52,12 +55,12 @@ async def text_to_speech(request: TTSRequest) -> Response:
         request: TTS request with text, voice, and rate.
 
     Returns:
-        WAV audio file.
+        WAV audio file. X-TTS-Key carries the clip's content key, which
+        /api/compare accepts as tts_key to skip re-synthesis.
     """
     try:
         audio_data, from_cache = await asyncio.wait_for(
-            run_in_threadpool(
-                synthesize_speech,
+            synthesize_speech_async(
                 text=request.text,
                 voice=request.voice,
                 rate=request.rate,
@@ -74,6 +77,9 @@ async def text_to_speech(request: TTSRequest) -> Response:
                 "Content-Disposition": "inline; filename=speech.wav",
                 "Cache-Control": "public, max-age=86400",
                 "X-Cache": "HIT" if from_cache else "MISS",
+                "X-TTS-Key": tts_cache_key(
+                    request.text, request.voice, request.rate, request.pitch, request.volume
+                ),
             },
         )
     except asyncio.TimeoutError:
@@ -125,6 +131,11 @@ async def cache_stats(_: None = Depends(require_admin_key)) -> dict:
         "hits": stats.hits,
         "misses": stats.misses,
         "hit_rate": f"{stats.hits / total_requests * 100:.1f}%" if total_requests > 0 else "0%",
+        "memory": {
+            "hits": stats.memory_hits,
+            "entries": stats.memory_entries,
+            "size_mb": round(stats.memory_size_bytes / (1024 * 1024), 2),
+        },
         "redis": {
             "hits": stats.redis_hits,
             "connected": stats.redis_connected,
@@ -135,12 +146,17 @@ async def cache_stats(_: None = Depends(require_admin_key)) -> dict:
             "objects": stats.r2_objects,
             "size_mb": stats.r2_size_mb,
         },
+        "pitch": {
+            "hits": stats.pitch_hits,
+            "misses": stats.pitch_misses,
+        },
+        "coalesced": stats.coalesced,
     }
 
 
 @router.delete("/cache")
 async def clear_audio_cache(_: None = Depends(require_admin_key)) -> dict:
-    """Clear Redis cache (R2 is permanent storage)."""
+    """Clear Redis and this worker's memory cache (R2 is permanent storage)."""
     result = clear_cache()
     return {
         "redis_keys_deleted": result["redis_keys"],
@@ -196,8 +212,7 @@ async def didactic_speech(request: DidacticRequest) -> Response:
             has_ssml = True
 
         audio_data, from_cache = await asyncio.wait_for(
-            run_in_threadpool(
-                synthesize_speech,
+            synthesize_speech_async(
                 text=processed_text,
                 voice=request.voice,
                 rate=request.rate,
@@ -215,6 +230,7 @@ async def didactic_speech(request: DidacticRequest) -> Response:
                 "Content-Disposition": "inline; filename=didactic_speech.wav",
                 "Cache-Control": "public, max-age=86400",
                 "X-Cache": "HIT" if from_cache else "MISS",
+                "X-TTS-Key": tts_cache_key(processed_text, request.voice, request.rate),
                 "X-Mode": "didactic",
             },
         )
@@ -236,6 +252,7 @@ class TTSWithPitchResponse(BaseModel):
     voiced_curve: list[float]  # Voiced-only values (for comparison scoring)
     duration_ms: int  # Actual audio duration
     time_step_ms: int = 10  # Time between pitch frames
+    tts_key: str  # Content key of the clip (pass to /api/compare to skip re-synthesis)
 
 
 MAX_TEXT_LENGTH = 500
@@ -263,7 +280,7 @@ async def tts_with_pitch(
     # 1. Generate TTS audio
     try:
         audio_bytes, from_cache = await asyncio.wait_for(
-            run_in_threadpool(synthesize_speech, text, voice, rate),
+            synthesize_speech_async(text, voice, rate),
             timeout=TTS_TIMEOUT_SECONDS,
         )
     except asyncio.TimeoutError:
@@ -273,12 +290,15 @@ async def tts_with_pitch(
         logger.error(f"TTS with pitch error: {e}")
         raise HTTPException(status_code=503, detail="Speech synthesis temporarily unavailable")
 
-    # 2. Extract pitch curve with timing info
+    # 2. Extract pitch curve with timing info (cached next to the audio)
     try:
-        timed_pitch = await run_in_threadpool(extract_pitch_timed, audio_bytes)
+        timed_pitch = await get_native_pitch(text, audio_bytes, voice, rate)
     except CompareError as e:
         logger.warning(f"Pitch extraction error: {e}")
         raise HTTPException(status_code=422, detail="Could not extract pitch data")
+    except AudioTaskTimeout as e:
+        logger.error(f"Pitch extraction timeout: {e}")
+        raise HTTPException(status_code=504, detail="Pitch extraction timed out - please try again")
     except Exception as e:
         logger.exception(f"Unexpected pitch extraction error: {e}")
         raise HTTPException(status_code=500, detail="Pitch extraction failed - please try again")
@@ -291,6 +311,7 @@ async def tts_with_pitch(
         pitch_curve=timed_pitch.full_curve,  # Full timeline for visualization
         voiced_curve=timed_pitch.pitch_values,  # Voiced-only for scoring
         duration_ms=timed_pitch.duration_ms,  # Actual audio duration
+        tts_key=tts_cache_key(text, voice, rate),
     )
 
 
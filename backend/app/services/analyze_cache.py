@@ -0,0 +1,219 @@
+"""Analysis result cache - in-process LRU (+ optional Redis).
+
+Learners re-analyze the same deck sentences and example phrases, so full
+/analyze responses are cached as serialized JSON, keyed by the normalized
+text plus a dictionary version (pitch.db content hash + app version).
+Replacing pitch.db or deploying new analysis rules invalidates every entry.
+
+Cache flow:
+- READ:  memory LRU → Redis (if enabled, promotes to memory) → Miss
+- WRITE: memory LRU + Redis (if enabled)
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+import redis
+
+from app.core.config import settings
+from app.models.schemas import AnalyzeResponse
+from app.services import cache as tts_cache
+from app.services.pitch.lookup import DB_PATH
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached payload shape changes
+CACHE_SCHEMA_VERSION = 1
+
+
+@dataclass
+class AnalyzeCacheStats:
+    """Analysis cache statistics."""
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    redis_hits: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+    max_bytes: int = 0
+
+
+# LRU of cache key → serialized AnalyzeResponse (guarded by _lock)
+_entries: "OrderedDict[str, bytes]" = OrderedDict()
+_size_bytes = 0
+_stats = AnalyzeCacheStats()
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def dictionary_version() -> str:
+    """Content hash of pitch.db ("none" if missing), computed once."""
+    if not DB_PATH.exists():
+        return "none"
+    digest = hashlib.sha256()
+    with open(DB_PATH, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text the same way the analyze router does before analysis."""
+    return text.strip()
+
+
+def _get_cache_key(text: str) -> str:
+    """Generate cache key from normalized text and dictionary version."""
+    content = f"{CACHE_SCHEMA_VERSION}|{settings.app_version}|{dictionary_version()}|{normalize_text(text)}"
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
+def _redis_key(cache_key: str) -> str:
+    """Redis key format."""
+    return f"analyze:{cache_key}"
+
+
+def _max_bytes() -> int:
+    return settings.analyze_cache_max_mb * 1024 * 1024
+
+
+def _memory_get(cache_key: str) -> Optional[bytes]:
+    with _lock:
+        payload = _entries.get(cache_key)
+        if payload is not None:
+            _entries.move_to_end(cache_key)
+        return payload
+
+
+def _memory_put(cache_key: str, payload: bytes) -> None:
+    """Insert into the LRU, evicting least recently used entries past the byte budget."""
+    global _size_bytes
+
+    max_bytes = _max_bytes()
+    if len(payload) > max_bytes:
+        return
+
+    with _lock:
+        old = _entries.pop(cache_key, None)
+        if old is not None:
+            _size_bytes -= len(old)
+        _entries[cache_key] = payload
+        _size_bytes += len(payload)
+
+        while _size_bytes > max_bytes:
+            _, evicted = _entries.popitem(last=False)
+            _size_bytes -= len(evicted)
+
+
+def _redis_get(cache_key: str) -> Optional[bytes]:
+    redis_client = tts_cache._get_redis_client()
+    if not redis_client:
+        return None
+    try:
+        return redis_client.get(_redis_key(cache_key))
+    except redis.RedisError as e:
+        logger.warning(f"Redis get failed (analyze cache): {e}")
+        return None
+
+
+def _redis_set(cache_key: str, payload: bytes) -> None:
+    redis_client = tts_cache._get_redis_client()
+    if not redis_client:
+        return
+    try:
+        redis_client.setex(_redis_key(cache_key), settings.redis_ttl_seconds, payload)
+    except redis.RedisError as e:
+        logger.warning(f"Redis set failed (analyze cache): {e}")
+
+
+async def get_cached_analysis(text: str) -> Optional[AnalyzeResponse]:
+    """Get a cached analysis (memory → Redis → None).
+
+    Args:
+        text: Text as received (normalized internally).
+
+    Returns:
+        AnalyzeResponse (with the normalized text) if cached, None otherwise.
+    """
+    if not settings.analyze_cache_enabled:
+        return None
+
+    cache_key = _get_cache_key(text)
+
+    # 1. In-process LRU
+    payload = _memory_get(cache_key)
+    if payload is not None:
+        with _lock:
+            _stats.hits += 1
+            _stats.memory_hits += 1
+        return AnalyzeResponse.model_validate_json(payload)
+
+    # 2. Redis (shared across workers)
+    if settings.analyze_cache_redis:
+        payload = await asyncio.to_thread(_redis_get, cache_key)
+        if payload:
+            with _lock:
+                _stats.hits += 1
+                _stats.redis_hits += 1
+            _memory_put(cache_key, payload)
+            return AnalyzeResponse.model_validate_json(payload)
+
+    # 3. Cache miss
+    with _lock:
+        _stats.misses += 1
+    return None
+
+
+async def save_analysis(text: str, response: AnalyzeResponse) -> None:
+    """Save an analysis result to the cache (memory + Redis).
+
+    Args:
+        text: Text as received (normalized internally).
+        response: Analysis result to cache.
+    """
+    if not settings.analyze_cache_enabled:
+        return
+
+    cache_key = _get_cache_key(text)
+    payload = response.model_copy(update={"text": normalize_text(text)}).model_dump_json().encode()
+
+    _memory_put(cache_key, payload)
+
+    if settings.analyze_cache_redis:
+        await asyncio.to_thread(_redis_set, cache_key, payload)
+
+
+def get_analyze_cache_stats() -> AnalyzeCacheStats:
+    """Get analysis cache statistics."""
+    with _lock:
+        return AnalyzeCacheStats(
+            hits=_stats.hits,
+            misses=_stats.misses,
+            memory_hits=_stats.memory_hits,
+            redis_hits=_stats.redis_hits,
+            entries=len(_entries),
+            size_bytes=_size_bytes,
+            max_bytes=_max_bytes(),
+        )
+
+
+def clear_analyze_cache() -> dict:
+    """Clear the in-process cache and reset stats (Redis entries expire by TTL).
+
+    Returns:
+        Dict with count of cleared entries.
+    """
+    global _size_bytes, _stats
+
+    with _lock:
+        cleared = len(_entries)
+        _entries.clear()
+        _size_bytes = 0
+        _stats = AnalyzeCacheStats()
+    return {"memory_entries": cleared}
@@ -0,0 +1,147 @@
+"""Bounded executor for CPU-bound analysis in the API process.
+
+Runs tokenization and lookups for /analyze on a dedicated thread pool so
+a long sentence doesn't stall the event loop (and every concurrent TTS or
+compare request with it). Work beyond the worker + queue capacity is
+rejected immediately instead of letting latency grow without bound.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorSaturated(Exception):
+    """Raised when the executor's queue is full."""
+    pass
+
+
+@dataclass
+class TaskTiming:
+    """Per-task latency breakdown."""
+    queue_ms: float  # Time waiting for a free worker
+    run_ms: float  # Time spent running
+
+
+@dataclass
+class ExecutorStats:
+    """Executor counters."""
+    workers: int = 0
+    max_queue: int = 0
+    in_flight: int = 0  # Running + queued
+    completed: int = 0
+    rejected: int = 0
+
+
+class BoundedExecutor:
+    """Thread pool with a cap on queued tasks and per-task timing."""
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> tuple[Any, TaskTiming]:
+        """Run fn(*args) on the pool.
+
+        Returns:
+            Tuple of (fn result, TaskTiming).
+
+        Raises:
+            ExecutorSaturated: If workers and queue are all taken.
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturated(f"{self.name} executor saturated ({self._in_flight} in flight)")
+            self._in_flight += 1
+
+        submitted = time.perf_counter()
+        started = finished = submitted
+
+        def timed() -> Any:
+            nonlocal started, finished
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                finished = time.perf_counter()
+
+        # Release the slot when the task really finishes, even if the
+        # awaiting request was cancelled in the meantime
+        def release(_future) -> None:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+
+        future = self._executor.submit(timed)
+        future.add_done_callback(release)
+        result = await asyncio.wrap_future(future)
+
+        timing = TaskTiming(
+            queue_ms=(started - submitted) * 1000,
+            run_ms=(finished - started) * 1000,
+        )
+        return result, timing
+
+    def stats(self) -> ExecutorStats:
+        """Get a snapshot of the executor counters."""
+        with self._lock:
+            return ExecutorStats(
+                workers=self.max_workers,
+                max_queue=self.max_queue,
+                in_flight=self._in_flight,
+                completed=self._completed,
+                rejected=self._rejected,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Shared analysis executor (lazy initialization)
+_executor: Optional[BoundedExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_analyze_executor() -> BoundedExecutor:
+    """Get the shared analysis executor."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = BoundedExecutor(
+                "analyze",
+                max_workers=settings.analyze_threads,
+                max_queue=settings.analyze_queue_size,
+            )
+        return _executor
+
+
+def get_analyze_executor_stats() -> Optional[ExecutorStats]:
+    """Counters of the shared executor, or None if it hasn't started."""
+    with _executor_lock:
+        return _executor.stats() if _executor is not None else None
+
+
+def shutdown_analyze_executor() -> None:
+    """Stop the shared analysis executor (called on app shutdown)."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
@@ -0,0 +1,162 @@
+"""Process pool for batch pitch analysis.
+
+SudachiPy tokenization and lookups are CPU-bound and hold the GIL, so
+large batches (deck imports, subtitle files) are fanned out across worker
+processes. Each worker loads its own tokenizer and lexicon once at startup.
+Only settings.analyze_batch_concurrency batches run at once; further
+batches are rejected rather than queued behind them.
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from app.core.config import settings
+from app.models.schemas import WordPitch
+from app.services.analyze_executor import ExecutorSaturated
+from app.services.pitch import analyze_text, get_tokenizer
+from app.services.pitch.analyzer import MAX_TEXT_LENGTH
+from app.services.pitch.lookup import get_lexicon
+
+logger = logging.getLogger(__name__)
+
+# Chunks per worker - small enough to balance uneven texts, large enough
+# to amortize pickling overhead
+CHUNKS_PER_WORKER = 4
+
+# Process pool (lazy initialization)
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# Batches currently running
+_active_batches = 0
+_active_lock = threading.Lock()
+
+
+def _init_worker() -> None:
+    """Warm per-process tokenizer and lexicon before the first task."""
+    get_tokenizer()
+    try:
+        get_lexicon()
+    except FileNotFoundError:
+        pass
+
+
+def _analyze_chunk(texts: list[str]) -> list[list[WordPitch]]:
+    """Analyze a chunk of texts inside a worker process."""
+    return [analyze_text(text) for text in texts]
+
+
+def create_analyze_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Create a process pool of pre-warmed analysis workers.
+
+    Uses spawn so workers never inherit the parent's SQLite connection or
+    uvicorn threads.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+
+
+def get_analyze_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the shared analysis pool, or None if workers are disabled."""
+    global _pool
+
+    if settings.analyze_workers <= 0:
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = create_analyze_pool(settings.analyze_workers)
+            logger.info(f"Analyze pool started ({settings.analyze_workers} workers)")
+        return _pool
+
+
+def shutdown_analyze_pool(wait: bool = True) -> None:
+    """Stop the shared analysis pool (called on app shutdown)."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait, cancel_futures=True)
+            _pool = None
+
+
+def _chunk(texts: list[str], workers: int) -> list[list[str]]:
+    """Split texts into contiguous chunks, preserving input order."""
+    size = max(1, math.ceil(len(texts) / (workers * CHUNKS_PER_WORKER)))
+    return [texts[i:i + size] for i in range(0, len(texts), size)]
+
+
+async def analyze_batch(
+    texts: list[str],
+    pool: Optional[Executor] = None,
+    workers: Optional[int] = None,
+) -> list[list[WordPitch]]:
+    """Analyze many texts in parallel, returning results in input order.
+
+    Args:
+        texts: Texts to analyze (max MAX_TEXT_LENGTH chars each).
+        pool: Executor to run on (defaults to the shared analysis pool;
+            without one, analysis runs in the default thread pool).
+        workers: Worker count of `pool`, used to size chunks
+            (defaults to settings.analyze_workers).
+
+    Returns:
+        One list of WordPitch per input text.
+
+    Raises:
+        ValueError: If a text exceeds the maximum length.
+        ExecutorSaturated: If analyze_batch_concurrency batches are
+            already running.
+    """
+    global _active_batches
+
+    if not texts:
+        return []
+
+    # Reject before any chunk is scheduled rather than failing mid-batch
+    for text in texts:
+        if len(text) > MAX_TEXT_LENGTH:
+            raise ValueError(f"Text exceeds maximum length of {MAX_TEXT_LENGTH} characters")
+
+    with _active_lock:
+        if _active_batches >= settings.analyze_batch_concurrency:
+            raise ExecutorSaturated(f"{_active_batches} analysis batches already running")
+        _active_batches += 1
+    try:
+        return await _run_batch(texts, pool, workers)
+    finally:
+        with _active_lock:
+            _active_batches -= 1
+
+
+async def _run_batch(
+    texts: list[str],
+    pool: Optional[Executor],
+    workers: Optional[int],
+) -> list[list[WordPitch]]:
+    if pool is None:
+        pool = get_analyze_pool()
+    if workers is None:
+        workers = max(1, settings.analyze_workers)
+
+    loop = asyncio.get_running_loop()
+    chunks = _chunk(texts, workers)
+    try:
+        chunk_results = await asyncio.gather(
+            *(loop.run_in_executor(pool, _analyze_chunk, chunk) for chunk in chunks)
+        )
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM kill) - drop the pool so the next batch gets a fresh one
+        if pool is _pool:
+            shutdown_analyze_pool(wait=False)
+        raise
+    return [words for chunk in chunk_results for words in chunk]
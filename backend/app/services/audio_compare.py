@@ -3,15 +3,20 @@
 import io
 import logging
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
 import parselmouth
-from fastdtw import fastdtw
-from scipy.spatial.distance import euclidean
 from scipy.stats import zscore
 
+from app.core.config import settings
+from app.services.dtw import dtw, dtw_batch
+from app.services.wav import decode_wav, WavFormatError
+from app.services.vad import speech_bounds
+from app.services.yin import yin_pitch
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +32,13 @@ class ComparisonResult:
     alignment_path: list[tuple[int, int]]  # DTW path
 
 
+@dataclass
+class MultiComparisonResult(ComparisonResult):
+    """Comparison against the best-matching of several native voices."""
+    voice: str = ""  # Voice key the detail fields were aligned against
+    voice_scores: dict[str, int] = field(default_factory=dict)  # Score per voice, in request order
+
+
 class CompareError(Exception):
     """Audio comparison error."""
     pass
@@ -39,6 +51,8 @@ class TimedPitch:
     full_curve: list[float]  # All frames (0 for unvoiced)
     duration_ms: int  # Actual audio duration in ms
     time_step_ms: int = 10  # Time between frames
+    trim_start_ms: int = 0  # Leading non-speech cut before tracking (full_curve starts here)
+    trim_end_ms: int = 0  # Trailing non-speech cut (full_curve ends at duration_ms - trim_end_ms)
 
 
 def extract_pitch(audio_data: bytes) -> np.ndarray:
@@ -58,8 +72,86 @@ MIN_AUDIO_SIZE = 100  # Minimum bytes for valid WAV header
 MAX_AUDIO_SIZE = 5 * 1024 * 1024  # 5MB max to prevent memory issues
 MIN_VOICED_FRAMES = 5  # Minimum voiced frames for meaningful analysis
 
+# Pitch analysis settings ideal for human voice (shared by both engines)
+PITCH_TIME_STEP = 0.01  # 10ms frames
+PITCH_FLOOR = 75  # Min Hz (bass voice)
+PITCH_CEILING = 600  # Max Hz (high voice)
+PITCH_ENGINES = ("praat", "yin")
+
+
+def _load_sound_from_file(audio_data: bytes) -> parselmouth.Sound:
+    """Load audio via a temp file (encodings decode_wav doesn't handle)."""
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            f.write(audio_data)
+            temp_path = f.name
+        return parselmouth.Sound(temp_path)
+    finally:
+        if temp_path:
+            try:
+                Path(temp_path).unlink(missing_ok=True)
+            except Exception as e:
+                logger.warning(f"Failed to clean up temp file {temp_path}: {e}")
+
+
+def load_sound(audio_data: bytes) -> parselmouth.Sound:
+    """Build a Parselmouth Sound from WAV bytes.
+
+    PCM and float WAVs are decoded in memory (no disk I/O); anything else
+    (e.g. mu-law) falls back to Praat's own file reader.
 
-def extract_pitch_timed(audio_data: bytes) -> TimedPitch:
+    Raises:
+        CompareError: If the audio cannot be loaded.
+    """
+    try:
+        wav = decode_wav(audio_data)
+        return parselmouth.Sound(wav.samples, sampling_frequency=wav.sample_rate)
+    except WavFormatError as e:
+        logger.debug(f"In-memory WAV decode failed ({e}), falling back to file")
+
+    try:
+        return _load_sound_from_file(audio_data)
+    except Exception as e:
+        logger.warning(f"Parselmouth failed to load audio: {e}")
+        raise CompareError("Could not load audio file - may be corrupted")
+
+
+def _track_pitch(snd: parselmouth.Sound, engine: str) -> np.ndarray:
+    """Per-frame pitch (Hz, 0 = unvoiced) using the selected engine."""
+    if engine == "yin":
+        return yin_pitch(
+            snd.values,
+            snd.sampling_frequency,
+            time_step=PITCH_TIME_STEP,
+            pitch_floor=PITCH_FLOOR,
+            pitch_ceiling=PITCH_CEILING,
+            target_rate=settings.yin_sample_rate,
+        )
+
+    pitch = snd.to_pitch(
+        time_step=PITCH_TIME_STEP,
+        pitch_floor=PITCH_FLOOR,
+        pitch_ceiling=PITCH_CEILING,
+    )
+    return pitch.selected_array['frequency'].astype(float)
+
+
+def _trim_silence(snd: parselmouth.Sound) -> tuple[parselmouth.Sound, int, int]:
+    """Cut leading/trailing non-speech (VAD) from a sound.
+
+    Returns:
+        Tuple of (trimmed sound, samples cut at the start, samples cut at the end).
+    """
+    samples = snd.values
+    start, end = speech_bounds(samples.mean(axis=0), int(snd.sampling_frequency))
+    if start == 0 and end == samples.shape[1]:
+        return snd, 0, 0
+    trimmed = parselmouth.Sound(samples[:, start:end], sampling_frequency=snd.sampling_frequency)
+    return trimmed, start, samples.shape[1] - end
+
+
+def extract_pitch_timed(audio_data: bytes, engine: str = "praat", trim_silence: bool = False) -> TimedPitch:
     """Extract pitch curve with timing information.
 
     Unlike extract_pitch(), this preserves the full timeline
@@ -68,13 +160,23 @@ def extract_pitch_timed(audio_data: bytes) -> TimedPitch:
 
     Args:
         audio_data: WAV audio bytes.
+        engine: Pitch tracker - "praat" (Parselmouth autocorrelation) or
+            "yin" (NumPy YIN, see app.services.yin). Both produce the
+            same 10ms frame layout.
+        trim_silence: Cut leading/trailing silence and noise (VAD) before
+            tracking. full_curve then covers only the speech region,
+            located by trim_start_ms / trim_end_ms.
 
     Returns:
         TimedPitch with both voiced-only and full curve data.
 
     Raises:
         CompareError: If audio is invalid, too short, or no voice detected.
+        ValueError: If engine is unknown.
     """
+    if engine not in PITCH_ENGINES:
+        raise ValueError(f"Unknown pitch engine: {engine}")
+
     # Guard: Empty or too small
     if not audio_data or len(audio_data) < MIN_AUDIO_SIZE:
         raise CompareError("Audio data is empty or too small")
@@ -87,68 +189,49 @@ def extract_pitch_timed(audio_data: bytes) -> TimedPitch:
     if audio_data[:4] != b'RIFF' or audio_data[8:12] != b'WAVE':
         raise CompareError("Invalid audio format - expected WAV file")
 
-    temp_path = None
-    try:
-        # Save to temp file (Parselmouth needs file path)
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(audio_data)
-            temp_path = f.name
-
-        try:
-            snd = parselmouth.Sound(temp_path)
-        except Exception as e:
-            logger.warning(f"Parselmouth failed to load audio: {e}")
-            raise CompareError("Could not load audio file - may be corrupted")
+    snd = load_sound(audio_data)
 
-        # Get actual audio duration
-        duration_ms = int(snd.duration * 1000)
+    # Get actual audio duration
+    duration_ms = int(snd.duration * 1000)
 
-        # Guard: Audio too short for meaningful analysis
-        if duration_ms < 100:  # Less than 100ms
-            raise CompareError("Audio too short - need at least 100ms")
-
-        # Extract pitch with settings ideal for human voice
-        pitch = snd.to_pitch(
-            time_step=0.01,  # 10ms frames
-            pitch_floor=75,  # Min Hz (bass voice)
-            pitch_ceiling=600,  # Max Hz (high voice)
-        )
+    # Guard: Audio too short for meaningful analysis
+    if duration_ms < 100:  # Less than 100ms
+        raise CompareError("Audio too short - need at least 100ms")
 
-        pitch_values = pitch.selected_array['frequency']
-        pitch_values = pitch_values.astype(float)
+    trim_start_ms = trim_end_ms = 0
+    if trim_silence:
+        snd, cut_start, cut_end = _trim_silence(snd)
+        trim_start_ms = int(cut_start * 1000 / snd.sampling_frequency)
+        trim_end_ms = int(cut_end * 1000 / snd.sampling_frequency)
 
-        # Guard: No pitch data extracted
-        if len(pitch_values) == 0:
-            raise CompareError("Could not extract pitch data from audio")
+    pitch_values = _track_pitch(snd, engine)
 
-        # Full curve with zeros for unvoiced (for timeline sync)
-        full_curve = pitch_values.tolist()
+    # Guard: No pitch data extracted
+    if len(pitch_values) == 0:
+        raise CompareError("Could not extract pitch data from audio")
 
-        # Replace unvoiced (0) with NaN for voiced-only extraction
-        pitch_with_nan = pitch_values.copy()
-        pitch_with_nan[pitch_with_nan == 0] = np.nan
+    # Full curve with zeros for unvoiced (for timeline sync)
+    full_curve = pitch_values.tolist()
 
-        # Remove NaN values (keep only voiced segments)
-        voiced_values = pitch_with_nan[~np.isnan(pitch_with_nan)]
+    # Replace unvoiced (0) with NaN for voiced-only extraction
+    pitch_with_nan = pitch_values.copy()
+    pitch_with_nan[pitch_with_nan == 0] = np.nan
 
-        if len(voiced_values) < MIN_VOICED_FRAMES:
-            raise CompareError(
-                f"Audio too short or no voice detected (need at least {MIN_VOICED_FRAMES} voiced frames)"
-            )
+    # Remove NaN values (keep only voiced segments)
+    voiced_values = pitch_with_nan[~np.isnan(pitch_with_nan)]
 
-        return TimedPitch(
-            pitch_values=voiced_values.tolist(),
-            full_curve=full_curve,
-            duration_ms=duration_ms,
+    if len(voiced_values) < MIN_VOICED_FRAMES:
+        raise CompareError(
+            f"Audio too short or no voice detected (need at least {MIN_VOICED_FRAMES} voiced frames)"
         )
 
-    finally:
-        # Clean up temp file
-        if temp_path:
-            try:
-                Path(temp_path).unlink(missing_ok=True)
-            except Exception as e:
-                logger.warning(f"Failed to clean up temp file {temp_path}: {e}")
+    return TimedPitch(
+        pitch_values=voiced_values.tolist(),
+        full_curve=full_curve,
+        duration_ms=duration_ms,
+        trim_start_ms=trim_start_ms,
+        trim_end_ms=trim_end_ms,
+    )
 
 
 def normalize_pitch(pitch_values: np.ndarray) -> np.ndarray:
@@ -175,7 +258,11 @@ def normalize_pitch(pitch_values: np.ndarray) -> np.ndarray:
     return normalized
 
 
-def compare_audio(native_audio: bytes, user_audio: bytes) -> ComparisonResult:
+def compare_audio(
+    native_audio: bytes,
+    user_audio: bytes,
+    native_pitch: Optional[list[float]] = None,
+) -> ComparisonResult:
     """Compare user's pronunciation with native audio.
 
     Uses DTW (Dynamic Time Warping) to align the pitch curves
@@ -184,43 +271,70 @@ def compare_audio(native_audio: bytes, user_audio: bytes) -> ComparisonResult:
     Args:
         native_audio: Native speaker WAV audio bytes.
         user_audio: User's WAV audio bytes.
+        native_pitch: Voiced pitch values (Hz) already extracted from
+            native_audio (e.g. from cache) - skips native extraction.
 
     Returns:
         ComparisonResult with score and alignment data.
     """
     # 1. Extract pitch from both audios
     try:
-        pitch_native = extract_pitch(native_audio)
+        if native_pitch is not None:
+            pitch_native = np.asarray(native_pitch, dtype=float)
+        else:
+            pitch_native = extract_pitch(native_audio)
         pitch_user = extract_pitch(user_audio)
     except Exception as e:
         logger.exception(f"Pitch extraction failed: {e}")
         raise CompareError("Could not analyze audio - please ensure clear recording")
 
+    return compare_pitch(pitch_native, pitch_user)
+
+
+def compare_pitch(
+    pitch_native,
+    pitch_user,
+    open_end: bool = False,
+    window=None,
+    band: Optional[int] = None,
+) -> ComparisonResult:
+    """Score a user pitch contour against a native one.
+
+    Args:
+        pitch_native: Native voiced pitch values (Hz).
+        pitch_user: User voiced pitch values (Hz).
+        open_end: Score a partial recording - align the user contour to
+            the best-matching prefix of the native one (exact DTW).
+        window: Per-native-frame (lo, hi) user frame bounds restricting
+            the DTW (see dtw()); overrides settings.dtw_band.
+        band: Sakoe-Chiba radius; None uses settings.dtw_band (0 = exact).
+
+    Returns:
+        ComparisonResult with score and alignment data.
+    """
+    pitch_native = np.asarray(pitch_native, dtype=float)
+    pitch_user = np.asarray(pitch_user, dtype=float)
+
     # 2. Normalize using Z-Score (compare shape, not absolute Hz)
     norm_native = normalize_pitch(pitch_native)
     norm_user = normalize_pitch(pitch_user)
 
-    # 3. DTW alignment - reshape for fastdtw
-    native_seq = norm_native.reshape(-1, 1)
-    user_seq = norm_user.reshape(-1, 1)
-
-    # Calculate DTW distance and path
-    distance, path = fastdtw(native_seq, user_seq, dist=euclidean)
+    # 3. DTW alignment (exact, or banded if the band is > 0)
+    if open_end:
+        distance, path = dtw(norm_native, norm_user, open_end=True)
+    elif window is not None:
+        distance, path = dtw(norm_native, norm_user, window=window)
+    else:
+        distance, path = dtw(norm_native, norm_user, band=settings.dtw_band if band is None else band)
 
     # 4. Create aligned sequences based on DTW path
-    aligned_native = [norm_native[i] for i, j in path]
-    aligned_user = [norm_user[j] for i, j in path]
+    native_idx, user_idx = np.array(path).T
+    aligned_native = norm_native[native_idx].tolist()
+    aligned_user = norm_user[user_idx].tolist()
 
     # 5. Calculate score (0-100)
-    # Normalize distance by path length
-    avg_distance = distance / len(path)
-
-    # Convert to score (lower distance = higher score)
-    # Typical distances range from 0 to ~3 for z-scored data
-    score = max(0, min(100, int(100 - avg_distance * 30)))
-
     return ComparisonResult(
-        score=score,
+        score=path_score(distance, len(path)),
         distance=distance,
         native_pitch=norm_native.tolist(),
         user_pitch=norm_user.tolist(),
@@ -230,6 +344,47 @@ def compare_audio(native_audio: bytes, user_audio: bytes) -> ComparisonResult:
     )
 
 
+def compare_pitch_multi(native_pitches: dict[str, list[float]], pitch_user) -> MultiComparisonResult:
+    """Score one user contour against several native voices.
+
+    The user contour is normalized once and every voice is scored with a
+    single batched DTW (distances only); the alignment detail is computed
+    for the best voice alone. Both passes use exact DTW (settings.dtw_band
+    is not applied), so the reported score is the one the voice was
+    ranked by.
+
+    Args:
+        native_pitches: Voiced native pitch values (Hz) per voice key.
+        pitch_user: User voiced pitch values (Hz).
+
+    Returns:
+        MultiComparisonResult for the best voice (first requested on ties),
+        with every voice's score.
+    """
+    norm_user = normalize_pitch(np.asarray(pitch_user, dtype=float))
+    norm_natives = [normalize_pitch(np.asarray(p, dtype=float)) for p in native_pitches.values()]
+    distances, path_lengths = dtw_batch(norm_natives, norm_user)
+
+    voice_scores = {
+        voice: path_score(distance, path_length)
+        for voice, distance, path_length in zip(native_pitches, distances, path_lengths)
+    }
+    best_voice = max(voice_scores, key=voice_scores.get)
+
+    best = compare_pitch(native_pitches[best_voice], pitch_user, band=0)
+    return MultiComparisonResult(**vars(best), voice=best_voice, voice_scores=voice_scores)
+
+
+def path_score(distance: float, path_length: int) -> int:
+    """Convert a DTW distance to a 0-100 score.
+
+    Normalizes by path length; typical averages range from 0 to ~3 for
+    z-scored data (lower distance = higher score).
+    """
+    avg_distance = distance / path_length
+    return max(0, min(100, int(100 - avg_distance * 30)))
+
+
 def get_score_feedback(score: int) -> str:
     """Get feedback message based on score."""
     if score >= 90:
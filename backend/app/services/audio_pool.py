@@ -0,0 +1,186 @@
+"""Process pool for CPU-bound audio analysis.
+
+Praat pitch extraction and DTW hold the GIL, so running them in the
+threadpool serializes concurrent compares on one uvicorn worker. This
+pool runs extract_pitch_timed, compare_pitch and compare_pitch_multi
+in worker processes.
+
+Audio is handed over through multiprocessing.shared_memory: the parent
+copies the WAV bytes into a named segment and only its name and size
+are pickled, instead of pushing megabytes through the pool's pipe.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Iterator, Optional, TypeVar
+
+from app.core.config import settings
+from app.services.audio_compare import (
+    compare_pitch,
+    compare_pitch_multi,
+    extract_pitch_timed,
+    ComparisonResult,
+    MultiComparisonResult,
+    TimedPitch,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# (segment name, payload size) - what actually crosses the process boundary
+SharedAudio = tuple[str, int]
+
+
+class AudioTaskTimeout(Exception):
+    """Raised when an audio task exceeds settings.audio_task_timeout_seconds."""
+    pass
+
+
+# Process pool (lazy initialization)
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _read_shared(handle: SharedAudio) -> bytes:
+    """Copy audio out of a shared memory segment (worker side)."""
+    name, size = handle
+    shm = SharedMemory(name=name)
+    try:
+        return bytes(shm.buf[:size])
+    finally:
+        shm.close()
+
+
+def _extract_task(handle: SharedAudio, engine: str, trim_silence: bool) -> TimedPitch:
+    return extract_pitch_timed(_read_shared(handle), engine, trim_silence)
+
+
+@contextmanager
+def _shared_audio(audio_data: bytes) -> Iterator[SharedAudio]:
+    """Place audio in a shared memory segment for the duration of a task."""
+    shm = SharedMemory(create=True, size=max(len(audio_data), 1))
+    try:
+        shm.buf[:len(audio_data)] = audio_data
+        yield shm.name, len(audio_data)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def create_audio_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Create a process pool for audio analysis (spawned, like the analyze pool)."""
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def get_audio_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the shared audio pool, or None if workers are disabled."""
+    global _pool
+
+    if settings.audio_workers <= 0:
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = create_audio_pool(settings.audio_workers)
+            logger.info(f"Audio pool started ({settings.audio_workers} workers)")
+        return _pool
+
+
+def shutdown_audio_pool(wait: bool = True) -> None:
+    """Stop the shared audio pool (called on app shutdown)."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait, cancel_futures=True)
+            _pool = None
+
+
+async def _run(pool: ProcessPoolExecutor, fn: Callable[..., T], *args) -> T:
+    """Run a task on the pool with the configured timeout."""
+    future = pool.submit(fn, *args)
+    try:
+        return await asyncio.wait_for(
+            asyncio.wrap_future(future), timeout=settings.audio_task_timeout_seconds
+        )
+    except asyncio.TimeoutError:
+        future.cancel()  # Only effective if the task hasn't started yet
+        raise AudioTaskTimeout(f"Audio task timed out after {settings.audio_task_timeout_seconds}s")
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM kill) - drop the pool so the next task gets a fresh one
+        if pool is _pool:
+            shutdown_audio_pool(wait=False)
+        raise
+
+
+async def extract_pitch_in_pool(
+    audio_data: bytes,
+    engine: str = "praat",
+    trim_silence: bool = False,
+) -> TimedPitch:
+    """Run extract_pitch_timed in the audio pool (or threadpool if disabled).
+
+    Args:
+        audio_data: WAV audio bytes.
+        engine: Pitch tracker ("praat" or "yin").
+        trim_silence: Trim leading/trailing non-speech before tracking.
+
+    Raises:
+        CompareError: If audio is invalid, too short, or no voice detected.
+        AudioTaskTimeout: If extraction exceeds the task timeout.
+        BrokenProcessPool: If a worker process died.
+    """
+    pool = get_audio_pool()
+    if pool is None:
+        return await asyncio.to_thread(extract_pitch_timed, audio_data, engine, trim_silence)
+
+    with _shared_audio(audio_data) as handle:
+        return await _run(pool, _extract_task, handle, engine, trim_silence)
+
+
+async def compare_pitch_in_pool(
+    native_pitch: list[float],
+    user_pitch: list[float],
+    window: Optional[tuple] = None,
+) -> ComparisonResult:
+    """Run compare_pitch (normalization + DTW) in the audio pool (or threadpool if disabled).
+
+    Args:
+        window: Optional DTW window (see compare_pitch).
+
+    Raises:
+        AudioTaskTimeout: If the comparison exceeds the task timeout.
+        BrokenProcessPool: If a worker process died.
+    """
+    pool = get_audio_pool()
+    if pool is None:
+        return await asyncio.to_thread(compare_pitch, native_pitch, user_pitch, False, window)
+
+    return await _run(pool, compare_pitch, native_pitch, user_pitch, False, window)
+
+
+async def compare_pitch_multi_in_pool(
+    native_pitches: dict[str, list[float]],
+    user_pitch: list[float],
+) -> MultiComparisonResult:
+    """Run compare_pitch_multi (batched DTW over voices) in the audio pool (or threadpool if disabled).
+
+    Raises:
+        AudioTaskTimeout: If the comparison exceeds the task timeout.
+        BrokenProcessPool: If a worker process died.
+    """
+    pool = get_audio_pool()
+    if pool is None:
+        return await asyncio.to_thread(compare_pitch_multi, native_pitches, user_pitch)
+
+    return await _run(pool, compare_pitch_multi, native_pitches, user_pitch)
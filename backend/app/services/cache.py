@@ -1,22 +1,59 @@
-"""TTS Cache Service - Redis (hot) + Cloudflare R2 (cold) architecture.
+"""TTS Cache Service - memory (L0) + Redis (hot) + Cloudflare R2 (cold) architecture.
 
 Cache flow:
-- READ:  Redis → R2 → Miss (generate)
-- WRITE: Redis + R2 (parallel)
+- READ:  Memory → Redis → R2 → Miss (generate)
+- WRITE: Memory + Redis, then R2 in the background (write-behind, see r2_writer)
 
+Memory: Per-process LRU bounded in bytes, hottest clips only (audio, not pitch/timings)
 Redis: Fast, volatile, 1-day TTL
 R2: Permanent, cheap, unlimited scale
+
+Native pitch contours extracted from cached audio are stored under the
+same cache key (pitch:{key} / pitch/{key}.bin) as a float32 array;
+contours from a non-default pitch engine get an engine suffix
+(pitch:{key}:yin / pitch/{key}.yin.bin). Azure word boundary timings
+for a clip are stored the same way as JSON (timings:{key} /
+timings/{key}.json).
+
+Lookups on the request path have async variants (*_async) that talk to
+Redis through redis.asyncio over a bounded connection pool, so a hit is
+served on the event loop instead of holding a threadpool slot; multi-key
+lookups (get_cached_*_many_async) use one MGET, and clips promoted from
+R2 are written back with one pipeline of SETEXs. Only R2 (boto3) still
+runs in a thread.
+
+The key is a stable content hash, so clients that already played a clip
+can hand it back (e.g. to /api/compare) and the audio or contour is
+fetched by key without re-deriving it from text and TTS parameters.
+
+Concurrent misses on the same key (e.g. a class opening the same deck
+page) are coalesced by single_flight(): one caller synthesizes, the
+others wait for its bytes. single_flight_async() does the same on the
+event loop: waiters await the leader's future instead of each blocking
+a threadpool slot. With tts_single_flight_redis the leader also
+holds a Redis lock (lock:tts:{key}) and other workers poll the hot cache
+for the clip instead of calling Azure themselves.
 """
 
+import asyncio
 import hashlib
+import json
 import logging
+import struct
 import threading
-from dataclasses import dataclass
-from typing import Optional
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Callable, Optional
 
+import numpy as np
 import redis
+import redis.asyncio as aioredis
 
 from app.core.config import settings
+from app.services.audio_compare import TimedPitch
+from app.services.r2_writer import get_r2_writer, get_r2_writer_stats
 from app.services.storage import r2_get, r2_put, r2_get_stats, r2_health_check
 
 logger = logging.getLogger(__name__)
@@ -27,12 +64,18 @@ class CacheStats:
     """Cache statistics."""
     hits: int = 0
     misses: int = 0
+    memory_hits: int = 0
     redis_hits: int = 0
     r2_hits: int = 0
     redis_connected: bool = False
     r2_connected: bool = False
     r2_objects: int = 0
     r2_size_mb: float = 0.0
+    pitch_hits: int = 0
+    pitch_misses: int = 0
+    coalesced: int = 0  # Misses served by another caller's synthesis
+    memory_entries: int = 0
+    memory_size_bytes: int = 0
 
 
 # Global stats (thread-safe access via lock)
@@ -42,6 +85,14 @@ _stats_lock = threading.Lock()
 # Redis client (lazy initialization)
 _redis_client: Optional[redis.Redis] = None
 
+# Asyncio Redis client over an explicit connection pool (lazy initialization)
+_async_redis_client: Optional[aioredis.Redis] = None
+
+# LRU of cache key → WAV bytes (guarded by _memory_lock)
+_memory_entries: "OrderedDict[str, bytes]" = OrderedDict()
+_memory_size_bytes = 0
+_memory_lock = threading.Lock()
+
 
 def _get_redis_client() -> Optional[redis.Redis]:
     """Get Redis client with lazy initialization."""
@@ -69,7 +120,46 @@ def _get_redis_client() -> Optional[redis.Redis]:
         return None
 
 
-def _get_cache_key(text: str, voice: str, params: str) -> str:
+def _get_async_redis_client() -> Optional[aioredis.Redis]:
+    """Get the asyncio Redis client with lazy initialization.
+
+    Creating it does no I/O (no ping): an unreachable server shows up as
+    RedisError on first use, which callers treat as a miss.
+    """
+    global _async_redis_client
+
+    if not settings.redis_enabled:
+        return None
+
+    if _async_redis_client is not None:
+        return _async_redis_client
+
+    try:
+        # Blocking pool: callers queue for a connection instead of failing when all are in use
+        pool = aioredis.BlockingConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            timeout=2,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+        _async_redis_client = aioredis.Redis.from_pool(pool)
+        return _async_redis_client
+    except Exception as e:
+        logger.warning(f"Async Redis client setup failed: {e}")
+        return None
+
+
+async def close_async_redis() -> None:
+    """Close the asyncio Redis client and its pool (called on app shutdown)."""
+    global _async_redis_client
+
+    if _async_redis_client is not None:
+        client, _async_redis_client = _async_redis_client, None
+        await client.aclose()
+
+
+def get_cache_key(text: str, voice: str, params: str) -> str:
     """Generate cache key from TTS parameters."""
     content = f"{text}|{voice}|{params}"
     return hashlib.sha256(content.encode()).hexdigest()[:16]
@@ -85,8 +175,110 @@ def _r2_key(cache_key: str) -> str:
     return f"tts/{cache_key}.wav"
 
 
+def _pitch_redis_key(cache_key: str, engine: str = "praat") -> str:
+    """Redis key format for native pitch contours."""
+    return f"pitch:{cache_key}" if engine == "praat" else f"pitch:{cache_key}:{engine}"
+
+
+def _pitch_r2_key(cache_key: str, engine: str = "praat") -> str:
+    """R2 object key format for native pitch contours."""
+    return f"pitch/{cache_key}.bin" if engine == "praat" else f"pitch/{cache_key}.{engine}.bin"
+
+
+def _timings_redis_key(cache_key: str) -> str:
+    """Redis key format for word boundary timings."""
+    return f"timings:{cache_key}"
+
+
+def _timings_r2_key(cache_key: str) -> str:
+    """R2 object key format for word boundary timings."""
+    return f"timings/{cache_key}.json"
+
+
+def _lock_redis_key(cache_key: str) -> str:
+    """Redis key format for the cross-worker single-flight lock."""
+    return f"lock:tts:{cache_key}"
+
+
+# Pitch blob header: magic, version, time step (ms), duration (ms), frame count
+_PITCH_HEADER = struct.Struct("<4sHHII")
+_PITCH_MAGIC = b"PTCH"
+_PITCH_VERSION = 1
+
+
+def _pack_pitch(timed_pitch: TimedPitch) -> bytes:
+    """Serialize a TimedPitch as header + float32 full curve.
+
+    The voiced curve is the non-zero frames of the full curve, so only
+    the full curve is stored.
+    """
+    curve = np.asarray(timed_pitch.full_curve, dtype="<f4")
+    header = _PITCH_HEADER.pack(
+        _PITCH_MAGIC, _PITCH_VERSION, timed_pitch.time_step_ms, timed_pitch.duration_ms, len(curve)
+    )
+    return header + curve.tobytes()
+
+
+def _unpack_pitch(data: bytes) -> Optional[TimedPitch]:
+    """Deserialize a pitch blob (None if malformed or another version)."""
+    if len(data) < _PITCH_HEADER.size:
+        return None
+    magic, version, time_step_ms, duration_ms, frames = _PITCH_HEADER.unpack_from(data)
+    if magic != _PITCH_MAGIC or version != _PITCH_VERSION:
+        return None
+    if len(data) != _PITCH_HEADER.size + frames * 4:
+        return None
+
+    curve = np.frombuffer(data, dtype="<f4", offset=_PITCH_HEADER.size).astype(float)
+    return TimedPitch(
+        pitch_values=curve[curve > 0].tolist(),
+        full_curve=curve.tolist(),
+        duration_ms=duration_ms,
+        time_step_ms=time_step_ms,
+    )
+
+
+def _memory_get(cache_key: str) -> Optional[bytes]:
+    with _memory_lock:
+        data = _memory_entries.get(cache_key)
+        if data is not None:
+            _memory_entries.move_to_end(cache_key)
+        return data
+
+
+def _memory_put(cache_key: str, data: bytes) -> None:
+    """Insert into the LRU, evicting least recently used clips past the byte budget."""
+    global _memory_size_bytes
+
+    max_bytes = settings.tts_memory_cache_mb * 1024 * 1024
+    if len(data) > min(max_bytes, settings.tts_memory_cache_max_entry_kb * 1024):
+        return
+
+    with _memory_lock:
+        old = _memory_entries.pop(cache_key, None)
+        if old is not None:
+            _memory_size_bytes -= len(old)
+        _memory_entries[cache_key] = data
+        _memory_size_bytes += len(data)
+
+        while _memory_size_bytes > max_bytes:
+            _, evicted = _memory_entries.popitem(last=False)
+            _memory_size_bytes -= len(evicted)
+
+
+def _memory_clear() -> int:
+    """Drop every in-process clip, returning how many there were."""
+    global _memory_size_bytes
+
+    with _memory_lock:
+        count = len(_memory_entries)
+        _memory_entries.clear()
+        _memory_size_bytes = 0
+        return count
+
+
 def get_cached_audio(text: str, voice: str, params: str) -> Optional[bytes]:
-    """Get audio from cache (Redis → R2 → None).
+    """Get audio from cache (Memory → Redis → R2 → None).
 
     Args:
         text: The text that was synthesized.
@@ -96,9 +288,20 @@ def get_cached_audio(text: str, voice: str, params: str) -> Optional[bytes]:
     Returns:
         Audio bytes if cached, None otherwise.
     """
-    cache_key = _get_cache_key(text, voice, params)
+    return get_cached_audio_by_key(get_cache_key(text, voice, params))
 
-    # 1. Try Redis (hot cache)
+
+def get_cached_audio_by_key(cache_key: str) -> Optional[bytes]:
+    """Get audio from cache by its content key (Memory → Redis → R2 → None)."""
+    # 1. Try process memory (L0)
+    data = _memory_get(cache_key)
+    if data is not None:
+        with _stats_lock:
+            _stats.hits += 1
+            _stats.memory_hits += 1
+        return data
+
+    # 2. Try Redis (hot cache)
     redis_client = _get_redis_client()
     if redis_client:
         try:
@@ -107,17 +310,19 @@ def get_cached_audio(text: str, voice: str, params: str) -> Optional[bytes]:
                 with _stats_lock:
                     _stats.hits += 1
                     _stats.redis_hits += 1
+                _memory_put(cache_key, data)
                 return data
         except redis.RedisError as e:
             logger.warning(f"Redis get failed: {e}")
 
-    # 2. Try R2 (cold storage)
+    # 3. Try R2 (cold storage)
     if settings.r2_enabled:
         data = r2_get(_r2_key(cache_key))
         if data:
             with _stats_lock:
                 _stats.hits += 1
                 _stats.r2_hits += 1
+            _memory_put(cache_key, data)
 
             # Promote to Redis for faster future access
             if redis_client:
@@ -132,14 +337,107 @@ def get_cached_audio(text: str, voice: str, params: str) -> Optional[bytes]:
 
             return data
 
-    # 3. Cache miss
+    # 4. Cache miss
     with _stats_lock:
         _stats.misses += 1
     return None
 
 
+async def _promote_async(redis_client: aioredis.Redis, items: dict[str, bytes]) -> None:
+    """Write R2 hits back to Redis in one pipelined round trip."""
+    if not items:
+        return
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for redis_key, data in items.items():
+                pipe.setex(redis_key, settings.redis_ttl_seconds, data)
+            await pipe.execute()
+    except redis.RedisError:
+        pass
+
+
+async def _mget_async(redis_client: Optional[aioredis.Redis], redis_keys: list[str]) -> list[Optional[bytes]]:
+    """MGET redis_keys (all None without a client or on error)."""
+    if redis_client is None or not redis_keys:
+        return [None] * len(redis_keys)
+    try:
+        return await redis_client.mget(redis_keys)
+    except redis.RedisError as e:
+        logger.warning(f"Redis mget failed: {e}")
+        return [None] * len(redis_keys)
+
+
+async def _r2_get_many(r2_keys: list[str]) -> list[Optional[bytes]]:
+    """Fetch R2 objects concurrently in threads (all None if R2 is disabled)."""
+    if not settings.r2_enabled or not r2_keys:
+        return [None] * len(r2_keys)
+    return list(await asyncio.gather(*(asyncio.to_thread(r2_get, key) for key in r2_keys)))
+
+
+async def get_cached_audio_async(text: str, voice: str, params: str) -> Optional[bytes]:
+    """Async get_cached_audio (Memory → Redis → R2 → None) for use on the event loop."""
+    return await get_cached_audio_by_key_async(get_cache_key(text, voice, params))
+
+
+async def get_cached_audio_by_key_async(cache_key: str) -> Optional[bytes]:
+    """Async get_cached_audio_by_key (Memory → Redis → R2 → None)."""
+    return (await get_cached_audio_many_async([cache_key])).get(cache_key)
+
+
+async def get_cached_audio_many_async(cache_keys: list[str]) -> dict[str, bytes]:
+    """Get several clips by content key (Memory → one Redis MGET → R2).
+
+    Returns:
+        Dict of cache key → audio bytes for the keys that were cached.
+    """
+    found: dict[str, bytes] = {}
+    pending = []
+    for cache_key in dict.fromkeys(cache_keys):
+        data = _memory_get(cache_key)
+        if data is not None:
+            found[cache_key] = data
+        else:
+            pending.append(cache_key)
+    memory_hits = len(found)
+
+    redis_client = _get_async_redis_client() if pending else None
+    values = await _mget_async(redis_client, [_redis_key(key) for key in pending])
+    missing = []
+    for cache_key, data in zip(pending, values):
+        if data:
+            found[cache_key] = data
+            _memory_put(cache_key, data)
+        else:
+            missing.append(cache_key)
+    redis_hits = len(found) - memory_hits
+
+    promoted = {}
+    for cache_key, data in zip(missing, await _r2_get_many([_r2_key(key) for key in missing])):
+        if data:
+            found[cache_key] = data
+            promoted[_redis_key(cache_key)] = data
+            _memory_put(cache_key, data)
+    if redis_client is not None:
+        await _promote_async(redis_client, promoted)
+
+    with _stats_lock:
+        _stats.hits += len(found)
+        _stats.memory_hits += memory_hits
+        _stats.redis_hits += redis_hits
+        _stats.r2_hits += len(promoted)
+        _stats.misses += len(pending) - redis_hits - len(promoted)
+    return found
+
+
+def _r2_save(r2_key: str, data: bytes, content_type: str = "audio/wav") -> None:
+    """Queue an R2 upload, or upload now if write-behind is off or its queue is full."""
+    writer = get_r2_writer()
+    if writer is None or not writer.put(r2_key, data, content_type):
+        r2_put(r2_key, data, content_type)
+
+
 def save_to_cache(text: str, voice: str, params: str, audio_data: bytes) -> None:
-    """Save audio to cache (Redis + R2).
+    """Save audio to cache (Memory + Redis + R2).
 
     Args:
         text: The text that was synthesized.
@@ -147,7 +445,8 @@ def save_to_cache(text: str, voice: str, params: str, audio_data: bytes) -> None
         params: TTS parameters string (e.g., "1.00_0.0_0.0" for rate_pitch_volume).
         audio_data: WAV audio bytes to cache.
     """
-    cache_key = _get_cache_key(text, voice, params)
+    cache_key = get_cache_key(text, voice, params)
+    _memory_put(cache_key, audio_data)
 
     # Save to Redis (hot)
     redis_client = _get_redis_client()
@@ -163,7 +462,359 @@ def save_to_cache(text: str, voice: str, params: str, audio_data: bytes) -> None
 
     # Save to R2 (cold - permanent)
     if settings.r2_enabled:
-        r2_put(_r2_key(cache_key), audio_data)
+        _r2_save(_r2_key(cache_key), audio_data)
+
+
+class _Flight:
+    """A synthesis in progress and, once done, its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Optional[bytes] = None
+        self.error: Optional[BaseException] = None
+
+
+# In-flight loads per cache key (single-flight)
+_flights: dict[str, _Flight] = {}
+_flights_lock = threading.Lock()
+
+# In-flight async loads per (event loop, cache key) - only touched on the loop
+_async_flights: dict[tuple[asyncio.AbstractEventLoop, str], "asyncio.Task[tuple[bytes, bool]]"] = {}
+
+# Delete the lock only if this caller still owns it (it may have expired and been retaken)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+_LOCK_POLL_SECONDS = 0.05
+
+
+def _peek_audio(cache_key: str) -> Optional[bytes]:
+    """Memory → Redis lookup without touching hit/miss stats (single-flight re-check)."""
+    data = _memory_get(cache_key)
+    if data is not None:
+        return data
+
+    redis_client = _get_redis_client()
+    if redis_client:
+        try:
+            return redis_client.get(_redis_key(cache_key)) or None
+        except redis.RedisError as e:
+            logger.warning(f"Redis get failed (single-flight): {e}")
+    return None
+
+
+def _load_with_redis_lock(cache_key: str, load: Callable[[], bytes]) -> tuple[bytes, bool]:
+    """Run load() under a Redis lock, or wait for the worker holding it.
+
+    The waiting side polls the hot cache for the clip; if the holder
+    fails (lock gone without a clip), Redis errors, or the wait times
+    out, it falls back to load() itself.
+    """
+    redis_client = _get_redis_client()
+    if redis_client is None:
+        return load(), False
+
+    lock_key = _lock_redis_key(cache_key)
+    token = uuid.uuid4().hex
+    timeout = settings.tts_single_flight_timeout_seconds
+    try:
+        if not redis_client.set(lock_key, token, nx=True, px=int(timeout * 1000)):
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                data = redis_client.get(_redis_key(cache_key))
+                if data:
+                    return data, True
+                if not redis_client.get(lock_key):
+                    break
+                time.sleep(_LOCK_POLL_SECONDS)
+            return load(), False
+
+        # Another worker may have saved the clip between our miss and the lock
+        data = redis_client.get(_redis_key(cache_key))
+        if data:
+            return data, True
+    except redis.RedisError as e:
+        logger.warning(f"Redis single-flight lock failed: {e}")
+        return load(), False
+
+    try:
+        return load(), False
+    finally:
+        try:
+            redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except redis.RedisError as e:
+            logger.warning(f"Redis single-flight unlock failed: {e}")
+
+
+def single_flight(cache_key: str, load: Callable[[], bytes]) -> tuple[bytes, bool]:
+    """Run load() once for concurrent callers missing the same cache key.
+
+    The first caller (the leader) re-checks the cache - a previous
+    leader may have saved the value between this caller's miss and its
+    arrival here - then runs load(), which is expected to save its
+    result to the cache; callers arriving while it runs block
+    until it finishes and get the same bytes, or its exception. A waiter
+    whose leader takes longer than tts_single_flight_timeout_seconds
+    runs load() itself.
+
+    Note: This is synchronous and blocks waiters - call via run_in_threadpool.
+
+    Args:
+        cache_key: Content key of the value being loaded.
+        load: Produces (and caches) the value on a miss.
+
+    Returns:
+        Tuple of (value, shared) where shared is True if the value came
+        from another caller's load().
+    """
+    if not settings.tts_single_flight:
+        return load(), False
+
+    with _flights_lock:
+        flight = _flights.get(cache_key)
+        leader = flight is None
+        if leader:
+            flight = _flights[cache_key] = _Flight()
+
+    if not leader:
+        with _stats_lock:
+            _stats.coalesced += 1
+        if not flight.done.wait(settings.tts_single_flight_timeout_seconds):
+            logger.warning(f"Single-flight wait for {cache_key} timed out")
+            return load(), False
+        if flight.error is not None:
+            raise flight.error
+        return flight.value, True
+
+    try:
+        cached = _peek_audio(cache_key)
+        if cached is not None:
+            flight.value, shared = cached, True
+        elif settings.tts_single_flight_redis:
+            flight.value, shared = _load_with_redis_lock(cache_key, load)
+        else:
+            flight.value, shared = load(), False
+        if shared:
+            with _stats_lock:
+                _stats.coalesced += 1
+        return flight.value, shared
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            del _flights[cache_key]
+        flight.done.set()
+
+
+async def single_flight_async(cache_key: str, load: Callable[[], bytes]) -> tuple[bytes, bool]:
+    """Async single_flight: concurrent misses on one key share one thread.
+
+    The first caller starts single_flight(cache_key, load) in a thread
+    as a task (so sync callers and other workers are still coalesced
+    with it); callers arriving while it runs await that task instead of
+    taking a thread each. The task is shielded, so a cancelled request
+    doesn't cancel the load for the others. A waiter whose leader takes
+    longer than tts_single_flight_timeout_seconds runs load() itself.
+
+    Args:
+        cache_key: Content key of the value being loaded.
+        load: Produces (and caches) the value on a miss (run in a thread).
+
+    Returns:
+        Tuple of (value, shared) where shared is True if the value came
+        from another caller's load().
+    """
+    if not settings.tts_single_flight:
+        return await asyncio.to_thread(load), False
+
+    loop = asyncio.get_running_loop()
+    flight_key = (loop, cache_key)
+    task = _async_flights.get(flight_key)
+
+    if task is None:
+        task = loop.create_task(asyncio.to_thread(single_flight, cache_key, load))
+        _async_flights[flight_key] = task
+
+        def finished(done: "asyncio.Task[tuple[bytes, bool]]") -> None:
+            del _async_flights[flight_key]
+            if not done.cancelled():
+                done.exception()  # Retrieved here in case every caller was cancelled
+
+        task.add_done_callback(finished)
+        return await asyncio.shield(task)
+
+    with _stats_lock:
+        _stats.coalesced += 1
+    try:
+        value, _ = await asyncio.wait_for(asyncio.shield(task), settings.tts_single_flight_timeout_seconds)
+    except asyncio.TimeoutError:
+        logger.warning(f"Single-flight wait for {cache_key} timed out")
+        return await asyncio.to_thread(load), False
+    return value, True
+
+
+def get_cached_pitch(text: str, voice: str, params: str, engine: str = "praat") -> Optional[TimedPitch]:
+    """Get a native pitch contour from cache (Redis → R2 → None).
+
+    Args:
+        text: The text that was synthesized.
+        voice: Voice name used.
+        params: TTS parameters string (same as for the audio).
+        engine: Pitch engine the contour was extracted with.
+
+    Returns:
+        TimedPitch if cached, None otherwise.
+    """
+    return get_cached_pitch_by_key(get_cache_key(text, voice, params), engine)
+
+
+def get_cached_pitch_by_key(cache_key: str, engine: str = "praat") -> Optional[TimedPitch]:
+    """Get a native pitch contour by the audio's content key (Redis → R2 → None)."""
+    data = None
+    redis_key = _pitch_redis_key(cache_key, engine)
+
+    # 1. Try Redis (hot cache)
+    redis_client = _get_redis_client()
+    if redis_client:
+        try:
+            data = redis_client.get(redis_key)
+        except redis.RedisError as e:
+            logger.warning(f"Redis get failed (pitch): {e}")
+
+    # 2. Try R2 (cold storage), promoting to Redis
+    if not data and settings.r2_enabled:
+        data = r2_get(_pitch_r2_key(cache_key, engine))
+        if data and redis_client:
+            try:
+                redis_client.setex(redis_key, settings.redis_ttl_seconds, data)
+            except redis.RedisError:
+                pass
+
+    timed_pitch = _unpack_pitch(data) if data else None
+    with _stats_lock:
+        if timed_pitch is not None:
+            _stats.pitch_hits += 1
+        else:
+            _stats.pitch_misses += 1
+    return timed_pitch
+
+
+async def get_cached_pitch_by_key_async(cache_key: str, engine: str = "praat") -> Optional[TimedPitch]:
+    """Async get_cached_pitch_by_key (Redis → R2 → None)."""
+    return (await get_cached_pitch_many_async([cache_key], engine)).get(cache_key)
+
+
+async def get_cached_pitch_many_async(cache_keys: list[str], engine: str = "praat") -> dict[str, TimedPitch]:
+    """Get the native pitch contours of several clips (one Redis MGET → R2).
+
+    Returns:
+        Dict of cache key → TimedPitch for the keys that were cached.
+    """
+    cache_keys = list(dict.fromkeys(cache_keys))
+    redis_client = _get_async_redis_client()
+    values = await _mget_async(redis_client, [_pitch_redis_key(key, engine) for key in cache_keys])
+
+    missing = [key for key, data in zip(cache_keys, values) if not data]
+    blobs = {key: data for key, data in zip(cache_keys, values) if data}
+    promoted = {}
+    for cache_key, data in zip(missing, await _r2_get_many([_pitch_r2_key(key, engine) for key in missing])):
+        if data:
+            blobs[cache_key] = data
+            promoted[_pitch_redis_key(cache_key, engine)] = data
+    if redis_client is not None:
+        await _promote_async(redis_client, promoted)
+
+    found = {}
+    for cache_key, data in blobs.items():
+        timed_pitch = _unpack_pitch(data)
+        if timed_pitch is not None:
+            found[cache_key] = timed_pitch
+    with _stats_lock:
+        _stats.pitch_hits += len(found)
+        _stats.pitch_misses += len(cache_keys) - len(found)
+    return found
+
+
+def save_pitch_to_cache(
+    text: str,
+    voice: str,
+    params: str,
+    timed_pitch: TimedPitch,
+    engine: str = "praat",
+) -> None:
+    """Save a native pitch contour to cache (Redis + R2).
+
+    Args:
+        text: The text that was synthesized.
+        voice: Voice name used.
+        params: TTS parameters string (same as for the audio).
+        timed_pitch: Pitch extracted from the cached audio.
+        engine: Pitch engine the contour was extracted with.
+    """
+    save_pitch_by_key(get_cache_key(text, voice, params), timed_pitch, engine)
+
+
+def save_pitch_by_key(cache_key: str, timed_pitch: TimedPitch, engine: str = "praat") -> None:
+    """Save a native pitch contour under the audio's content key (Redis + R2)."""
+    data = _pack_pitch(timed_pitch)
+
+    redis_client = _get_redis_client()
+    if redis_client:
+        try:
+            redis_client.setex(_pitch_redis_key(cache_key, engine), settings.redis_ttl_seconds, data)
+        except redis.RedisError as e:
+            logger.warning(f"Redis set failed (pitch): {e}")
+
+    if settings.r2_enabled:
+        _r2_save(_pitch_r2_key(cache_key, engine), data, content_type="application/octet-stream")
+
+
+def get_cached_timings_by_key(cache_key: str) -> Optional[list[dict]]:
+    """Get a clip's word boundary timings by its content key (Redis → R2 → None)."""
+    data = None
+    redis_key = _timings_redis_key(cache_key)
+
+    redis_client = _get_redis_client()
+    if redis_client:
+        try:
+            data = redis_client.get(redis_key)
+        except redis.RedisError as e:
+            logger.warning(f"Redis get failed (timings): {e}")
+
+    if not data and settings.r2_enabled:
+        data = r2_get(_timings_r2_key(cache_key))
+        if data and redis_client:
+            try:
+                redis_client.setex(redis_key, settings.redis_ttl_seconds, data)
+            except redis.RedisError:
+                pass
+
+    if not data:
+        return None
+    try:
+        return json.loads(data)
+    except ValueError:
+        logger.warning(f"Corrupt timings blob for {cache_key}")
+        return None
+
+
+def save_timings_by_key(cache_key: str, timings: list[dict]) -> None:
+    """Save a clip's word boundary timings under its content key (Redis + R2)."""
+    data = json.dumps(timings, ensure_ascii=False).encode()
+
+    redis_client = _get_redis_client()
+    if redis_client:
+        try:
+            redis_client.setex(_timings_redis_key(cache_key), settings.redis_ttl_seconds, data)
+        except redis.RedisError as e:
+            logger.warning(f"Redis set failed (timings): {e}")
+
+    if settings.r2_enabled:
+        _r2_save(_timings_r2_key(cache_key), data, content_type="application/json")
 
 
 def get_cache_stats() -> CacheStats:
@@ -183,6 +834,10 @@ def get_cache_stats() -> CacheStats:
         r2_objects = 0
         r2_size_mb = 0.0
 
+    with _memory_lock:
+        memory_entries = len(_memory_entries)
+        memory_size_bytes = _memory_size_bytes
+
     with _stats_lock:
         _stats.redis_connected = redis_connected
         _stats.r2_connected = r2_connected
@@ -192,25 +847,32 @@ def get_cache_stats() -> CacheStats:
         return CacheStats(
             hits=_stats.hits,
             misses=_stats.misses,
+            memory_hits=_stats.memory_hits,
             redis_hits=_stats.redis_hits,
             r2_hits=_stats.r2_hits,
             redis_connected=_stats.redis_connected,
             r2_connected=_stats.r2_connected,
             r2_objects=_stats.r2_objects,
             r2_size_mb=_stats.r2_size_mb,
+            pitch_hits=_stats.pitch_hits,
+            pitch_misses=_stats.pitch_misses,
+            coalesced=_stats.coalesced,
+            memory_entries=memory_entries,
+            memory_size_bytes=memory_size_bytes,
         )
 
 
 def clear_cache() -> dict:
-    """Clear Redis cache only (R2 is permanent storage).
+    """Clear this process's memory cache and Redis (R2 is permanent storage).
 
-    Uses SCAN instead of KEYS to avoid blocking Redis.
+    Uses SCAN instead of KEYS to avoid blocking Redis. Other workers'
+    memory caches are not reached and age out by LRU.
 
     Returns:
         Dict with counts of deleted items.
     """
     global _stats
-    result = {"redis_keys": 0}
+    result = {"redis_keys": 0, "memory_entries": _memory_clear()}
 
     redis_client = _get_redis_client()
     if redis_client:
@@ -218,12 +880,14 @@ def clear_cache() -> dict:
             # Use SCAN iterator to avoid blocking Redis
             deleted = 0
             cursor = 0
-            while True:
-                cursor, keys = redis_client.scan(cursor, match="tts:*", count=100)
-                if keys:
-                    deleted += redis_client.delete(*keys)
-                if cursor == 0:
-                    break
+            for pattern in ("tts:*", "pitch:*", "timings:*"):
+                cursor = 0
+                while True:
+                    cursor, keys = redis_client.scan(cursor, match=pattern, count=100)
+                    if keys:
+                        deleted += redis_client.delete(*keys)
+                    if cursor == 0:
+                        break
             result["redis_keys"] = deleted
         except redis.RedisError as e:
             logger.warning(f"Redis clear failed: {e}")
@@ -232,15 +896,20 @@ def clear_cache() -> dict:
     with _stats_lock:
         _stats.hits = 0
         _stats.misses = 0
+        _stats.memory_hits = 0
         _stats.redis_hits = 0
         _stats.r2_hits = 0
+        _stats.pitch_hits = 0
+        _stats.pitch_misses = 0
+        _stats.coalesced = 0
     return result
 
 
 def health_check() -> dict:
-    """Check health of all cache layers."""
+    """Check health of all cache layers (R2 includes the write-behind queue counters)."""
     redis_ok = _get_redis_client() is not None
     r2_ok = r2_health_check() if settings.r2_enabled else None
+    write_stats = get_r2_writer_stats()
 
     return {
         "redis": {
@@ -250,5 +919,6 @@ def health_check() -> dict:
         "r2": {
             "enabled": settings.r2_enabled,
             "connected": r2_ok,
+            "write_queue": asdict(write_stats) if write_stats is not None else None,
         },
     }
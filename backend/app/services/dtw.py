@@ -0,0 +1,231 @@
+"""Dynamic Time Warping for 1-D pitch contours.
+
+Row-vectorized exact DTW with an optional Sakoe-Chiba band. Each row of
+the cost matrix is computed in a handful of NumPy operations: the
+diagonal/up predecessors are elementwise, and the left-neighbour
+recurrence D[j] = min(a[j], D[j-1] + c[j]) is solved in closed form as
+D = S + cummin(a - S), where S is the running sum of the row's costs.
+
+Open-end alignment lets the path stop at any row of x, which scores a
+partial recording against the matching prefix of the reference.
+
+dtw_batch() aligns one series against several references at once
+(stacked as a 2-D array, one row recurrence for all of them) and
+returns distances and path lengths only - enough to score every
+reference without paying the per-row Python overhead once per reference.
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+
+# Backtracking steps (stored as int8 per cell)
+_DIAG = 0
+_UP = 1  # From (i-1, j)
+_LEFT = 2  # From (i, j-1)
+
+
+def _band_window(n: int, m: int, band: int) -> tuple[np.ndarray, np.ndarray]:
+    """Per-row [lo, hi] column range for the cost matrix.
+
+    Args:
+        n: Rows (length of x).
+        m: Columns (length of y).
+        band: Sakoe-Chiba radius in frames around the scaled diagonal
+            (0 = exact, full matrix).
+
+    Returns:
+        Arrays (lo, hi) of inclusive column bounds, one pair per row.
+    """
+    if band <= 0:
+        return np.zeros(n, dtype=np.int64), np.full(n, m - 1, dtype=np.int64)
+
+    slope = (m - 1) / max(n - 1, 1)
+    # Radius must cover one row's worth of columns or the path breaks
+    radius = max(band, math.ceil(slope))
+    center = np.arange(n) * slope
+    lo = np.clip(np.ceil(center - radius), 0, m - 1).astype(np.int64)
+    hi = np.clip(np.floor(center + radius), 0, m - 1).astype(np.int64)
+    return lo, hi
+
+
+def dtw(
+    x,
+    y,
+    band: int = 0,
+    open_end: bool = False,
+    window: Optional[tuple[np.ndarray, np.ndarray]] = None,
+) -> tuple[float, list[tuple[int, int]]]:
+    """Align two 1-D series with DTW (absolute difference as cell cost).
+
+    Args:
+        x: First series (e.g. native pitch).
+        y: Second series (e.g. user pitch).
+        band: Sakoe-Chiba radius in frames; 0 computes the exact
+            alignment, > 0 restricts the path to a band around the
+            diagonal (faster, approximate).
+        open_end: Let the path end at any row of x (all of y aligned to
+            the best prefix of x). The band follows the full diagonal,
+            so it can't be combined with open_end.
+        window: Explicit per-row (lo, hi) inclusive column bounds instead
+            of a band, e.g. windows around known segments. Both bounds
+            must be non-decreasing, start at column 0 and end at
+            len(y) - 1, and consecutive rows must connect
+            (lo[i + 1] <= hi[i] + 1).
+
+    Returns:
+        Tuple of (total distance along the path, path as (i, j) pairs
+        from (0, 0) to (len(x) - 1, len(y) - 1)) - same shape as fastdtw.
+        With open_end the path ends at (best i, len(y) - 1).
+
+    Raises:
+        ValueError: If either series is empty, band or window is used with
+            open_end, or window doesn't fit the series.
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    n, m = len(x), len(y)
+    if n == 0 or m == 0:
+        raise ValueError("DTW needs non-empty series")
+    if open_end and (band > 0 or window is not None):
+        raise ValueError("open_end DTW does not support a band or window")
+
+    if window is not None:
+        lo, hi = (np.asarray(bounds, dtype=np.int64) for bounds in window)
+        if len(lo) != n or len(hi) != n or lo[0] != 0 or hi[-1] != m - 1 or np.any(lo > hi):
+            raise ValueError("DTW window must cover every row from (0, 0) to the last cell")
+    else:
+        lo, hi = _band_window(n, m, band)
+    width = int((hi - lo).max()) + 1
+    steps = np.empty((n, width), dtype=np.int8)
+    # Accumulated cost of ending each row in the last column (open-end)
+    last_col = np.full(n, np.inf)
+
+    # Previous row of accumulated costs, shifted by one: prev[j + 1] = D[i-1, j],
+    # prev[0] is the virtual column -1 (0 only before the first row)
+    prev = np.full(m + 1, np.inf)
+    prev[0] = 0.0
+    prev_lo, prev_hi = 0, -1
+
+    for i in range(n):
+        row_lo, row_hi = int(lo[i]), int(hi[i])
+        cost = np.abs(x[i] - y[row_lo:row_hi + 1])
+
+        diag = prev[row_lo:row_hi + 1]
+        up = prev[row_lo + 1:row_hi + 2]
+        from_diag = diag <= up
+        best = np.where(from_diag, diag, up) + cost
+
+        # Left moves within the row: D = S + cummin(best - S)
+        running = np.cumsum(cost)
+        offset = best - running
+        cummin = np.minimum.accumulate(offset)
+        row = running + cummin
+
+        row_steps = np.where(from_diag, _DIAG, _UP).astype(np.int8)
+        row_steps[1:][offset[1:] > cummin[:-1]] = _LEFT
+        steps[i, :row_hi - row_lo + 1] = row_steps
+        if row_hi == m - 1:
+            last_col[i] = row[-1]
+
+        # Invalidate columns of the previous row that fall outside this one
+        prev[0] = np.inf
+        prev[prev_lo + 1:row_lo + 1] = np.inf
+        prev[row_hi + 2:prev_hi + 2] = np.inf
+        prev[row_lo + 1:row_hi + 2] = row
+        prev_lo, prev_hi = row_lo, row_hi
+
+    # Backtrack from the end
+    path = []
+    i = int(np.argmin(last_col)) if open_end else n - 1
+    j = m - 1
+    while True:
+        path.append((i, j))
+        if i == 0 and j == 0:
+            break
+        step = steps[i, j - lo[i]]
+        if step == _DIAG:
+            i, j = i - 1, j - 1
+        elif step == _UP:
+            i -= 1
+        else:
+            j -= 1
+    path.reverse()
+
+    # Sum along the path directly (avoids cumsum rounding in the total)
+    rows, cols = np.array(path).T
+    distance = float(np.abs(x[rows] - y[cols]).sum())
+    return distance, path
+
+
+def dtw_batch(xs, y) -> tuple[np.ndarray, np.ndarray]:
+    """Exact DTW of several series against the same y, distances only.
+
+    The references are padded into one array and advanced a row at a
+    time together, so the cost is one loop over the longest reference
+    instead of one per reference. Path lengths are tracked alongside the
+    accumulated cost with the same tie-breaking as dtw()'s backtrack, so
+    distance / path length matches what dtw() would give.
+
+    Args:
+        xs: Reference series (e.g. native pitch per voice), any lengths.
+        y: Series aligned against each of them (e.g. user pitch).
+
+    Returns:
+        Tuple of (distance per reference, path length per reference).
+
+    Raises:
+        ValueError: If there are no references or any series is empty.
+    """
+    xs = [np.asarray(x, dtype=float).ravel() for x in xs]
+    y = np.asarray(y, dtype=float).ravel()
+    m = len(y)
+    if not xs or m == 0 or any(len(x) == 0 for x in xs):
+        raise ValueError("DTW needs non-empty series")
+
+    lengths = np.array([len(x) for x in xs])
+    k, n = len(xs), int(lengths.max())
+    stacked = np.zeros((k, n))
+    for r, x in enumerate(xs):
+        stacked[r, :len(x)] = x
+
+    distances = np.empty(k)
+    path_lengths = np.empty(k, dtype=np.int64)
+    # Flat cell indices, so a row's left-run sources can be gathered with np.take
+    flat_columns = np.arange(m) + (np.arange(k) * m)[:, None]
+    row_starts = flat_columns[:, :1]
+
+    # Same shifted layout as dtw(): prev[:, j + 1] = D[i-1, j]
+    prev = np.full((k, m + 1), np.inf)
+    prev[:, 0] = 0.0
+    prev_len = np.zeros((k, m + 1), dtype=np.int64)
+
+    for i in range(n):
+        cost = np.abs(stacked[:, i:i + 1] - y)
+
+        diag, up = prev[:, :-1], prev[:, 1:]
+        from_diag = diag <= up
+        best = np.where(from_diag, diag, up) + cost
+        best_len = np.where(from_diag, prev_len[:, :-1], prev_len[:, 1:]) + 1
+
+        running = np.cumsum(cost, axis=1)
+        offset = best - running
+        cummin = np.minimum.accumulate(offset, axis=1)
+        row = running + cummin
+
+        # Column each cell's left-run starts from (itself unless a left move wins)
+        own = np.ones((k, m), dtype=bool)
+        own[:, 1:] = offset[:, 1:] <= cummin[:, :-1]
+        source = np.maximum.accumulate(np.where(own, flat_columns, row_starts), axis=1)
+        row_len = np.take(best_len, source) + (flat_columns - source)
+
+        done = lengths == i + 1
+        distances[done] = row[done, -1]
+        path_lengths[done] = row_len[done, -1]
+
+        prev[:, 0] = np.inf
+        prev[:, 1:] = row
+        prev_len[:, 1:] = row_len
+
+    return distances, path_lengths
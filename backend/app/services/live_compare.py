@@ -0,0 +1,147 @@
+"""Live pronunciation comparison over streamed PCM.
+
+A LiveCompareSession takes 16-bit mono PCM chunks while the learner
+speaks, extracts pitch incrementally (YinStream on the same 10ms grid
+as extract_pitch_timed) and keeps a partial score against the native
+contour using open-end DTW. Each partial score is a full DTW over the
+contour so far, so it is refreshed at most every
+settings.live_score_interval_seconds. When recording stops, the final
+score is just a DTW over the contour already collected - no upload and
+no re-analysis of the audio.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.audio_compare import (
+    CompareError,
+    ComparisonResult,
+    TimedPitch,
+    compare_pitch,
+    MAX_AUDIO_SIZE,
+    MIN_VOICED_FRAMES,
+    PITCH_CEILING,
+    PITCH_FLOOR,
+    PITCH_TIME_STEP,
+)
+from app.services.yin import YinStream
+
+MIN_SAMPLE_RATE = 8000
+MAX_SAMPLE_RATE = 48000
+
+
+@dataclass
+class LiveUpdate:
+    """Result of one pushed chunk."""
+    frame_index: int  # Index of the first new frame on the 10ms grid
+    pitch: list[float]  # New user frames (Hz, 0 for unvoiced)
+    score: Optional[int]  # Partial score, None until native pitch and enough voice
+
+
+class LiveCompareSession:
+    """Incremental pitch extraction and scoring for one live recording.
+
+    Not thread-safe: feed one session from one task at a time.
+
+    Args:
+        sample_rate: Rate of the incoming PCM (8-48kHz; 16kHz is plenty
+            for pitch and keeps per-chunk work small).
+        native_pitch: Voiced native pitch values (Hz), if already known -
+            can also be supplied later with set_native_pitch().
+
+    Raises:
+        ValueError: If sample_rate is out of range.
+    """
+
+    def __init__(self, sample_rate: int, native_pitch: Optional[list[float]] = None):
+        if not MIN_SAMPLE_RATE <= sample_rate <= MAX_SAMPLE_RATE:
+            raise ValueError(f"sample_rate must be {MIN_SAMPLE_RATE}-{MAX_SAMPLE_RATE} Hz")
+
+        self.sample_rate = sample_rate
+        self.native_pitch = native_pitch
+        self._tracker = YinStream(
+            sample_rate,
+            time_step=PITCH_TIME_STEP,
+            pitch_floor=PITCH_FLOOR,
+            pitch_ceiling=PITCH_CEILING,
+        )
+        self._voiced: list[float] = []
+        self._scored_at = 0  # Voiced frame count at the last partial score
+        self._scored_time = 0.0  # Monotonic time of the last partial score
+        self._score: Optional[int] = None
+        self._pending = b""  # Odd trailing byte of a split sample
+        self._bytes_received = 0
+
+    def set_native_pitch(self, native_pitch: list[float]) -> None:
+        self.native_pitch = native_pitch
+
+    def _partial_score(self) -> Optional[int]:
+        """Open-end score, refreshed after MIN_VOICED_FRAMES new voiced frames
+        and at most once per live_score_interval_seconds."""
+        if self.native_pitch is None or len(self._voiced) < MIN_VOICED_FRAMES:
+            return None
+        now = time.monotonic()
+        if self._score is None or (
+            len(self._voiced) - self._scored_at >= MIN_VOICED_FRAMES
+            and now - self._scored_time >= settings.live_score_interval_seconds
+        ):
+            self._score = compare_pitch(self.native_pitch, self._voiced, open_end=True).score
+            self._scored_at = len(self._voiced)
+            self._scored_time = now
+        return self._score
+
+    def push(self, pcm: bytes) -> LiveUpdate:
+        """Add a chunk of 16-bit little-endian mono PCM.
+
+        Raises:
+            CompareError: If the recording exceeds MAX_AUDIO_SIZE.
+        """
+        self._bytes_received += len(pcm)
+        if self._bytes_received > MAX_AUDIO_SIZE:
+            raise CompareError(f"Recording too long (max {MAX_AUDIO_SIZE // 1024 // 1024}MB of audio)")
+
+        data = self._pending + pcm
+        usable = len(data) - (len(data) % 2)
+        self._pending = data[usable:]
+
+        frame_index = self._tracker.frame_count
+        samples = np.frombuffer(data[:usable], dtype="<i2") / 32768.0
+        pitch = self._tracker.push(samples)
+        self._voiced.extend(pitch[pitch > 0].tolist())
+
+        return LiveUpdate(frame_index=frame_index, pitch=pitch.tolist(), score=self._partial_score())
+
+    def finish(self) -> tuple[TimedPitch, ComparisonResult]:
+        """Final contour and score once recording has stopped.
+
+        Returns:
+            Tuple of (user TimedPitch, full comparison against native).
+
+        Raises:
+            CompareError: If too little voice was recorded.
+            ValueError: If native pitch was never supplied.
+        """
+        if self.native_pitch is None:
+            raise ValueError("Native pitch not available")
+
+        full_curve = self._tracker.finish()
+        duration_ms = self._tracker.duration_ms
+        if duration_ms < 100:
+            raise CompareError("Audio too short - need at least 100ms")
+
+        voiced = full_curve[full_curve > 0]
+        if len(voiced) < MIN_VOICED_FRAMES:
+            raise CompareError(
+                f"Audio too short or no voice detected (need at least {MIN_VOICED_FRAMES} voiced frames)"
+            )
+
+        timed_pitch = TimedPitch(
+            pitch_values=voiced.tolist(),
+            full_curve=full_curve.tolist(),
+            duration_ms=duration_ms,
+        )
+        return timed_pitch, compare_pitch(self.native_pitch, timed_pitch.pitch_values)
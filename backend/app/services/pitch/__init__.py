@@ -8,7 +8,7 @@ This package provides Japanese pitch accent analysis using:
 """
 
 # Main analyzer function
-from .analyzer import analyze_text
+from .analyzer import analyze_text, iter_analyze_text
 
 # Lookup functions
 from .lookup import (
@@ -37,12 +37,16 @@ from .tokenizer import (
     get_proper_noun_type,
 )
 
+# Token cache
+from .token_cache import get_token_cache_stats, clear_token_cache, TokenCacheStats
+
 # Constants
 from .constants import WARNINGS
 
 __all__ = [
     # Main
     "analyze_text",
+    "iter_analyze_text",
     # Lookup
     "lookup_pitch",
     "lookup_homophones",
@@ -64,6 +68,10 @@ __all__ = [
     "is_particle_like",
     "is_proper_noun",
     "get_proper_noun_type",
+    # Token cache
+    "get_token_cache_stats",
+    "clear_token_cache",
+    "TokenCacheStats",
     # Constants
     "WARNINGS",
 ]
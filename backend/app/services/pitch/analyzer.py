@@ -1,6 +1,7 @@
 """Main pitch accent analyzer - orchestrates all modules."""
 
 import re
+from typing import Iterator
 
 import jaconv
 from sudachipy import tokenizer
@@ -32,13 +33,165 @@ from .compound import (
     analyze_expression_fallback,
     resolve_compound_pitch,
 )
+from .token_cache import token_key, get_cached_token, save_token
+
+
+def _analyze_token(token) -> WordPitch:
+    """Analyze a single (non-punctuation) token.
+
+    Pure function of the token's dictionary entry - memoized by
+    analyze_text via the token cache.
+    """
+    surface = token.surface()
+
+    # SudachiPy returns reading in katakana, convert to hiragana for DB lookup
+    reading_kata = token.reading_form()
+    reading_hira = jaconv.kata2hira(reading_kata) if reading_kata else surface
+
+    mora_count = count_morae(reading_hira)
+    morae = split_into_morae(reading_hira)
+
+    # Get dictionary form (lemma) and normalized form for fallback lookups
+    lemma = token.dictionary_form()
+    normalized = token.normalized_form()
+
+    pos = get_pos(token)
+
+    # Determine source, confidence, warning using decision rules
+    source: SourceType
+    confidence: ConfidenceType
+    warning: str | None
+
+    if is_particle(pos):
+        # Particles inherit pitch from context - don't look up
+        source = "particle"
+        confidence = "high"  # Confident it IS a particle
+        warning = None
+        lookup_result = PitchLookupResult(None, None, None, source="particle")
+
+    elif is_auxiliary(pos):
+        # Auxiliary verbs also inherit pitch from context - don't look up
+        source = "auxiliary"
+        confidence = "high"  # Confident it IS an auxiliary verb
+        warning = None
+        lookup_result = PitchLookupResult(None, None, None, source="auxiliary")
+
+    elif is_proper_noun(token):
+        # Try dictionary first, then decide based on result
+        lookup_result = lookup_pitch(surface, reading_hira, lemma, normalized)
+        noun_type = get_proper_noun_type(token)
+
+        # Determine source based on where the data came from
+        if lookup_result.source == "dictionary_unidic":
+            # Found in UniDic only, not in Kanjium
+            source = "unidic_proper"
+            confidence = get_confidence_for_source(source, lookup_result.sources_agree)
+        elif lookup_result.source != "unknown" and lookup_result.accent_type is not None:
+            # Found in Kanjium
+            source = "dictionary_proper"
+            confidence = get_confidence_for_source(source, lookup_result.sources_agree)
+        else:
+            # Not in any dictionary
+            source = "proper_noun"
+            confidence = "low"
+            lookup_result = PitchLookupResult(None, None, None, source="proper_noun")
+
+        # Proper nouns get their own warning, but disagreement takes priority
+        if lookup_result.sources_agree is False:
+            warning = WARNINGS["sources_disagree"]
+        else:
+            warning = get_proper_noun_warning(noun_type, source)
+
+    else:
+        # Regular word - look up in database
+        lookup_result = lookup_pitch(surface, reading_hira, lemma, normalized)
+        source = lookup_result.source
+
+        # No match → use rule-based
+        if lookup_result.accent_type is None and source == "unknown":
+            source = "rule"
+
+        # Pass cross-validation result for confidence and warning
+        confidence = get_confidence_for_source(source, lookup_result.sources_agree)
+        warning = get_lookup_warning(
+            source, lookup_result.has_multiple_patterns, lookup_result.sources_agree
+        )
+
+    # Compound analysis: check if this word splits into components
+    compound_analysis = None
+    expression_fallback = None
+    components = None
+    is_compound = False
+    final_accent_type = lookup_result.accent_type
+
+    # Only analyze compounds for non-particles/auxiliaries and non-proper-nouns
+    if not is_particle_like(pos) and not is_proper_noun(token):
+        compound_in_dict = source in HIGH_CONFIDENCE_SOURCES
+        compound_analysis = analyze_compound(token, compound_in_dict)
+
+        if compound_analysis is not None:
+            is_compound = True
+            components = compound_analysis.components
+
+            # Resolve final pitch using extracted decision logic
+            final_accent_type, source, confidence, warning = resolve_compound_pitch(
+                compound_analysis,
+                compound_in_dict,
+                lookup_result.accent_type,
+                source,
+                confidence,
+                warning,
+            )
+
+    # Expression fallback: if lookup failed and no compound analysis helped,
+    # try splitting with Mode A and analyzing parts
+    if (source == "rule" or final_accent_type is None) and not is_compound and not is_particle_like(pos) and not is_proper_noun(token):
+        expression_fallback = analyze_expression_fallback(token)
+
+        if expression_fallback is not None and expression_fallback.success:
+            # Use the combined pattern from parts
+            is_compound = True  # Show as compound for UI
+            components = expression_fallback.components
+            pitch_pattern = expression_fallback.combined_pattern
+            source = "expression_parts"
+            confidence = get_confidence_for_source(source)
+            warning = WARNINGS["expression_parts"]
+            # Set accent_type to None since it's a combined pattern
+            final_accent_type = None
+
+    # Generate pitch pattern only for appropriate sources
+    if expression_fallback is None or not expression_fallback.success:
+        pitch_pattern = (
+            get_pitch_pattern(final_accent_type, mora_count)
+            if should_generate_pitch_pattern(source) and final_accent_type is not None
+            else []
+        )
+
+    return WordPitch(
+        surface=surface,
+        reading=reading_hira,
+        accent_type=final_accent_type,
+        mora_count=mora_count,
+        morae=morae,
+        pitch_pattern=pitch_pattern,
+        part_of_speech=pos,
+        origin=lookup_result.goshu,
+        origin_jp=lookup_result.goshu_jp,
+        lemma=lemma if lemma != surface else None,
+        source=source,
+        confidence=confidence,
+        warning=warning,
+        is_compound=is_compound,
+        components=components,
+    )
 
 
 def analyze_text(text: str) -> list[WordPitch]:
     """Analyze Japanese text and return pitch accent information.
 
     Uses SudachiPy Mode C to keep compound words together,
-    then looks up pitch patterns in Kanjium database.
+    then looks up pitch patterns in Kanjium database. Repeated tokens
+    are served from the token cache.
 
     Args:
         text: Japanese text to analyze (max 10000 chars).
@@ -49,17 +202,38 @@ def analyze_text(text: str) -> list[WordPitch]:
     Raises:
         ValueError: If text is empty or exceeds maximum length.
     """
+    return list(iter_analyze_text(text))
+
+
+def iter_analyze_text(text: str) -> Iterator[WordPitch]:
+    """Analyze Japanese text, yielding each WordPitch as its token is processed.
+
+    Streaming counterpart of analyze_text: validation happens eagerly, so
+    ValueError is raised by this call rather than on first iteration.
+
+    Args:
+        text: Japanese text to analyze (max 10000 chars).
+
+    Returns:
+        Iterator of WordPitch objects, one per token.
+
+    Raises:
+        ValueError: If text exceeds maximum length.
+    """
     # Guard: Empty text
     if not text or not text.strip():
-        return []
+        return iter(())
 
     # Guard: Text too long (DoS prevention)
     if len(text) > MAX_TEXT_LENGTH:
         raise ValueError(f"Text exceeds maximum length of {MAX_TEXT_LENGTH} characters")
 
+    return _iter_tokens(text)
+
+
+def _iter_tokens(text: str) -> Iterator[WordPitch]:
     tok = get_tokenizer()
     mode = tokenizer.Tokenizer.SplitMode.C  # Keep compounds together
-    words_result = []
 
     for token in tok.tokenize(text, mode):
         surface = token.surface()
@@ -68,145 +242,9 @@ def analyze_text(text: str) -> list[WordPitch]:
         if re.match(r'^[\s\u3000.,!?。、！？「」『』（）\(\)\-ー～]+$', surface):
             continue
 
-        # SudachiPy returns reading in katakana, convert to hiragana for DB lookup
-        reading_kata = token.reading_form()
-        reading_hira = jaconv.kata2hira(reading_kata) if reading_kata else surface
-
-        mora_count = count_morae(reading_hira)
-        morae = split_into_morae(reading_hira)
-
-        # Get dictionary form (lemma) and normalized form for fallback lookups
-        lemma = token.dictionary_form()
-        normalized = token.normalized_form()
-
-        pos = get_pos(token)
-
-        # Determine source, confidence, warning using decision rules
-        source: SourceType
-        confidence: ConfidenceType
-        warning: str | None
-
-        if is_particle(pos):
-            # Particles inherit pitch from context - don't look up
-            source = "particle"
-            confidence = "high"  # Confident it IS a particle
-            warning = None
-            lookup_result = PitchLookupResult(None, None, None, source="particle")
-
-        elif is_auxiliary(pos):
-            # Auxiliary verbs also inherit pitch from context - don't look up
-            source = "auxiliary"
-            confidence = "high"  # Confident it IS an auxiliary verb
-            warning = None
-            lookup_result = PitchLookupResult(None, None, None, source="auxiliary")
-
-        elif is_proper_noun(token):
-            # Try dictionary first, then decide based on result
-            lookup_result = lookup_pitch(surface, reading_hira, lemma, normalized)
-            noun_type = get_proper_noun_type(token)
-
-            # Determine source based on where the data came from
-            if lookup_result.source == "dictionary_unidic":
-                # Found in UniDic only, not in Kanjium
-                source = "unidic_proper"
-                confidence = get_confidence_for_source(source, lookup_result.sources_agree)
-            elif lookup_result.source != "unknown" and lookup_result.accent_type is not None:
-                # Found in Kanjium
-                source = "dictionary_proper"
-                confidence = get_confidence_for_source(source, lookup_result.sources_agree)
-            else:
-                # Not in any dictionary
-                source = "proper_noun"
-                confidence = "low"
-                lookup_result = PitchLookupResult(None, None, None, source="proper_noun")
-
-            # Proper nouns get their own warning, but disagreement takes priority
-            if lookup_result.sources_agree is False:
-                warning = WARNINGS["sources_disagree"]
-            else:
-                warning = get_proper_noun_warning(noun_type, source)
-
-        else:
-            # Regular word - look up in database
-            lookup_result = lookup_pitch(surface, reading_hira, lemma, normalized)
-            source = lookup_result.source
-
-            # No match → use rule-based
-            if lookup_result.accent_type is None and source == "unknown":
-                source = "rule"
-
-            # Pass cross-validation result for confidence and warning
-            confidence = get_confidence_for_source(source, lookup_result.sources_agree)
-            warning = get_lookup_warning(
-                source, lookup_result.has_multiple_patterns, lookup_result.sources_agree
-            )
-
-        # Compound analysis: check if this word splits into components
-        compound_analysis = None
-        expression_fallback = None
-        components = None
-        is_compound = False
-        final_accent_type = lookup_result.accent_type
-
-        # Only analyze compounds for non-particles/auxiliaries and non-proper-nouns
-        if not is_particle_like(pos) and not is_proper_noun(token):
-            compound_in_dict = source in HIGH_CONFIDENCE_SOURCES
-            compound_analysis = analyze_compound(token, compound_in_dict)
-
-            if compound_analysis is not None:
-                is_compound = True
-                components = compound_analysis.components
-
-                # Resolve final pitch using extracted decision logic
-                final_accent_type, source, confidence, warning = resolve_compound_pitch(
-                    compound_analysis,
-                    compound_in_dict,
-                    lookup_result.accent_type,
-                    source,
-                    confidence,
-                    warning,
-                )
-
-        # Expression fallback: if lookup failed and no compound analysis helped,
-        # try splitting with Mode A and analyzing parts
-        if (source == "rule" or final_accent_type is None) and not is_compound and not is_particle_like(pos) and not is_proper_noun(token):
-            expression_fallback = analyze_expression_fallback(token)
-
-            if expression_fallback is not None and expression_fallback.success:
-                # Use the combined pattern from parts
-                is_compound = True  # Show as compound for UI
-                components = expression_fallback.components
-                pitch_pattern = expression_fallback.combined_pattern
-                source = "expression_parts"
-                confidence = get_confidence_for_source(source)
-                warning = WARNINGS["expression_parts"]
-                # Set accent_type to None since it's a combined pattern
-                final_accent_type = None
-
-        # Generate pitch pattern only for appropriate sources
-        if expression_fallback is None or not expression_fallback.success:
-            pitch_pattern = (
-                get_pitch_pattern(final_accent_type, mora_count)
-                if should_generate_pitch_pattern(source) and final_accent_type is not None
-                else []
-            )
-
-        words_result.append(WordPitch(
-            surface=surface,
-            reading=reading_hira,
-            accent_type=final_accent_type,
-            mora_count=mora_count,
-            morae=morae,
-            pitch_pattern=pitch_pattern,
-            part_of_speech=pos,
-            origin=lookup_result.goshu,
-            origin_jp=lookup_result.goshu_jp,
-            lemma=lemma if lemma != surface else None,
-            source=source,
-            confidence=confidence,
-            warning=warning,
-            is_compound=is_compound,
-            components=components,
-        ))
-
-    return words_result
+        key = token_key(token)
+        word = get_cached_token(key)
+        if word is None:
+            word = _analyze_token(token)
+            save_token(key, word)
+        yield word
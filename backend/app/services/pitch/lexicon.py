@@ -0,0 +1,160 @@
+"""In-memory Kanjium lexicon.
+
+Loads the whole pitch_accents table once and answers the lookup_pitch
+fallback chain from dicts instead of issuing SQL per token. When pitch.db
+also carries the precomputed unidic_accents table, UniDic cross-validation
+is answered from memory too instead of running fugashi per lookup.
+"""
+
+import sqlite3
+
+from app.models.schemas import SourceType
+
+# (accents, has_multiple_patterns, goshu, goshu_jp)
+# accents holds every valid value of accent_pattern, e.g. "0,2" → (0, 2)
+LexiconEntry = tuple[tuple[int, ...], bool, str | None, str | None]
+
+
+def parse_accent_pattern(pattern: str) -> tuple[int, ...]:
+    """Parse a Kanjium accent pattern ("0", "0,2") into ints, skipping junk."""
+    accents: list[int] = []
+    for val in pattern.split(","):
+        try:
+            accents.append(int(val.strip()))
+        except ValueError:
+            pass
+    return tuple(accents)
+
+
+class PitchLexicon:
+    """Read-only index over pitch_accents, keyed the way lookup_pitch queries it.
+
+    Each index keeps the entry the equivalent SQL query would return first
+    (table order for exact matches, smallest reading for surface-only
+    matches, shortest surface for reading-only matches), so results match
+    the old per-token SELECTs.
+    """
+    __slots__ = (
+        "_by_surface_reading", "_by_surface", "_by_reading", "size",
+        "_unidic_words", "_unidic_parts", "has_unidic",
+    )
+
+    def __init__(self):
+        self._by_surface_reading: dict[tuple[str, str], LexiconEntry] = {}
+        # surface → (reading, entry) with the smallest reading, matching the
+        # order SQLite walks idx_surface_reading for "WHERE surface = ?"
+        self._by_surface: dict[str, tuple[str, LexiconEntry]] = {}
+        # reading → (surface length, entry) of the shortest surface seen
+        self._by_reading: dict[str, tuple[int, LexiconEntry]] = {}
+        self.size = 0
+        # UniDic aType: surfaces UniDic parses as one word, and sub-tokens of
+        # multi-token parses (only valid when the reading matches)
+        self._unidic_words: dict[str, int] = {}
+        self._unidic_parts: dict[tuple[str, str], int] = {}
+        self.has_unidic = False
+
+    @classmethod
+    def from_connection(cls, conn: sqlite3.Connection) -> "PitchLexicon":
+        """Build the lexicon from an open pitch.db connection."""
+        lexicon = cls()
+        # Share identical entries/patterns between rows to keep memory compact
+        patterns: dict[str, tuple[tuple[int, ...], bool]] = {}
+        entries: dict[LexiconEntry, LexiconEntry] = {}
+
+        rows = conn.execute(
+            "SELECT surface, reading, accent_pattern, goshu, goshu_jp "
+            "FROM pitch_accents ORDER BY rowid"
+        )
+        for surface, reading, pattern, goshu, goshu_jp in rows:
+            parsed = patterns.get(pattern)
+            if parsed is None:
+                parsed = (parse_accent_pattern(pattern), "," in pattern)
+                patterns[pattern] = parsed
+
+            entry = (parsed[0], parsed[1], goshu, goshu_jp)
+            entry = entries.setdefault(entry, entry)
+
+            lexicon._by_surface_reading.setdefault((surface, reading), entry)
+
+            first = lexicon._by_surface.get(surface)
+            if first is None or reading < first[0]:
+                lexicon._by_surface[surface] = (reading, entry)
+
+            shortest = lexicon._by_reading.get(reading)
+            if shortest is None or len(surface) < shortest[0]:
+                lexicon._by_reading[reading] = (len(surface), entry)
+
+            lexicon.size += 1
+
+        lexicon._load_unidic(conn)
+        return lexicon
+
+    def _load_unidic(self, conn: sqlite3.Connection) -> None:
+        """Load the unidic_accents table if the build step produced one."""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'unidic_accents'"
+        ).fetchone()
+        if not exists:
+            return
+
+        rows = conn.execute(
+            "SELECT surface, reading, accent, is_word FROM unidic_accents ORDER BY rowid"
+        )
+        for surface, reading, accent, is_word in rows:
+            if is_word:
+                self._unidic_words.setdefault(surface, accent)
+            else:
+                self._unidic_parts.setdefault((surface, reading), accent)
+        self.has_unidic = True
+
+    def unidic_accent(self, surface: str, reading_hira: str) -> int | None:
+        """Precomputed UniDic accent, same semantics as lookup_unidic_accent."""
+        accent = self._unidic_words.get(surface)
+        if accent is None:
+            accent = self._unidic_parts.get((surface, reading_hira))
+        return accent
+
+    def _by_form(self, form: str, reading_hira: str) -> LexiconEntry | None:
+        """Entry for a surface form, preferring the one whose reading matches."""
+        entry = self._by_surface_reading.get((form, reading_hira))
+        if entry is None:
+            first = self._by_surface.get(form)
+            if first is not None:
+                entry = first[1]
+        return entry
+
+    def find(
+        self,
+        surface: str,
+        reading_hira: str,
+        lemma: str | None = None,
+        normalized: str | None = None,
+    ) -> tuple[LexiconEntry, SourceType] | None:
+        """Run the lookup fallback chain (most specific → least specific).
+
+        1. surface + reading (exact) → "dictionary"
+        2. surface only → "dictionary"
+        3. lemma/dictionary form → "dictionary_lemma"
+        4. normalized form → "dictionary_lemma"
+        5. reading only (shortest surface) → "dictionary_reading"
+        """
+        entry = self._by_form(surface, reading_hira)
+        if entry is not None:
+            return entry, "dictionary"
+
+        if lemma and lemma != surface:
+            entry = self._by_form(lemma, reading_hira)
+            if entry is not None:
+                return entry, "dictionary_lemma"
+
+        if normalized and normalized not in (surface, lemma):
+            entry = self._by_form(normalized, reading_hira)
+            if entry is not None:
+                return entry, "dictionary_lemma"
+
+        if reading_hira:
+            shortest = self._by_reading.get(reading_hira)
+            if shortest is not None:
+                return shortest[1], "dictionary_reading"
+
+        return None
@@ -9,6 +9,7 @@ from .mora import count_morae, split_into_morae
 from .patterns import get_pitch_pattern
 from .unidic import lookup_unidic_accent
 from .constants import MAX_HOMOPHONE_LENGTH
+from .lexicon import PitchLexicon
 
 DB_PATH = Path(__file__).parent.parent.parent.parent / "data" / "pitch.db"
 
@@ -53,13 +54,19 @@ def get_db_connection() -> sqlite3.Connection:
     return conn
 
 
+@lru_cache(maxsize=1)
+def get_lexicon() -> PitchLexicon:
+    """Get the in-memory lexicon, loading pitch.db on first use."""
+    return PitchLexicon.from_connection(get_db_connection())
+
+
 def lookup_pitch(
     surface: str,
     reading_hira: str,
     lemma: str | None = None,
     normalized: str | None = None,
 ) -> PitchLookupResult:
-    """Look up pitch accent and goshu in database.
+    """Look up pitch accent and goshu in the in-memory Kanjium lexicon.
 
     Args:
         surface: Word surface form (kanji/kana)
@@ -71,78 +78,19 @@ def lookup_pitch(
         PitchLookupResult with accent_type, goshu, goshu_jp, and source.
     """
     try:
-        conn = get_db_connection()
+        lexicon = get_lexicon()
     except FileNotFoundError:
         return PitchLookupResult(None, None, None, source="unknown")
 
-    cursor = conn.cursor()
-    row = None
-    source: SourceType = "unknown"
-
-    # Fallback chain (most specific → least specific):
-    # 1. surface + reading (exact) → "dictionary"
-    # 2. surface only → "dictionary"
-    # 3. lemma/dictionary form → "dictionary_lemma"
-    # 4. normalized form → "dictionary_lemma"
-    # 5. reading only → "dictionary_reading"
-
-    # 1. Exact match: surface + reading
-    cursor.execute(
-        "SELECT accent_pattern, goshu, goshu_jp FROM pitch_accents WHERE surface = ? AND reading = ? LIMIT 1",
-        (surface, reading_hira)
-    )
-    row = cursor.fetchone()
-    if row:
-        source = "dictionary"
-
-    # 2. Surface only (prefer entry where reading matches)
-    if not row:
-        cursor.execute(
-            "SELECT accent_pattern, goshu, goshu_jp FROM pitch_accents "
-            "WHERE surface = ? ORDER BY (reading = ?) DESC LIMIT 1",
-            (surface, reading_hira)
-        )
-        row = cursor.fetchone()
-        if row:
-            source = "dictionary"
-
-    # 3. Lemma/dictionary form (食べた → 食べる)
-    if not row and lemma and lemma != surface:
-        cursor.execute(
-            "SELECT accent_pattern, goshu, goshu_jp FROM pitch_accents "
-            "WHERE surface = ? ORDER BY (reading = ?) DESC LIMIT 1",
-            (lemma, reading_hira)
-        )
-        row = cursor.fetchone()
-        if row:
-            source = "dictionary_lemma"
-
-    # 4. Normalized form (わたし → 私)
-    if not row and normalized and normalized not in (surface, lemma):
-        cursor.execute(
-            "SELECT accent_pattern, goshu, goshu_jp FROM pitch_accents "
-            "WHERE surface = ? ORDER BY (reading = ?) DESC LIMIT 1",
-            (normalized, reading_hira)
-        )
-        row = cursor.fetchone()
-        if row:
-            source = "dictionary_lemma"
-
-    # 5. Reading only (last resort - prefer shorter surface to avoid compounds)
-    if not row and reading_hira:
-        cursor.execute(
-            "SELECT accent_pattern, goshu, goshu_jp FROM pitch_accents "
-            "WHERE reading = ? ORDER BY LENGTH(surface) ASC LIMIT 1",
-            (reading_hira,)
-        )
-        row = cursor.fetchone()
-        if row:
-            source = "dictionary_reading"
+    match = lexicon.find(surface, reading_hira, lemma, normalized)
 
-    # Get UniDic accent for cross-validation
-    unidic_accent = lookup_unidic_accent(surface, reading_hira)
+    # Get UniDic accent for cross-validation (precomputed table when available)
+    if lexicon.has_unidic:
+        unidic_accent = lexicon.unidic_accent(surface, reading_hira)
+    else:
+        unidic_accent = lookup_unidic_accent(surface, reading_hira)
 
-    if not row:
+    if match is None:
         # No Kanjium match - check if UniDic has data
         if unidic_accent is not None:
             return PitchLookupResult(
@@ -156,17 +104,8 @@ def lookup_pitch(
             )
         return PitchLookupResult(None, None, None, source="unknown")
 
-    # Parse accent pattern (may have multiple values like "0,2")
-    pattern = row["accent_pattern"]
-    has_multiple = "," in pattern
-
-    # Parse ALL accent patterns for cross-validation
-    all_accents: list[int] = []
-    for val in pattern.split(","):
-        try:
-            all_accents.append(int(val.strip()))
-        except ValueError:
-            pass
+    # ALL accent patterns (e.g. "0,2") are pre-parsed for cross-validation
+    (all_accents, has_multiple, goshu, goshu_jp), source = match
 
     # Use first valid accent as the primary
     accent_type = all_accents[0] if all_accents else None
@@ -178,8 +117,8 @@ def lookup_pitch(
 
     return PitchLookupResult(
         accent_type,
-        row["goshu"],
-        row["goshu_jp"],
+        goshu,
+        goshu_jp,
         source=source,
         has_multiple_patterns=has_multiple,
         unidic_accent=unidic_accent,
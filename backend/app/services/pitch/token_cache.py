@@ -0,0 +1,105 @@
+"""Token-level memoization for analyze_text.
+
+The analysis of a single token (lookup, confidence, warnings, compound
+split, pattern generation) depends only on its dictionary entry, so the
+finished WordPitch is memoized per (surface, reading, lemma, normalized
+form, POS). Particles, auxiliaries and frequent nouns then skip lookups
+and compound analysis entirely after the first occurrence.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.config import settings
+from app.models.schemas import WordPitch
+
+# (surface, reading_form, dictionary_form, normalized_form, POS tuple)
+TokenKey = tuple[str, str, str, str, tuple[str, ...]]
+
+
+@dataclass
+class TokenCacheStats:
+    """Token cache statistics."""
+    hits: int = 0
+    misses: int = 0
+    entries: int = 0
+    max_entries: int = 0
+
+
+# LRU of token key → analyzed WordPitch (guarded by _lock)
+_entries: "OrderedDict[TokenKey, WordPitch]" = OrderedDict()
+_stats = TokenCacheStats()
+_lock = threading.Lock()
+
+
+def token_key(token) -> TokenKey:
+    """Build the memoization key for a SudachiPy token."""
+    return (
+        token.surface(),
+        token.reading_form(),
+        token.dictionary_form(),
+        token.normalized_form(),
+        tuple(token.part_of_speech()),
+    )
+
+
+def get_cached_token(key: TokenKey) -> Optional[WordPitch]:
+    """Get a memoized token analysis.
+
+    Returns:
+        A deep copy of the cached WordPitch, or None on miss (or when disabled).
+    """
+    if settings.token_cache_size <= 0:
+        return None
+
+    with _lock:
+        word = _entries.get(key)
+        if word is None:
+            _stats.misses += 1
+            return None
+        _entries.move_to_end(key)
+        _stats.hits += 1
+
+    # Callers get their own deep copy so mutating its lists never reaches the cache
+    return word.model_copy(deep=True)
+
+
+def save_token(key: TokenKey, word: WordPitch) -> None:
+    """Memoize a token analysis, evicting least recently used entries."""
+    max_entries = settings.token_cache_size
+    if max_entries <= 0:
+        return
+
+    with _lock:
+        _entries[key] = word.model_copy(deep=True)
+        _entries.move_to_end(key)
+        while len(_entries) > max_entries:
+            _entries.popitem(last=False)
+
+
+def get_token_cache_stats() -> TokenCacheStats:
+    """Get token cache statistics."""
+    with _lock:
+        return TokenCacheStats(
+            hits=_stats.hits,
+            misses=_stats.misses,
+            entries=len(_entries),
+            max_entries=settings.token_cache_size,
+        )
+
+
+def clear_token_cache() -> int:
+    """Clear memoized tokens and reset stats.
+
+    Returns:
+        Number of cleared entries.
+    """
+    global _stats
+
+    with _lock:
+        cleared = len(_entries)
+        _entries.clear()
+        _stats = TokenCacheStats()
+    return cleared
@@ -1,14 +1,27 @@
 """SudachiPy tokenizer and POS utilities."""
 
+import threading
 from functools import lru_cache
 
 from sudachipy import dictionary
 
+# One tokenizer per thread: a SudachiPy Tokenizer raises SudachiError when
+# two threads tokenize with it at once (analysis executor, default threadpool)
+_local = threading.local()
+
 
 @lru_cache(maxsize=1)
+def _get_dictionary():
+    """Get the cached SudachiPy dictionary, shared by every thread's tokenizer."""
+    return dictionary.Dictionary()
+
+
 def get_tokenizer():
-    """Get cached SudachiPy tokenizer instance."""
-    return dictionary.Dictionary().create()
+    """Get this thread's SudachiPy tokenizer instance."""
+    tok = getattr(_local, "tokenizer", None)
+    if tok is None:
+        tok = _local.tokenizer = _get_dictionary().create()
+    return tok
 
 
 def get_pos(token) -> str:
@@ -24,11 +24,56 @@ def get_unidic_tagger():
         return None
 
 
+def parse_atype(atype) -> int | None:
+    """Parse a UniDic aType field; comma-separated values keep the first."""
+    if atype is None or atype == '*':
+        return None
+    first_value = str(atype).split(',')[0].strip()
+    try:
+        return int(first_value)
+    except ValueError:
+        return None
+
+
+def analyze_unidic_accents(tagger, surface: str) -> list[tuple[str, int, bool]]:
+    """Tag a surface with UniDic and collect its accent candidates.
+
+    Returns:
+        List of (reading_hira, accent, is_word). A single entry with
+        is_word=True means UniDic parsed the surface as one word, whose
+        accent applies whatever the reading. Otherwise there is one entry
+        per sub-token, which only applies when its reading matches.
+    """
+    tokens = list(tagger(surface))
+    if not tokens:
+        return []
+
+    # For single-token words, get the accent directly
+    if len(tokens) == 1:
+        token = tokens[0]
+        # aType is the accent type field in UniDic
+        accent = parse_atype(getattr(token.feature, 'aType', None))
+        if accent is not None:
+            token_reading = getattr(token.feature, 'kana', None) or ""
+            return [(jaconv.kata2hira(token_reading), accent, True)]
+
+    # For multi-token results, keep sub-tokens that can be matched by reading
+    candidates: list[tuple[str, int, bool]] = []
+    for token in tokens:
+        token_reading = getattr(token.feature, 'kana', None)
+        if token_reading:
+            accent = parse_atype(getattr(token.feature, 'aType', None))
+            if accent is not None:
+                candidates.append((jaconv.kata2hira(token_reading), accent, False))
+    return candidates
+
+
 def lookup_unidic_accent(surface: str, reading_hira: str) -> int | None:
     """Look up pitch accent from UniDic via fugashi.
 
     UniDic provides aType (accent type) for words. This serves as a
-    secondary source for cross-validation with Kanjium.
+    secondary source for cross-validation with Kanjium. Used when pitch.db
+    has no precomputed unidic_accents table (see scripts/import_unidic_accents.py).
 
     Returns:
         Accent type (int) or None if not found/unavailable.
@@ -38,37 +83,9 @@ def lookup_unidic_accent(surface: str, reading_hira: str) -> int | None:
         return None
 
     try:
-        # Tokenize the surface form
-        tokens = list(tagger(surface))
-        if not tokens:
-            return None
-
-        # For single-token words, get the accent directly
-        if len(tokens) == 1:
-            token = tokens[0]
-            # aType is the accent type field in UniDic
-            atype = getattr(token.feature, 'aType', None)
-            if atype is not None and atype != '*':
-                # aType can be comma-separated for multiple patterns
-                first_value = str(atype).split(',')[0].strip()
-                try:
-                    return int(first_value)
-                except ValueError:
-                    return None
-
-        # For multi-token results, try to find a match by reading
-        for token in tokens:
-            token_reading = getattr(token.feature, 'kana', None)
-            if token_reading:
-                token_reading_hira = jaconv.kata2hira(token_reading)
-                if token_reading_hira == reading_hira:
-                    atype = getattr(token.feature, 'aType', None)
-                    if atype is not None and atype != '*':
-                        first_value = str(atype).split(',')[0].strip()
-                        try:
-                            return int(first_value)
-                        except ValueError:
-                            continue
+        for token_reading, accent, is_word in analyze_unidic_accents(tagger, surface):
+            if is_word or token_reading == reading_hira:
+                return accent
     except Exception:
         # Don't let UniDic errors break the main flow
         pass
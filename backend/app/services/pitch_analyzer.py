@@ -8,6 +8,7 @@ New code should import directly from app.services.pitch.
 from app.services.pitch import (
     # Main
     analyze_text,
+    iter_analyze_text,
     # Lookup
     lookup_pitch,
     lookup_homophones,
@@ -29,6 +30,10 @@ from app.services.pitch import (
     is_particle_like,
     is_proper_noun,
     get_proper_noun_type,
+    # Token cache
+    get_token_cache_stats,
+    clear_token_cache,
+    TokenCacheStats,
     # Constants
     WARNINGS,
 )
@@ -62,12 +67,14 @@ from app.services.pitch.constants import (
 )
 from app.services.pitch.lookup import (
     get_db_connection,
+    get_lexicon,
     DB_PATH,
 )
 
 __all__ = [
     # Main
     "analyze_text",
+    "iter_analyze_text",
     # Lookup
     "lookup_pitch",
     "lookup_homophones",
@@ -76,6 +83,7 @@ __all__ = [
     "normalize_for_homophone_lookup",
     "PitchLookupResult",
     "get_db_connection",
+    "get_lexicon",
     "DB_PATH",
     # Mora
     "count_morae",
@@ -91,6 +99,10 @@ __all__ = [
     "is_particle_like",
     "is_proper_noun",
     "get_proper_noun_type",
+    # Token cache
+    "get_token_cache_stats",
+    "clear_token_cache",
+    "TokenCacheStats",
     # UniDic
     "UNIDIC_AVAILABLE",
     "get_unidic_tagger",
@@ -0,0 +1,239 @@
+"""Write-behind queue for R2 (cold tier) uploads.
+
+A fresh synthesis is already in memory and Redis by the time it would be
+PUT to R2, so the response shouldn't wait on Cloudflare. save_to_cache
+and friends hand R2 writes to this queue instead; one background thread
+drains it in batches, uploading each batch concurrently.
+
+- Bounded in bytes: when full, put() returns False and the caller writes
+  synchronously (backpressure rather than silently dropping cold data).
+- De-duplicated: a pending write for a key is replaced by a newer one.
+- Failed uploads are retried with exponential backoff up to
+  max_attempts, then counted as failed and dropped.
+- close() stops accepting writes and drains what is pending (retrying
+  without backoff) for up to a deadline; anything left is logged as lost.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from app.core.config import settings
+from app.services.storage import r2_put
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class R2WriteStats:
+    """Write-behind queue counters."""
+    pending: int = 0  # Queued or uploading
+    pending_bytes: int = 0
+    written: int = 0
+    retried: int = 0
+    failed: int = 0  # Gave up after max_attempts
+    overflowed: int = 0  # Queue full, written synchronously by the caller
+    deduplicated: int = 0  # Pending writes replaced by a newer one for the same key
+
+
+@dataclass
+class _PendingWrite:
+    data: bytes
+    content_type: str
+    attempts: int = 0
+    not_before: float = 0.0  # Monotonic time of the next attempt
+
+
+class R2WriteQueue:
+    """Bounded, de-duplicating write-behind queue with retry."""
+
+    def __init__(
+        self,
+        put: Callable[[str, bytes, str], bool],
+        max_bytes: int,
+        batch_size: int = 8,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 0.5,
+    ):
+        self.put_fn = put
+        self.max_bytes = max_bytes
+        self.batch_size = max(1, batch_size)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_seconds = retry_base_seconds
+        self._pending: "OrderedDict[str, _PendingWrite]" = OrderedDict()
+        self._pending_bytes = 0
+        self._in_flight = 0
+        self._in_flight_bytes = 0
+        self._closing = False
+        self._stopped = False  # Drain deadline passed - leave the rest
+        self._cond = threading.Condition()
+        self._stats = R2WriteStats()
+        self._executor = ThreadPoolExecutor(max_workers=self.batch_size, thread_name_prefix="r2-put")
+        self._thread = threading.Thread(target=self._run, name="r2-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, key: str, data: bytes, content_type: str = "audio/wav") -> bool:
+        """Queue an upload.
+
+        Returns:
+            True if queued; False if the queue is full or closing, in which
+            case the caller should write synchronously.
+        """
+        with self._cond:
+            if self._closing:
+                return False
+
+            old = self._pending.pop(key, None)
+            if old is not None:
+                self._pending_bytes -= len(old.data)
+                self._stats.deduplicated += 1
+
+            if self._pending_bytes + self._in_flight_bytes + len(data) > self.max_bytes:
+                self._stats.overflowed += 1
+                return False
+
+            self._pending[key] = _PendingWrite(data, content_type)
+            self._pending_bytes += len(data)
+            self._cond.notify()
+            return True
+
+    def _take_batch(self) -> list[tuple[str, _PendingWrite]]:
+        """Wait for writes that are due and take up to batch_size of them ([] = stop)."""
+        with self._cond:
+            while True:
+                if self._stopped or (self._closing and not self._pending):
+                    return []
+
+                now = time.monotonic()
+                # Draining on shutdown retries without waiting out the backoff
+                due = [
+                    key for key, write in self._pending.items()
+                    if self._closing or write.not_before <= now
+                ][:self.batch_size]
+                if due:
+                    batch = [(key, self._pending.pop(key)) for key in due]
+                    size = sum(len(write.data) for _, write in batch)
+                    self._pending_bytes -= size
+                    self._in_flight += len(batch)
+                    self._in_flight_bytes += size
+                    return batch
+
+                next_due = min((write.not_before for write in self._pending.values()), default=None)
+                self._cond.wait(None if next_due is None else max(next_due - now, 0.0))
+
+    def _upload(self, item: tuple[str, _PendingWrite]) -> bool:
+        key, write = item
+        try:
+            return bool(self.put_fn(key, write.data, write.content_type))
+        except Exception as e:
+            logger.warning(f"R2 write-behind put raised for {key}: {e}")
+            return False
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                self._executor.shutdown(wait=False)
+                return
+
+            results = list(self._executor.map(self._upload, batch))
+
+            with self._cond:
+                now = time.monotonic()
+                for (key, write), ok in zip(batch, results):
+                    self._in_flight -= 1
+                    self._in_flight_bytes -= len(write.data)
+                    if ok:
+                        self._stats.written += 1
+                        continue
+                    if key in self._pending:
+                        continue  # Superseded by a newer write while uploading
+                    write.attempts += 1
+                    if write.attempts >= self.max_attempts:
+                        self._stats.failed += 1
+                        logger.warning(f"R2 write-behind gave up on {key} after {write.attempts} attempts")
+                        continue
+                    write.not_before = now + self.retry_base_seconds * 2 ** (write.attempts - 1)
+                    self._pending[key] = write
+                    self._pending_bytes += len(write.data)
+                    self._stats.retried += 1
+                self._cond.notify_all()
+
+    def stats(self) -> R2WriteStats:
+        with self._cond:
+            return R2WriteStats(
+                pending=len(self._pending) + self._in_flight,
+                pending_bytes=self._pending_bytes + self._in_flight_bytes,
+                written=self._stats.written,
+                retried=self._stats.retried,
+                failed=self._stats.failed,
+                overflowed=self._stats.overflowed,
+                deduplicated=self._stats.deduplicated,
+            )
+
+    def close(self, timeout: float) -> int:
+        """Stop accepting writes and drain the queue for up to timeout seconds.
+
+        Returns:
+            Number of writes still pending (lost) when the deadline passed.
+        """
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        lost = self.stats().pending
+        if lost:
+            logger.warning(f"R2 write-behind drain timed out, {lost} writes not uploaded")
+        return lost
+
+
+# Shared queue (lazy initialization)
+_writer: Optional[R2WriteQueue] = None
+_writer_lock = threading.Lock()
+
+
+def get_r2_writer() -> Optional[R2WriteQueue]:
+    """Get the shared write-behind queue, or None if R2 or write-behind is disabled."""
+    global _writer
+
+    if not settings.r2_enabled or not settings.r2_write_behind:
+        return None
+
+    with _writer_lock:
+        if _writer is None:
+            _writer = R2WriteQueue(
+                r2_put,
+                max_bytes=settings.r2_write_queue_mb * 1024 * 1024,
+                batch_size=settings.r2_write_batch_size,
+                max_attempts=settings.r2_write_max_attempts,
+                retry_base_seconds=settings.r2_write_retry_base_seconds,
+            )
+            logger.info("R2 write-behind queue started")
+        return _writer
+
+
+def get_r2_writer_stats() -> Optional[R2WriteStats]:
+    """Counters of the shared queue, or None if it hasn't started."""
+    with _writer_lock:
+        return _writer.stats() if _writer is not None else None
+
+
+def shutdown_r2_writer() -> None:
+    """Drain and stop the shared queue (called on app shutdown).
+
+    Note: This blocks for up to settings.r2_write_drain_seconds - call via run_in_threadpool.
+    """
+    global _writer
+
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close(settings.r2_write_drain_seconds)
@@ -0,0 +1,236 @@
+"""Per-mora and per-word scoring of a pitch comparison.
+
+The native clip's Azure word boundary events give each word's time span;
+the analyzed text (analyze_text() words with their morae) is laid over
+those spans by character position, and each word's span is split evenly
+between its morae (Japanese morae are roughly isochronous).
+
+The spans then do two jobs:
+- segment_window() restricts DTW to a window around where each mora is
+  expected in the user contour, so alignment costs a fraction of the
+  full N*M matrix and can't smear one mora across the whole recording;
+- score_segments() attributes every cell of the alignment path to the
+  native mora it falls in and scores each mora (and word) separately.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from app.models.schemas import WordPitch
+from app.services.audio_compare import ComparisonResult, path_score
+
+WINDOW_MARGIN = 20  # Voiced frames (~200ms) of slack either side of a mora's expected position
+
+
+@dataclass
+class MoraSegment:
+    """One mora of the native clip and how well the user matched it."""
+    mora: str
+    word_index: int  # Index into the analyzed words
+    start_ms: float  # Position in the native clip
+    end_ms: float
+    score: Optional[int] = None  # None if the native mora has no voiced frames (e.g. devoiced)
+    user_start_ms: Optional[float] = None  # Aligned span in the user recording
+    user_end_ms: Optional[float] = None
+
+
+@dataclass
+class WordSegment:
+    """One word of the native clip and its combined score."""
+    surface: str
+    start_ms: float
+    end_ms: float
+    score: Optional[int] = None
+
+
+@dataclass
+class SegmentedComparisonResult(ComparisonResult):
+    """Comparison with per-mora and per-word scores."""
+    morae: list[MoraSegment] = field(default_factory=list)
+    words: list[WordSegment] = field(default_factory=list)
+
+
+def _char_times(text: str, word_timings: list[dict], duration_ms: float) -> tuple[np.ndarray, np.ndarray]:
+    """Anchor character positions in text to times in the clip.
+
+    Each Azure word found in text contributes (first char, offset) and
+    (end char, offset + duration); a missing duration runs to the next
+    word. Without any usable boundary the whole text spans the clip.
+    """
+    located = []
+    cursor = 0
+    for timing in word_timings:
+        word = timing["text"]
+        pos = text.find(word, cursor) if word else -1
+        if pos < 0:
+            continue
+        located.append((pos, pos + len(word), timing["offset_ms"], timing.get("duration_ms") or 0.0))
+        cursor = pos + len(word)
+
+    if not located:
+        return np.array([0.0, len(text)]), np.array([0.0, duration_ms])
+
+    chars, times = [], []
+    for i, (start_char, end_char, offset_ms, word_ms) in enumerate(located):
+        if word_ms <= 0:
+            word_ms = (located[i + 1][2] if i + 1 < len(located) else duration_ms) - offset_ms
+        chars += [start_char, end_char]
+        times += [offset_ms, offset_ms + max(word_ms, 0.0)]
+
+    # Keep anchors monotonic for interpolation
+    return np.asarray(chars, dtype=float), np.maximum.accumulate(np.asarray(times, dtype=float))
+
+
+def mora_segments(
+    text: str,
+    words: list[WordPitch],
+    word_timings: list[dict],
+    duration_ms: float,
+) -> list[MoraSegment]:
+    """Time span of every mora in the native clip.
+
+    Args:
+        text: Text that was synthesized.
+        words: analyze_text() output for text.
+        word_timings: Azure word boundaries (text, offset_ms, duration_ms).
+        duration_ms: Length of the native clip.
+
+    Returns:
+        One MoraSegment (unscored) per mora, in order.
+    """
+    anchor_chars, anchor_times = _char_times(text, word_timings, duration_ms)
+
+    segments: list[MoraSegment] = []
+    cursor = 0
+    for word_index, word in enumerate(words):
+        pos = text.find(word.surface, cursor) if word.surface else -1
+        if pos < 0:
+            continue
+        cursor = pos + len(word.surface)
+        if not word.morae:
+            continue  # Punctuation, symbols, latin
+
+        start_ms, end_ms = np.interp([pos, cursor], anchor_chars, anchor_times)
+        bounds = np.linspace(start_ms, end_ms, len(word.morae) + 1)
+        segments.extend(
+            MoraSegment(mora=mora, word_index=word_index, start_ms=float(a), end_ms=float(b))
+            for mora, a, b in zip(word.morae, bounds[:-1], bounds[1:])
+        )
+    return segments
+
+
+def voiced_segment_index(native_curve: list[float], segments: list[MoraSegment], time_step_ms: int = 10) -> np.ndarray:
+    """Mora segment of each voiced native frame (-1 if it falls outside every mora)."""
+    frames = np.flatnonzero(np.asarray(native_curve) > 0)
+    if not segments:
+        return np.full(len(frames), -1)
+
+    times = frames * time_step_ms
+    starts = np.array([segment.start_ms for segment in segments])
+    ends = np.array([segment.end_ms for segment in segments])
+    index = np.searchsorted(starts, times, side="right") - 1
+    inside = (index >= 0) & (times < ends[np.maximum(index, 0)])
+    return np.where(inside, index, -1)
+
+
+def segment_window(segment_index: np.ndarray, m: int, margin: int = WINDOW_MARGIN) -> tuple[np.ndarray, np.ndarray]:
+    """DTW window around each mora's expected position in the user contour.
+
+    Native voiced frames of a mora may align with the user frames where
+    that mora would be if the user spoke at a uniform tempo (scaled by
+    the length ratio), plus margin on either side. Frames outside every
+    mora get a plain band around the scaled diagonal.
+
+    Args:
+        segment_index: voiced_segment_index() of the native contour.
+        m: Number of user voiced frames.
+        margin: Slack in user frames around each expected span.
+
+    Returns:
+        (lo, hi) inclusive user frame bounds per native frame, valid for dtw().
+    """
+    n = len(segment_index)
+    ratio = m / n
+    rows = np.arange(n)
+
+    # Native row span [first, last + 1) of each row's mora (or of the row itself)
+    first = rows.copy()
+    last = rows + 1
+    for segment in np.unique(segment_index[segment_index >= 0]):
+        members = np.flatnonzero(segment_index == segment)
+        first[members] = members[0]
+        last[members] = members[-1] + 1
+
+    lo = np.clip(np.floor(first * ratio).astype(np.int64) - margin, 0, m - 1)
+    hi = np.clip(np.ceil(last * ratio).astype(np.int64) - 1 + margin, 0, m - 1)
+    lo[0], hi[-1] = 0, m - 1
+
+    # Monotonic bounds, and each row reachable from the previous one
+    lo = np.maximum.accumulate(lo)
+    hi = np.maximum.accumulate(hi)
+    lo[1:] = np.minimum(lo[1:], hi[:-1] + 1)
+    return lo, hi
+
+
+def score_segments(
+    result: ComparisonResult,
+    segment_index: np.ndarray,
+    segments: list[MoraSegment],
+    words: list[WordPitch],
+    user_curve: list[float],
+    user_offset_ms: int = 0,
+    time_step_ms: int = 10,
+) -> SegmentedComparisonResult:
+    """Score each mora and word from the alignment path.
+
+    Every path cell belongs to the mora of its native frame; a mora's
+    score is path_score() over its cells (the same formula as the
+    overall score), and a word's over the cells of all its morae.
+
+    Args:
+        result: Comparison of the voiced contours.
+        segment_index: voiced_segment_index() of the native contour.
+        segments: mora_segments() of the native clip.
+        words: analyze_text() words the segments refer to.
+        user_curve: User full curve (0 for unvoiced), to time user spans.
+        user_offset_ms: Where user_curve starts in the recording (VAD trim).
+
+    Returns:
+        SegmentedComparisonResult with scored morae and words.
+    """
+    native_idx, user_idx = np.asarray(result.alignment_path).T
+    costs = np.abs(np.asarray(result.aligned_native) - np.asarray(result.aligned_user))
+    cell_segment = segment_index[native_idx]
+    in_segment = cell_segment >= 0
+
+    k = len(segments)
+    sums = np.bincount(cell_segment[in_segment], weights=costs[in_segment], minlength=k)
+    counts = np.bincount(cell_segment[in_segment], minlength=k)
+
+    user_frames = np.flatnonzero(np.asarray(user_curve) > 0)
+    user_ms = user_frames[user_idx] * time_step_ms + user_offset_ms
+
+    morae = []
+    for i, segment in enumerate(segments):
+        scored = MoraSegment(**vars(segment))
+        if counts[i]:
+            scored.score = path_score(sums[i], counts[i])
+            aligned = user_ms[cell_segment == i]
+            scored.user_start_ms = float(aligned.min())
+            scored.user_end_ms = float(aligned.max() + time_step_ms)
+        morae.append(scored)
+
+    word_segments = []
+    for word_index in dict.fromkeys(segment.word_index for segment in segments):
+        members = [i for i, segment in enumerate(segments) if segment.word_index == word_index]
+        total = counts[members].sum()
+        word_segments.append(WordSegment(
+            surface=words[word_index].surface,
+            start_ms=segments[members[0]].start_ms,
+            end_ms=segments[members[-1]].end_ms,
+            score=path_score(sums[members].sum(), total) if total else None,
+        ))
+
+    return SegmentedComparisonResult(**vars(result), morae=morae, words=word_segments)
@@ -0,0 +1,81 @@
+"""Synthetic pitch targets built from pitch accent analysis.
+
+Turns analyze_text() output (per-word morae and H/L pitch_pattern) into
+an expected relative F0 contour on the 10ms frame grid, so a recording
+can be scored without synthesizing native audio. Only the shape
+matters: compare_pitch() z-scores the target like any native contour.
+
+The model is deliberately simple:
+- each mora is a level (H = current register, L = 0) held for a fixed
+  number of frames, with short smoothed transitions between levels;
+- words without a pattern (particles, auxiliaries) continue the
+  preceding word: high after heiban, low after an accent fall;
+- after every accented word the register steps down (downstep), as
+  later phrases are pronounced lower.
+"""
+
+import numpy as np
+
+from app.models.schemas import WordPitch
+
+FRAMES_PER_MORA = 12  # ~120ms per mora at 10ms frames
+TRANSITION_FRAMES = 5  # Smoothing window for H/L transitions
+DOWNSTEP = 0.8  # Register scale after each accented word
+
+
+def mora_levels(words: list[WordPitch]) -> list[float]:
+    """Relative pitch level per mora for an analyzed sentence.
+
+    Args:
+        words: analyze_text() output.
+
+    Returns:
+        One level per mora (0 = low, up to 1 = high in the first phrase).
+    """
+    levels: list[float] = []
+    register = 1.0
+    follow_high = False  # Level an unpatterned word continues at
+
+    for word in words:
+        if word.mora_count <= 0:
+            continue  # Punctuation, symbols, latin
+
+        if not word.pitch_pattern:
+            levels.extend([register if follow_high else 0.0] * word.mora_count)
+            continue
+
+        levels.extend(register if level == "H" else 0.0 for level in word.pitch_pattern)
+        accented = word.accent_type not in (None, 0)
+        follow_high = not accented
+        if accented:
+            register *= DOWNSTEP
+
+    return levels
+
+
+def build_target_contour(words: list[WordPitch], frames_per_mora: int = FRAMES_PER_MORA) -> list[float]:
+    """Expected relative F0 contour for a sentence, one value per frame.
+
+    Args:
+        words: analyze_text() output.
+        frames_per_mora: Frames each mora is held for.
+
+    Returns:
+        Relative pitch values (arbitrary units; shape only).
+
+    Raises:
+        ValueError: If the text has no morae to build a target from.
+    """
+    levels = mora_levels(words)
+    if not levels:
+        raise ValueError("No Japanese morae to build a pitch target from")
+
+    contour = np.repeat(np.asarray(levels), frames_per_mora)
+
+    # Moving average (edge-padded) so level changes glide like real F0
+    if len(contour) > TRANSITION_FRAMES:
+        padded = np.pad(contour, TRANSITION_FRAMES // 2, mode="edge")
+        kernel = np.ones(TRANSITION_FRAMES) / TRANSITION_FRAMES
+        contour = np.convolve(padded, kernel, mode="valid")
+
+    return contour.tolist()
@@ -2,12 +2,35 @@
 
 import asyncio
 import html
+import logging
 import re
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
 import azure.cognitiveservices.speech as speechsdk
 
 from app.core.config import settings
-from app.services.cache import get_cached_audio, save_to_cache
+from app.services.audio_compare import TimedPitch
+from app.services.audio_pool import extract_pitch_in_pool
+from app.services.cache import (
+    get_cache_key,
+    get_cached_audio,
+    get_cached_audio_async,
+    get_cached_audio_by_key,
+    get_cached_audio_by_key_async,
+    save_to_cache,
+    get_cached_pitch_by_key_async,
+    get_cached_pitch_many_async,
+    save_pitch_by_key,
+    get_cached_timings_by_key,
+    save_timings_by_key,
+    single_flight,
+    single_flight_async,
+)
+from app.services.tts_pool import SynthesizerPool
+
+logger = logging.getLogger(__name__)
 
 
 class TTSError(Exception):
@@ -50,6 +73,64 @@ def _create_synthesizer(voice_name: str) -> speechsdk.SpeechSynthesizer:
     )
 
 
+# Synthesizer pool (lazy initialization)
+_synthesizer_pool: Optional[SynthesizerPool] = None
+_synthesizer_pool_lock = threading.Lock()
+
+
+def get_synthesizer_pool() -> Optional[SynthesizerPool]:
+    """Get the shared synthesizer pool, or None if pooling is disabled."""
+    global _synthesizer_pool
+
+    if settings.tts_pool_size <= 0:
+        return None
+
+    with _synthesizer_pool_lock:
+        if _synthesizer_pool is None:
+            _synthesizer_pool = SynthesizerPool(
+                _create_synthesizer,
+                size=settings.tts_pool_size,
+                max_idle_seconds=settings.tts_pool_max_idle_seconds,
+            )
+        return _synthesizer_pool
+
+
+def warm_synthesizer_pool() -> int:
+    """Open pooled connections for every voice (called on app startup).
+
+    Note: This is synchronous - call via run_in_threadpool.
+
+    Returns:
+        Number of synthesizers connected (0 without a key or pool).
+    """
+    pool = get_synthesizer_pool()
+    if pool is None or not settings.azure_speech_key:
+        return 0
+    return pool.warm(info["name"] for info in AZURE_VOICES.values())
+
+
+def shutdown_synthesizer_pool() -> None:
+    """Close the shared synthesizer pool (called on app shutdown)."""
+    global _synthesizer_pool
+
+    with _synthesizer_pool_lock:
+        if _synthesizer_pool is not None:
+            _synthesizer_pool.close()
+            _synthesizer_pool = None
+
+
+@contextmanager
+def _synthesizer(voice_name: str) -> Iterator[speechsdk.SpeechSynthesizer]:
+    """Borrow a pooled synthesizer for one synthesis (a new one if pooling is disabled)."""
+    pool = get_synthesizer_pool()
+    if pool is None:
+        yield _create_synthesizer(voice_name)
+        return
+
+    with pool.synthesizer(voice_name) as synthesizer:
+        yield synthesizer
+
+
 def _run_synthesis(
     synthesizer: speechsdk.SpeechSynthesizer,
     ssml: str
@@ -203,6 +284,26 @@ def add_breaks_between_words(text: str, break_ms: int = 200, escape: bool = True
     return result
 
 
+def _cache_params(rate: float, pitch: float, volume: float) -> str:
+    """TTS parameters as a cache key string (rate_pitch_volume)."""
+    return f"{rate:.2f}_{pitch:.1f}_{volume:.1f}"
+
+
+def tts_cache_key(
+    text: str,
+    voice: str = DEFAULT_FEMALE,
+    rate: float = 1.0,
+    pitch: float = 0.0,
+    volume: float = 0.0,
+) -> str:
+    """Stable content key of synthesized audio (same key synthesize_speech caches under).
+
+    Returned to clients by the TTS endpoints so they can reference the
+    clip later (e.g. in /api/compare) without it being re-synthesized.
+    """
+    return get_cache_key(text, voice, _cache_params(rate, pitch, volume))
+
+
 def synthesize_speech(
     text: str,
     voice: str = DEFAULT_FEMALE,
@@ -222,32 +323,143 @@ def synthesize_speech(
         is_ssml: If True, text contains pre-escaped SSML tags (skip escaping).
 
     Returns:
-        Tuple of (WAV audio data, from_cache boolean).
+        Tuple of (WAV audio data, from_cache boolean). Audio synthesized
+        by a concurrent identical request (see cache.single_flight)
+        counts as from cache.
 
     Raises:
         TTSError: If synthesis fails.
     """
     # Check cache first (use string key to avoid float collision)
-    cache_key_params = f"{rate:.2f}_{pitch:.1f}_{volume:.1f}"
-    cached = get_cached_audio(text, voice, cache_key_params)
+    cached = get_cached_audio(text, voice, _cache_params(rate, pitch, volume))
     if cached:
         return cached, True
 
+    return _synthesize_uncached(text, voice, rate, pitch, volume, is_ssml)
+
+
+def _synthesis_loader(
+    text: str,
+    voice: str,
+    rate: float,
+    pitch: float,
+    volume: float,
+    is_ssml: bool,
+) -> tuple[str, Callable[[], bytes]]:
+    """Cache key and loader (synthesize, then cache) for a synthesis miss."""
+    cache_key_params = _cache_params(rate, pitch, volume)
     voice_name = _resolve_voice_name(voice)
 
-    try:
-        synthesizer = _create_synthesizer(voice_name)
-        ssml = _build_ssml(text, voice_name, rate, pitch, volume, escape_text=not is_ssml)
-        result = _run_synthesis(synthesizer, ssml)
-        audio_data = result.audio_data
-        # Save to cache
-        save_to_cache(text, voice, cache_key_params, audio_data)
-        return audio_data, False
+    def synthesize() -> bytes:
+        try:
+            ssml = _build_ssml(text, voice_name, rate, pitch, volume, escape_text=not is_ssml)
+            with _synthesizer(voice_name) as synthesizer:
+                result = _run_synthesis(synthesizer, ssml)
+            audio_data = result.audio_data
+            # Save to cache
+            save_to_cache(text, voice, cache_key_params, audio_data)
+            return audio_data
 
-    except TTSError:
-        raise
-    except Exception as e:
-        raise TTSError(f"Azure Speech synthesis failed: {str(e)}")
+        except TTSError:
+            raise
+        except Exception as e:
+            raise TTSError(f"Azure Speech synthesis failed: {str(e)}")
+
+    return get_cache_key(text, voice, cache_key_params), synthesize
+
+
+def _synthesize_uncached(
+    text: str,
+    voice: str,
+    rate: float,
+    pitch: float,
+    volume: float,
+    is_ssml: bool,
+) -> tuple[bytes, bool]:
+    """Miss path of synthesize_speech: synthesize (coalesced per key) and cache."""
+    # One synthesis per key for concurrent misses
+    return single_flight(*_synthesis_loader(text, voice, rate, pitch, volume, is_ssml))
+
+
+async def get_native_pitch_by_key(cache_key: str, audio_data: Optional[bytes] = None) -> Optional[TimedPitch]:
+    """Get the pitch contour of cached TTS audio by its content key.
+
+    Tries the cached contour first, then the audio (audio_data if given,
+    else the cached clip) extracted in the audio process pool with
+    settings.native_pitch_engine; a freshly extracted contour is cached
+    next to the audio.
+
+    Args:
+        cache_key: Content key from tts_cache_key().
+        audio_data: The clip's WAV bytes, if the caller already has them.
+
+    Returns:
+        TimedPitch, or None if neither contour nor audio is cached (and
+        audio_data was not given).
+
+    Raises:
+        CompareError: If pitch extraction fails.
+        AudioTaskTimeout: If extraction exceeds the audio task timeout.
+    """
+    engine = settings.native_pitch_engine
+    cached = await get_cached_pitch_by_key_async(cache_key, engine)
+    if cached is not None:
+        return cached
+
+    if audio_data is None:
+        audio_data = await get_cached_audio_by_key_async(cache_key)
+        if audio_data is None:
+            return None
+
+    timed_pitch = await extract_pitch_in_pool(audio_data, engine)
+    await asyncio.to_thread(save_pitch_by_key, cache_key, timed_pitch, engine)
+    return timed_pitch
+
+
+async def get_native_pitch(
+    text: str,
+    audio_data: bytes,
+    voice: str = DEFAULT_FEMALE,
+    rate: float = 1.0,
+    pitch: float = 0.0,
+    volume: float = 0.0,
+) -> TimedPitch:
+    """Get the pitch contour of synthesized audio, cached next to the audio.
+
+    On a cache miss the contour is extracted in the audio process pool
+    with settings.native_pitch_engine. Contours are cached per engine so
+    switching engines never serves the other's curves.
+
+    Args:
+        text: Text that was synthesized.
+        audio_data: WAV audio returned by synthesize_speech for the same
+            text/voice/params.
+        voice: Voice key used for synthesis.
+        rate: Speech rate used for synthesis.
+        pitch: Pitch adjustment used for synthesis.
+        volume: Volume adjustment used for synthesis.
+
+    Returns:
+        TimedPitch of the native audio.
+
+    Raises:
+        CompareError: If pitch extraction fails.
+        AudioTaskTimeout: If extraction exceeds the audio task timeout.
+    """
+    cache_key = tts_cache_key(text, voice, rate, pitch, volume)
+    return await get_native_pitch_by_key(cache_key, audio_data)
+
+
+async def get_cached_native_pitches(text: str, voices: list[str], rate: float = 1.0) -> dict[str, TimedPitch]:
+    """Cached pitch contours of text in several voices, in one Redis round trip.
+
+    Returns:
+        Dict of voice → TimedPitch for the voices whose contour is cached
+        (with settings.native_pitch_engine); the rest need synthesis.
+    """
+    keys = {voice: tts_cache_key(text, voice, rate) for voice in voices}
+    cached = await get_cached_pitch_many_async(list(keys.values()), settings.native_pitch_engine)
+    return {voice: cached[key] for voice, key in keys.items() if key in cached}
 
 
 async def synthesize_speech_async(
@@ -258,19 +470,17 @@ async def synthesize_speech_async(
     volume: float = 0.0,
     is_ssml: bool = False,
 ) -> tuple[bytes, bool]:
-    """Async wrapper for synthesize_speech.
+    """Async synthesize_speech.
 
-    Azure SDK is synchronous, so this wraps the sync function.
+    Cache hits are served on the event loop (memory, asyncio Redis);
+    only a miss takes a thread, since the Azure SDK is synchronous, and
+    concurrent misses on one key share that thread (single_flight_async).
     """
-    return await asyncio.to_thread(
-        synthesize_speech,
-        text=text,
-        voice=voice,
-        rate=rate,
-        pitch=pitch,
-        volume=volume,
-        is_ssml=is_ssml,
-    )
+    cached = await get_cached_audio_async(text, voice, _cache_params(rate, pitch, volume))
+    if cached:
+        return cached, True
+
+    return await single_flight_async(*_synthesis_loader(text, voice, rate, pitch, volume, is_ssml))
 
 
 def get_available_voices() -> dict[str, dict]:
@@ -292,9 +502,9 @@ def check_azure_health() -> bool:
 
     try:
         voice_name = _resolve_voice_name(DEFAULT_FEMALE)
-        synthesizer = _create_synthesizer(voice_name)
         ssml = _build_ssml("あ", voice_name)
-        _run_synthesis(synthesizer, ssml)
+        with _synthesizer(voice_name) as synthesizer:
+            _run_synthesis(synthesizer, ssml)
         return True
     except Exception:
         return False
@@ -353,10 +563,14 @@ def synthesize_speech_with_timings(
         ))
 
     try:
-        synthesizer = _create_synthesizer(voice_name)
-        synthesizer.synthesis_word_boundary.connect(on_word_boundary)
         ssml = _build_ssml(text, voice_name, rate)
-        result = _run_synthesis(synthesizer, ssml)
+        with _synthesizer(voice_name) as synthesizer:
+            synthesizer.synthesis_word_boundary.connect(on_word_boundary)
+            try:
+                result = _run_synthesis(synthesizer, ssml)
+            finally:
+                # Pooled synthesizers are reused - don't leave this request's handler attached
+                synthesizer.synthesis_word_boundary.disconnect_all()
         audio_data = result.audio_data
         timings = [wt.to_dict() for wt in word_timings]
         return audio_data, timings
@@ -365,3 +579,38 @@ def synthesize_speech_with_timings(
         raise
     except Exception as e:
         raise TTSError(f"Azure Speech synthesis with timings failed: {str(e)}")
+
+
+def get_speech_timings(
+    text: str,
+    voice: str = DEFAULT_FEMALE,
+    rate: float = 1.0,
+) -> tuple[bytes, list[dict]]:
+    """Audio and word boundary timings for text, cached under the clip's key.
+
+    The SSML is the same as synthesize_speech() with default pitch and
+    volume, so the audio (and any pitch contour cached for it) is shared
+    with the plain TTS path; only the timings are stored additionally.
+
+    Args:
+        text: Japanese text to synthesize.
+        voice: Voice key (female1-4, male1-3).
+        rate: Speech rate (0.5 to 2.0, default 1.0).
+
+    Returns:
+        Tuple of (WAV audio data, list of word timings).
+
+    Raises:
+        TTSError: If synthesis fails.
+    """
+    cache_key = tts_cache_key(text, voice, rate)
+    timings = get_cached_timings_by_key(cache_key)
+    if timings is not None:
+        audio_data = get_cached_audio_by_key(cache_key)
+        if audio_data:
+            return audio_data, timings
+
+    audio_data, timings = synthesize_speech_with_timings(text, voice, rate)
+    save_to_cache(text, voice, _cache_params(rate, 0.0, 0.0), audio_data)
+    save_timings_by_key(cache_key, timings)
+    return audio_data, timings
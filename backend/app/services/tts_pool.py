@@ -0,0 +1,178 @@
+"""Per-voice pool of long-lived Azure speech synthesizers.
+
+Creating a SpeechSynthesizer per request means every cache miss opens a
+new websocket to Azure (DNS, TLS, auth) before synthesis can start. The
+pool keeps up to `size` idle synthesizers per voice with their
+connection already open, so a miss only pays for synthesis.
+
+A synthesizer leaves the pool for the duration of one synthesis (the SDK
+object is not safe for concurrent speak calls) and goes back only if it
+is still healthy:
+- any exception while checked out (including TTSError) evicts it;
+- Azure closing its connection (Connection.disconnected) marks it
+  unhealthy, and it is dropped at the next checkout;
+- so is one left idle longer than max_idle_seconds, since the service
+  drops idle connections anyway.
+
+When every pooled synthesizer of a voice is busy a new one is created;
+it is kept on return only while the voice has fewer than `size` idle.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import azure.cognitiveservices.speech as speechsdk
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SynthesizerPoolStats:
+    """Pool counters."""
+    idle: int = 0  # Pre-connected synthesizers waiting, all voices
+    created: int = 0
+    reused: int = 0
+    evicted: int = 0  # Failed, disconnected or idle too long
+
+
+class _PooledSynthesizer:
+    """A synthesizer, its open connection and health state."""
+
+    def __init__(self, synthesizer: Any, connection: Optional[Any]):
+        self.synthesizer = synthesizer
+        self.connection = connection
+        self.healthy = True
+        self.idle_since = time.monotonic()
+
+    def mark_unhealthy(self, _evt: Any = None) -> None:
+        self.healthy = False
+
+    def close(self) -> None:
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+
+
+class SynthesizerPool:
+    """Bounded per-voice pool of pre-connected synthesizers."""
+
+    def __init__(self, factory: Callable[[str], Any], size: int, max_idle_seconds: float):
+        self.factory = factory
+        self.size = size
+        self.max_idle_seconds = max_idle_seconds
+        self._idle: dict[str, list[_PooledSynthesizer]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._created = 0
+        self._reused = 0
+        self._evicted = 0
+
+    def _connect(self, voice_name: str) -> _PooledSynthesizer:
+        """Create a synthesizer for voice_name and open its connection up front."""
+        pooled = _PooledSynthesizer(self.factory(voice_name), None)
+        try:
+            connection = speechsdk.Connection.from_speech_synthesizer(pooled.synthesizer)
+            connection.disconnected.connect(pooled.mark_unhealthy)
+            connection.open(True)
+            pooled.connection = connection
+        except Exception as e:
+            # Still usable: the SDK connects lazily on the first speak call
+            logger.warning(f"Pre-connecting {voice_name} synthesizer failed: {e}")
+        with self._lock:
+            self._created += 1
+        return pooled
+
+    def _is_fresh(self, pooled: _PooledSynthesizer) -> bool:
+        return pooled.healthy and time.monotonic() - pooled.idle_since <= self.max_idle_seconds
+
+    def _checkout(self, voice_name: str) -> _PooledSynthesizer:
+        stale = []
+        pooled = None
+        with self._lock:
+            idle = self._idle.get(voice_name, [])
+            while idle:
+                candidate = idle.pop()  # Most recently used first
+                if self._is_fresh(candidate):
+                    pooled = candidate
+                    self._reused += 1
+                    break
+                stale.append(candidate)
+            self._evicted += len(stale)
+
+        for candidate in stale:
+            candidate.close()
+        return pooled if pooled is not None else self._connect(voice_name)
+
+    def _checkin(self, voice_name: str, pooled: _PooledSynthesizer) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(voice_name, [])
+            keep = pooled.healthy and not self._closed and len(idle) < self.size
+            if keep:
+                pooled.idle_since = time.monotonic()
+                idle.append(pooled)
+            elif not pooled.healthy:
+                self._evicted += 1
+        if not keep:
+            pooled.close()
+
+    @contextmanager
+    def synthesizer(self, voice_name: str) -> Iterator[Any]:
+        """Check out a synthesizer for voice_name for one synthesis.
+
+        It returns to the pool when the block exits normally; if the
+        block raises, it is closed and evicted.
+        """
+        pooled = self._checkout(voice_name)
+        try:
+            yield pooled.synthesizer
+        except BaseException:
+            pooled.mark_unhealthy()
+            self._checkin(voice_name, pooled)
+            raise
+        self._checkin(voice_name, pooled)
+
+    def warm(self, voice_names: Iterable[str]) -> int:
+        """Fill the pool to `size` idle synthesizers per voice, connecting in parallel.
+
+        Returns:
+            Number of synthesizers added.
+        """
+        with self._lock:
+            missing = [
+                voice_name
+                for voice_name in dict.fromkeys(voice_names)
+                for _ in range(self.size - len(self._idle.get(voice_name, [])))
+            ]
+        if not missing:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=min(len(missing), 8), thread_name_prefix="tts-warm") as executor:
+            created = list(executor.map(self._connect, missing))
+        for voice_name, pooled in zip(missing, created):
+            self._checkin(voice_name, pooled)
+        return len(created)
+
+    def stats(self) -> SynthesizerPoolStats:
+        with self._lock:
+            return SynthesizerPoolStats(
+                idle=sum(len(idle) for idle in self._idle.values()),
+                created=self._created,
+                reused=self._reused,
+                evicted=self._evicted,
+            )
+
+    def close(self) -> None:
+        """Close every idle synthesizer; checked-out ones are closed on return."""
+        with self._lock:
+            self._closed = True
+            idle = [pooled for pooled_list in self._idle.values() for pooled in pooled_list]
+            self._idle.clear()
+        for pooled in idle:
+            pooled.close()
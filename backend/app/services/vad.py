@@ -0,0 +1,89 @@
+"""Energy / zero-crossing voice activity detection for edge trimming.
+
+Uploaded recordings often start and end with a second or more of
+silence or room noise. speech_bounds() finds where speech starts and
+stops so pitch tracking (and the DTW after it) only covers the spoken
+part. Everything is vectorized over non-overlapping 10ms frames.
+
+Only the edges are trimmed - pauses inside the utterance are kept so
+the pitch timeline between first and last speech is unchanged.
+"""
+
+import numpy as np
+
+FRAME_MS = 10
+
+
+def frame_features(samples: np.ndarray, sample_rate: int, frame_ms: int = FRAME_MS) -> tuple[np.ndarray, np.ndarray]:
+    """Per-frame energy (dB) and zero-crossing rate.
+
+    Args:
+        samples: Mono samples in [-1, 1].
+        sample_rate: Sampling rate (Hz).
+        frame_ms: Frame length; a trailing partial frame is dropped.
+
+    Returns:
+        Tuple of (energy in dBFS, fraction of sign changes) per frame.
+    """
+    frame_len = max(1, sample_rate * frame_ms // 1000)
+    n_frames = len(samples) // frame_len
+    frames = np.asarray(samples[:n_frames * frame_len], dtype=float).reshape(n_frames, frame_len)
+
+    energy_db = 10.0 * np.log10(np.mean(frames ** 2, axis=1) + 1e-12)
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1) if frame_len > 1 else np.zeros(n_frames)
+    return energy_db, zcr
+
+
+def speech_bounds(
+    samples: np.ndarray,
+    sample_rate: int,
+    noise_margin_db: float = 12.0,
+    dynamic_range_db: float = 45.0,
+    fricative_zcr: float = 0.3,
+    min_speech_ms: int = 50,
+    pad_ms: int = 100,
+) -> tuple[int, int]:
+    """Sample range [start, end) that contains the speech in a recording.
+
+    A frame counts as speech if it is noise_margin_db above the noise
+    floor (10th percentile energy) and within dynamic_range_db of the
+    loudest frame. Quieter frames with a high zero-crossing rate
+    (fricatives like s/sh) count too, as long as they are half the
+    margin above the floor. The first and last runs of at least
+    min_speech_ms of speech set the bounds, padded by pad_ms so the pitch
+    tracker's analysis window has context.
+
+    Args:
+        samples: Mono samples in [-1, 1].
+        sample_rate: Sampling rate (Hz).
+
+    Returns:
+        (start, end) sample indices; (0, len(samples)) when no speech is
+        found, so the caller falls back to analyzing everything.
+    """
+    n = len(samples)
+    energy_db, zcr = frame_features(samples, sample_rate)
+    if len(energy_db) == 0:
+        return 0, n
+
+    floor = np.percentile(energy_db, 10)
+    threshold = max(floor + noise_margin_db, energy_db.max() - dynamic_range_db)
+    speech = (energy_db > threshold) | (
+        (zcr > fricative_zcr) & (energy_db > floor + noise_margin_db / 2)
+    )
+
+    # Ignore clicks: require min_speech_ms of consecutive speech frames
+    run = max(1, min_speech_ms // FRAME_MS)
+    if len(speech) < run:
+        return 0, n
+    sustained = np.convolve(speech, np.ones(run, dtype=int), mode="valid") == run
+    starts = np.flatnonzero(sustained)
+    if len(starts) == 0:
+        return 0, n
+
+    frame_len = max(1, sample_rate * FRAME_MS // 1000)
+    pad = sample_rate * pad_ms // 1000
+    start = max(0, int(starts[0]) * frame_len - pad)
+    end = min(n, (int(starts[-1]) + run) * frame_len + pad)
+    return start, end
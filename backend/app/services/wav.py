@@ -0,0 +1,119 @@
+"""In-memory WAV decoding.
+
+Parses the RIFF container directly and views the PCM payload with
+np.frombuffer, so audio can be handed to Parselmouth as samples instead
+of being written to a temp file and re-read from disk.
+"""
+
+import struct
+from dataclasses import dataclass
+
+import numpy as np
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class WavFormatError(ValueError):
+    """WAV data is malformed or uses an unsupported encoding."""
+    pass
+
+
+@dataclass
+class WavAudio:
+    """Decoded WAV audio."""
+    samples: np.ndarray  # float64, shape (channels, frames), range [-1, 1]
+    sample_rate: int
+
+    @property
+    def duration_ms(self) -> int:
+        return int(self.samples.shape[1] * 1000 / self.sample_rate)
+
+
+def _pcm_to_float(payload: memoryview, format_tag: int, bits: int) -> np.ndarray:
+    """Convert a PCM payload to float64 samples, scaled like Praat's reader."""
+    if format_tag == WAVE_FORMAT_IEEE_FLOAT:
+        if bits == 32:
+            return np.frombuffer(payload, dtype="<f4").astype(np.float64)
+        if bits == 64:
+            return np.frombuffer(payload, dtype="<f8").astype(np.float64)
+    elif bits == 8:
+        # 8-bit WAV is unsigned, centered on 128
+        return (np.frombuffer(payload, dtype=np.uint8).astype(np.float64) - 128.0) / 128.0
+    elif bits == 16:
+        return np.frombuffer(payload, dtype="<i2") / 32768.0
+    elif bits == 24:
+        raw = np.frombuffer(payload, dtype=np.uint8).reshape(-1, 3)
+        # Place the 3 bytes in the top of an int32 to keep the sign bit
+        widened = np.zeros((raw.shape[0], 4), dtype=np.uint8)
+        widened[:, 1:] = raw
+        return widened.view("<i4").ravel() / 2147483648.0
+    elif bits == 32:
+        return np.frombuffer(payload, dtype="<i4") / 2147483648.0
+
+    raise WavFormatError(f"Unsupported WAV encoding (format {format_tag:#06x}, {bits}-bit)")
+
+
+def decode_wav(data: bytes) -> WavAudio:
+    """Decode PCM or IEEE float WAV bytes without touching disk.
+
+    Args:
+        data: Complete WAV file bytes.
+
+    Returns:
+        WavAudio with float64 samples per channel.
+
+    Raises:
+        WavFormatError: If the container is malformed or the encoding is
+            not uncompressed PCM/float.
+    """
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise WavFormatError("Not a RIFF/WAVE file")
+
+    view = memoryview(data)
+    fmt = None
+    payload = None
+    offset = 12
+
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", data, offset + 4)
+        body_start = offset + 8
+        # Streaming writers leave the data size unset (0 or 0xFFFFFFFF) - clamp
+        body_end = min(body_start + chunk_size, len(data))
+
+        if chunk_id == b"fmt ":
+            if body_end - body_start < 16:
+                raise WavFormatError("fmt chunk too short")
+            format_tag, channels, sample_rate, _, block_align, bits = struct.unpack_from(
+                "<HHIIHH", data, body_start
+            )
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and body_end - body_start >= 26:
+                # Real format tag is the first 2 bytes of the SubFormat GUID
+                (format_tag,) = struct.unpack_from("<H", data, body_start + 24)
+            fmt = (format_tag, channels, sample_rate, block_align, bits)
+        elif chunk_id == b"data":
+            if chunk_size == 0:
+                body_end = len(data)
+            payload = view[body_start:body_end]
+            break
+
+        # Chunks are word-aligned
+        offset = body_start + chunk_size + (chunk_size & 1)
+
+    if fmt is None or payload is None:
+        raise WavFormatError("Missing fmt or data chunk")
+
+    format_tag, channels, sample_rate, block_align, bits = fmt
+    if format_tag not in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT):
+        raise WavFormatError(f"Unsupported WAV encoding (format {format_tag:#06x})")
+    if channels < 1 or sample_rate <= 0 or bits <= 0 or bits % 8 or block_align != channels * bits // 8:
+        raise WavFormatError("Inconsistent WAV format header")
+
+    # Drop a trailing partial frame (truncated uploads)
+    frames = len(payload) // block_align
+    samples = _pcm_to_float(payload[:frames * block_align], format_tag, bits)
+
+    # Interleaved frames → (channels, frames)
+    return WavAudio(samples=samples.reshape(frames, channels).T, sample_rate=sample_rate)
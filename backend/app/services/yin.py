@@ -0,0 +1,305 @@
+"""YIN pitch tracking, vectorized over frames.
+
+A NumPy alternative to Praat's autocorrelation pitch for
+extract_pitch_timed. Frames are taken from a strided view of the
+(optionally decimated) signal and processed in blocks: the YIN
+difference function of every frame in a block comes from one batched
+FFT cross-correlation plus running energy sums, so there is no
+per-frame Python loop.
+
+Frame count and frame times follow Praat's Sound.to_pitch (3 periods of
+pitch_floor per window, centered frames) so full_curve stays aligned
+with the Praat engine's timeline.
+
+YinStream tracks the same way incrementally, for audio that arrives in
+chunks (live recording).
+"""
+
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft
+from scipy.signal import resample_poly
+
+# Frames per FFT batch - bounds memory on long 48kHz clips
+_BLOCK_FRAMES = 256
+
+
+def frame_times(duration: float, time_step: float, window: float) -> np.ndarray:
+    """Centers (seconds) of analysis frames, laid out like Praat.
+
+    Args:
+        duration: Signal duration in seconds.
+        time_step: Time between frames.
+        window: Analysis window length in seconds.
+
+    Returns:
+        Frame center times (empty if the signal is shorter than a window).
+    """
+    n_frames = int(math.floor((duration - window) / time_step)) + 1
+    if n_frames < 1:
+        return np.empty(0)
+    first = 0.5 * duration - 0.5 * (n_frames - 1) * time_step
+    return first + np.arange(n_frames) * time_step
+
+
+def _lag_range(sample_rate: float, pitch_floor: float, pitch_ceiling: float) -> tuple[int, int, int, int]:
+    """(tau_min, tau_max, integration window, frame span) in samples."""
+    tau_min = max(2, int(math.floor(sample_rate / pitch_ceiling)))
+    tau_max = int(math.ceil(sample_rate / pitch_floor))
+    window = tau_max  # Integration window of one longest period
+    return tau_min, tau_max, window, window + tau_max + 2
+
+
+def _block_pitch(
+    frames: np.ndarray,
+    sample_rate: float,
+    window: int,
+    tau_min: int,
+    tau_max: int,
+    threshold: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """YIN period estimate for a block of frames.
+
+    Args:
+        frames: (n, window + tau_max + 2) samples per frame.
+
+    Returns:
+        Tuple of (f0 in Hz per frame, whether a period was found).
+    """
+    span = frames.shape[1]
+    taus = np.arange(tau_max + 2)
+
+    # Cross term sum_j x[j] * x[j + tau] for every frame in one batched FFT
+    nfft = fft.next_fast_len(span + window - 1, real=True)
+    head = fft.rfft(frames[:, :window], nfft)
+    full = fft.rfft(frames, nfft)
+    cross = fft.irfft(np.conj(head) * full, nfft)[:, :tau_max + 2]
+
+    # Energy of x[tau:tau + window] from a running sum of squares
+    energy = np.cumsum(frames ** 2, axis=1)
+    energy = np.concatenate([np.zeros((len(frames), 1)), energy], axis=1)
+    lagged = energy[:, taus + window] - energy[:, taus]
+
+    # Difference function d(tau) and its cumulative mean normalization d'(tau)
+    diff = np.maximum(lagged[:, :1] + lagged - 2.0 * cross, 0.0)
+    running = np.cumsum(diff[:, 1:], axis=1)
+    cmnd = np.ones_like(diff)
+    np.divide(diff[:, 1:] * taus[1:], running, out=cmnd[:, 1:], where=running > 0)
+
+    # First dip below threshold, followed down to its local minimum
+    inner = cmnd[:, tau_min:tau_max + 1]
+    below = inner < threshold
+    rising = cmnd[:, tau_min + 1:tau_max + 2] >= inner
+    candidates = below & rising
+    found = candidates.any(axis=1)
+    tau = candidates.argmax(axis=1) + tau_min
+
+    # Parabolic interpolation around the minimum for sub-sample periods
+    rows = np.arange(len(frames))
+    left, mid, right = cmnd[rows, tau - 1], cmnd[rows, tau], cmnd[rows, tau + 1]
+    curvature = left - 2.0 * mid + right
+    shift = np.zeros_like(mid)
+    np.divide(0.5 * (left - right), curvature, out=shift, where=curvature > 0)
+    period = tau + np.clip(shift, -0.5, 0.5)
+
+    return sample_rate / period, found
+
+
+def yin_pitch(
+    samples: np.ndarray,
+    sample_rate: float,
+    time_step: float = 0.01,
+    pitch_floor: float = 75.0,
+    pitch_ceiling: float = 600.0,
+    threshold: float = 0.15,
+    silence_threshold: float = 0.03,
+    target_rate: int = 16000,
+) -> np.ndarray:
+    """Track pitch with YIN.
+
+    Args:
+        samples: Mono samples, or (channels, frames) which are averaged.
+        sample_rate: Sampling rate of samples (Hz).
+        time_step: Time between frames (seconds).
+        pitch_floor: Lowest pitch searched (Hz); also sets the frame
+            layout (3 periods per window, as Praat).
+        pitch_ceiling: Highest pitch searched (Hz).
+        threshold: YIN absolute threshold on the normalized difference;
+            frames with no dip below it are unvoiced.
+        silence_threshold: Frames whose peak is below this fraction of
+            the global peak are unvoiced (Praat's silence threshold).
+        target_rate: Decimate to this rate before tracking when the input
+            is faster (0 = analyze at the original rate).
+
+    Returns:
+        Pitch per frame in Hz, 0 for unvoiced frames.
+    """
+    x = np.asarray(samples, dtype=float)
+    if x.ndim > 1:
+        x = x.mean(axis=0)
+
+    duration = len(x) / sample_rate
+    centers = frame_times(duration, time_step, 3.0 / pitch_floor)
+    pitch = np.zeros(len(centers))
+    peak = float(np.abs(x).max()) if len(x) else 0.0
+    if len(centers) == 0 or peak == 0.0:
+        return pitch
+
+    if target_rate and sample_rate > target_rate:
+        # e.g. Azure's 48kHz → 16kHz: 9x fewer samples per frame and lag
+        factor = math.gcd(int(sample_rate), int(target_rate))
+        x = resample_poly(x, int(target_rate) // factor, int(sample_rate) // factor)
+        sample_rate = target_rate
+
+    tau_min, tau_max, window, span = _lag_range(sample_rate, pitch_floor, pitch_ceiling)
+
+    # Strided view of every span-long segment; frames are rows picked from it
+    padded = np.pad(x, (span, span))
+    segments = sliding_window_view(padded, span)
+    starts = np.round(centers * sample_rate - span / 2).astype(np.int64) + span
+
+    for block_start in range(0, len(centers), _BLOCK_FRAMES):
+        block = slice(block_start, block_start + _BLOCK_FRAMES)
+        frames = segments[starts[block]]
+        f0, found = _block_pitch(frames, sample_rate, window, tau_min, tau_max, threshold)
+
+        loud = np.abs(frames).max(axis=1) >= silence_threshold * peak
+        voiced = found & loud & (f0 >= pitch_floor) & (f0 <= pitch_ceiling)
+        pitch[block] = np.where(voiced, f0, 0.0)
+
+    return pitch
+
+
+class YinStream:
+    """Incremental YIN over audio that arrives in chunks.
+
+    Samples go into a ring buffer that only keeps what the next frame
+    still needs. Frames sit on a fixed grid (first center at half a
+    window, then every time_step), and each frame is analyzed as soon as
+    its whole window has arrived - so the frame count always matches
+    frame_times() for the audio received so far, although the grid is
+    anchored at the start rather than centered on the final duration.
+
+    Live output judges silence against the loudest sample seen so far;
+    finish() re-judges every frame against the final global peak (no
+    re-analysis).
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        time_step: float = 0.01,
+        pitch_floor: float = 75.0,
+        pitch_ceiling: float = 600.0,
+        threshold: float = 0.15,
+        silence_threshold: float = 0.03,
+    ):
+        self.sample_rate = sample_rate
+        self.time_step = time_step
+        self.pitch_floor = pitch_floor
+        self.pitch_ceiling = pitch_ceiling
+        self.threshold = threshold
+        self.silence_threshold = silence_threshold
+
+        self._window_seconds = 3.0 / pitch_floor
+        self._tau_min, self._tau_max, self._window, self._span = _lag_range(
+            sample_rate, pitch_floor, pitch_ceiling
+        )
+
+        self._buffer = np.zeros(self._span + sample_rate)
+        self._buffer_start = 0  # Absolute index of _buffer[0]
+        self._received = 0  # Total samples pushed
+        self._peak = 0.0
+
+        # Per-frame results, kept for the final voicing pass
+        self._f0: list[np.ndarray] = []
+        self._found: list[np.ndarray] = []
+        self._frame_peaks: list[np.ndarray] = []
+        self._frames_done = 0
+
+    @property
+    def frame_count(self) -> int:
+        return self._frames_done
+
+    @property
+    def duration_ms(self) -> int:
+        return int(self._received * 1000 / self.sample_rate)
+
+    def _frame_start(self, k: np.ndarray) -> np.ndarray:
+        """Absolute first sample of each frame's span."""
+        centers = 0.5 * self._window_seconds + k * self.time_step
+        return np.round(centers * self.sample_rate - self._span / 2).astype(np.int64)
+
+    def _append(self, samples: np.ndarray) -> None:
+        """Append to the ring buffer, dropping samples no frame needs anymore."""
+        keep_from = int(self._frame_start(np.array([self._frames_done]))[0])
+        used = self._received - self._buffer_start
+        if used + len(samples) > len(self._buffer):
+            drop = max(0, keep_from - self._buffer_start)
+            self._buffer[:used - drop] = self._buffer[drop:used]
+            self._buffer_start += drop
+            used -= drop
+            if used + len(samples) > len(self._buffer):
+                grown = np.zeros(used + len(samples) + self._span)
+                grown[:used] = self._buffer[:used]
+                self._buffer = grown
+
+        self._buffer[used:used + len(samples)] = samples
+        self._received += len(samples)
+
+    def _voiced(self, f0: np.ndarray, found: np.ndarray, frame_peaks: np.ndarray, peak: float) -> np.ndarray:
+        voiced = (
+            found
+            & (frame_peaks >= self.silence_threshold * peak)
+            & (frame_peaks > 0)
+            & (f0 >= self.pitch_floor)
+            & (f0 <= self.pitch_ceiling)
+        )
+        return np.where(voiced, f0, 0.0)
+
+    def push(self, samples: np.ndarray) -> np.ndarray:
+        """Add mono samples and analyze every frame that is now complete.
+
+        Returns:
+            Pitch (Hz, 0 = unvoiced) for the newly completed frames, in order.
+        """
+        samples = np.asarray(samples, dtype=float).ravel()
+        if len(samples) == 0:
+            return np.empty(0)
+
+        self._append(samples)
+        self._peak = max(self._peak, float(np.abs(samples).max()))
+
+        # Same frame count rule as frame_times(): the whole window must fit
+        duration = self._received / self.sample_rate
+        ready = max(0, int(math.floor((duration - self._window_seconds) / self.time_step + 1e-9)) + 1)
+        if ready <= self._frames_done:
+            return np.empty(0)
+
+        used = self._received - self._buffer_start
+        segments = sliding_window_view(self._buffer[:used], self._span)
+        starts = self._frame_start(np.arange(self._frames_done, ready)) - self._buffer_start
+
+        f0, found = _block_pitch(
+            segments[starts], self.sample_rate, self._window, self._tau_min, self._tau_max, self.threshold
+        )
+        frame_peaks = np.abs(segments[starts]).max(axis=1)
+
+        self._f0.append(f0)
+        self._found.append(found)
+        self._frame_peaks.append(frame_peaks)
+        self._frames_done = ready
+        return self._voiced(f0, found, frame_peaks, self._peak)
+
+    def finish(self) -> np.ndarray:
+        """Pitch for every frame so far, with silence judged on the global peak."""
+        if not self._f0:
+            return np.empty(0)
+        return self._voiced(
+            np.concatenate(self._f0),
+            np.concatenate(self._found),
+            np.concatenate(self._frame_peaks),
+            self._peak,
+        )
@@ -0,0 +1,83 @@
+"""Benchmark batch analysis throughput across process pool sizes.
+
+Runs the same batch of sentences through analyze_batch with 1, 2, 4 and 8
+worker processes (plus an inline single-process baseline) and reports
+texts/second. Pool start-up is excluded: each pool is warmed first.
+
+Usage:
+    python scripts/benchmark_analyze_batch.py [--texts N] [--workers 1 2 4 8]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.analyze_pool import analyze_batch, create_analyze_pool  # noqa: E402
+from app.services.pitch import analyze_text  # noqa: E402
+
+# Typical deck/subtitle sentences (mixed length, compounds, particles)
+SENTENCES = [
+    "今日はいい天気ですね。",
+    "東京駅で友達と待ち合わせをしました。",
+    "日本語の発音は難しいけど、毎日練習すれば上手になります。",
+    "携帯電話を家に忘れてしまった。",
+    "この映画は子供から大人まで楽しめる作品です。",
+    "明日の会議は午後三時から始まる予定です。",
+    "雨が降っているので、傘を持って行きましょう。",
+    "新しい外国人留学生が来月到着します。",
+]
+
+
+def build_texts(count: int) -> list[str]:
+    return [SENTENCES[i % len(SENTENCES)] * (1 + i % 3) for i in range(count)]
+
+
+def run_inline(texts: list[str]) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        analyze_text(text)
+    return time.perf_counter() - start
+
+
+async def run_pool(texts: list[str], workers: int) -> float:
+    pool = create_analyze_pool(workers)
+    try:
+        # Warm every worker (spawn + tokenizer/lexicon load) before timing
+        await analyze_batch(SENTENCES * workers, pool=pool, workers=workers)
+        start = time.perf_counter()
+        await analyze_batch(texts, pool=pool, workers=workers)
+        return time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=400, help="Texts per batch")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Pool sizes to test")
+    args = parser.parse_args()
+
+    texts = build_texts(args.texts)
+    chars = sum(len(t) for t in texts)
+    print(f"=== Batch Analyze Benchmark ({len(texts):,} texts, {chars:,} chars, {os.cpu_count()} CPUs) ===\n")
+
+    # Warm the in-process tokenizer/lexicon for the baseline
+    analyze_text(SENTENCES[0])
+    inline_s = run_inline(texts)
+    print(f"inline     {inline_s:7.2f} s  {len(texts) / inline_s:8.1f} texts/s")
+
+    for workers in args.workers:
+        elapsed = asyncio.run(run_pool(texts, workers))
+        print(
+            f"{workers} worker{'s' if workers > 1 else ' '}  {elapsed:7.2f} s  "
+            f"{len(texts) / elapsed:8.1f} texts/s  ({inline_s / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark the NumPy DTW engine against fastdtw on pitch-like contours.
+
+Generates z-scored synthetic pitch contours for 1-10 second clips (10ms
+frames, user ~15% slower than native with jitter) and times:
+- fastdtw(dist=euclidean) as previously used by compare_audio
+- dtw() exact
+- dtw() banded (Sakoe-Chiba)
+
+and, for multi-voice scoring, one user contour against --voices native
+contours of slightly different lengths: dtw() once per voice vs a single
+dtw_batch().
+
+fastdtw is no longer an app dependency: pip install fastdtw to include it.
+
+Usage:
+    python scripts/benchmark_dtw.py [--seconds 1 2 5 10] [--band 20] [--voices 7] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.dtw import dtw, dtw_batch  # noqa: E402
+
+FRAMES_PER_SECOND = 100  # 10ms pitch frames
+
+
+def make_contours(seconds: float, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """Native contour and a slower, noisier user rendition (both z-scored)."""
+    n = int(seconds * FRAMES_PER_SECOND)
+    t = np.linspace(0, seconds, n)
+    native = np.sin(2 * np.pi * 0.8 * t) + 0.3 * np.sin(2 * np.pi * 2.3 * t)
+    user_t = np.linspace(0, seconds, int(n * 1.15))
+    user = np.interp(user_t, t, native) + rng.normal(scale=0.15, size=len(user_t))
+    return (native - native.mean()) / native.std(), (user - user.mean()) / user.std()
+
+
+def best_of(fn, repeat: int) -> tuple[float, tuple]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1, 2, 5, 10], help="Clip lengths")
+    parser.add_argument("--band", type=int, default=20, help="Sakoe-Chiba radius in frames")
+    parser.add_argument("--voices", type=int, default=7, help="Native contours per multi-voice compare")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    try:
+        from fastdtw import fastdtw
+        from scipy.spatial.distance import euclidean
+    except ImportError:
+        fastdtw = None
+        print("fastdtw not installed - reporting the NumPy engine only\n")
+
+    rng = np.random.default_rng(0)
+    print(f"=== DTW Benchmark (band={args.band}, best of {args.repeat}) ===\n")
+    print(f"{'clip':>6} {'frames':>11} {'fastdtw':>10} {'exact':>10} {'banded':>10}  distance fast/exact/banded")
+
+    for seconds in args.seconds:
+        native, user = make_contours(seconds, rng)
+
+        exact_s, (exact_d, _) = best_of(lambda: dtw(native, user), args.repeat)
+        banded_s, (banded_d, _) = best_of(lambda: dtw(native, user, band=args.band), args.repeat)
+
+        if fastdtw is not None:
+            fast_s, (fast_d, _) = best_of(
+                lambda: fastdtw(native.reshape(-1, 1), user.reshape(-1, 1), dist=euclidean), args.repeat
+            )
+            fast_col = f"{fast_s * 1000:8.1f}ms"
+            speedup = f"  ({fast_s / exact_s:.1f}x / {fast_s / banded_s:.1f}x)"
+            distances = f"{fast_d:.1f}/{exact_d:.1f}/{banded_d:.1f}"
+        else:
+            fast_col = f"{'-':>10}"
+            speedup = ""
+            distances = f"-/{exact_d:.1f}/{banded_d:.1f}"
+
+        print(
+            f"{seconds:5.0f}s {len(native):>5}x{len(user):<5} {fast_col} "
+            f"{exact_s * 1000:8.1f}ms {banded_s * 1000:8.1f}ms  {distances}{speedup}"
+        )
+
+    print(f"\n=== Multi-voice ({args.voices} voices, exact) ===\n")
+    print(f"{'clip':>6} {'per voice':>10} {'batch':>10}")
+
+    for seconds in args.seconds:
+        natives = [make_contours(seconds * (0.9 + 0.05 * v), rng)[0] for v in range(args.voices)]
+        _, user = make_contours(seconds, rng)
+
+        separate_s, _ = best_of(lambda: [dtw(native, user) for native in natives], args.repeat)
+        batch_s, _ = best_of(lambda: dtw_batch(natives, user), args.repeat)
+
+        print(
+            f"{seconds:5.0f}s {separate_s * 1000:8.1f}ms {batch_s * 1000:8.1f}ms"
+            f"  ({separate_s / batch_s:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
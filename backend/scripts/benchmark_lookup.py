@@ -0,0 +1,162 @@
+"""Benchmark SQL vs in-memory Kanjium lookups.
+
+Replays the lookup_pitch fallback chain for every entry in pitch.db
+(surface + reading hits, surface-only hits, lemma hits and reading-only
+hits) twice: once with the original per-token SELECTs and once against
+the in-memory PitchLexicon. UniDic cross-validation is left out so only
+the Kanjium lookup cost is measured. Also checks both paths agree.
+
+Usage:
+    python scripts/benchmark_lookup.py [--db PATH] [--limit N]
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.pitch.lexicon import PitchLexicon, parse_accent_pattern  # noqa: E402
+
+DB_PATH = Path(__file__).parent.parent / "data" / "pitch.db"
+
+
+def sql_lookup(cursor: sqlite3.Cursor, surface, reading_hira, lemma=None, normalized=None):
+    """The original lookup_pitch query chain (up to five SELECTs)."""
+    cursor.execute(
+        "SELECT accent_pattern, goshu, goshu_jp FROM pitch_accents WHERE surface = ? AND reading = ? LIMIT 1",
+        (surface, reading_hira)
+    )
+    row = cursor.fetchone()
+    if row:
+        return row, "dictionary"
+
+    by_form = (
+        "SELECT accent_pattern, goshu, goshu_jp FROM pitch_accents "
+        "WHERE surface = ? ORDER BY (reading = ?) DESC LIMIT 1"
+    )
+    cursor.execute(by_form, (surface, reading_hira))
+    row = cursor.fetchone()
+    if row:
+        return row, "dictionary"
+
+    if lemma and lemma != surface:
+        cursor.execute(by_form, (lemma, reading_hira))
+        row = cursor.fetchone()
+        if row:
+            return row, "dictionary_lemma"
+
+    if normalized and normalized not in (surface, lemma):
+        cursor.execute(by_form, (normalized, reading_hira))
+        row = cursor.fetchone()
+        if row:
+            return row, "dictionary_lemma"
+
+    if reading_hira:
+        cursor.execute(
+            "SELECT accent_pattern, goshu, goshu_jp FROM pitch_accents "
+            "WHERE reading = ? ORDER BY LENGTH(surface) ASC LIMIT 1",
+            (reading_hira,)
+        )
+        row = cursor.fetchone()
+        if row:
+            return row, "dictionary_reading"
+
+    return None, "unknown"
+
+
+def build_queries(conn: sqlite3.Connection, limit: int | None) -> list[tuple]:
+    """One query per entry, cycling through the fallback levels."""
+    rows = conn.execute("SELECT surface, reading FROM pitch_accents ORDER BY rowid").fetchall()
+    if limit:
+        rows = rows[:limit]
+
+    queries = []
+    for i, (surface, reading) in enumerate(rows):
+        kind = i % 4
+        if kind == 0:
+            queries.append((surface, reading, surface, surface))  # exact
+        elif kind == 1:
+            queries.append((surface, "", surface, surface))  # surface only
+        elif kind == 2:
+            queries.append(("〇" + surface, reading, surface, None))  # lemma
+        else:
+            queries.append(("〇" + surface, reading, None, None))  # reading only
+    return queries
+
+
+def run_sql(conn: sqlite3.Connection, queries: list[tuple]) -> tuple[float, list]:
+    cursor = conn.cursor()
+    results = []
+    start = time.perf_counter()
+    for q in queries:
+        row, source = sql_lookup(cursor, *q)
+        results.append((row, source))
+    return time.perf_counter() - start, results
+
+
+def run_lexicon(lexicon: PitchLexicon, queries: list[tuple]) -> tuple[float, list]:
+    results = []
+    start = time.perf_counter()
+    for q in queries:
+        results.append(lexicon.find(*q))
+    return time.perf_counter() - start, results
+
+
+def count_mismatches(sql_results: list, lexicon_results: list) -> int:
+    mismatches = 0
+    for (row, source), match in zip(sql_results, lexicon_results):
+        if row is None or match is None:
+            mismatches += (row is None) != (match is None)
+            continue
+        (accents, has_multiple, goshu, goshu_jp), lex_source = match
+        pattern = row[0]
+        expected = (parse_accent_pattern(pattern), "," in pattern, row[1], row[2], source)
+        if expected != (accents, has_multiple, goshu, goshu_jp, lex_source):
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, default=DB_PATH, help="Path to pitch.db")
+    parser.add_argument("--limit", type=int, default=None, help="Only replay the first N entries")
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        print(f"Error: Database not found at {args.db}")
+        print("Run 'python scripts/download_dictionary.py' first.")
+        return
+
+    conn = sqlite3.connect(args.db)
+    total = conn.execute("SELECT COUNT(*) FROM pitch_accents").fetchone()[0]
+    print(f"=== Lookup Benchmark ({total:,} entries) ===\n")
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    lexicon = PitchLexicon.from_connection(conn)
+    load_s = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Lexicon load:   {load_s * 1000:,.0f} ms, ~{current / 1024 / 1024:.1f} MB resident "
+          f"(peak {peak / 1024 / 1024:.1f} MB)")
+
+    queries = build_queries(conn, args.limit)
+    sql_s, sql_results = run_sql(conn, queries)
+    lex_s, lex_results = run_lexicon(lexicon, queries)
+
+    n = len(queries)
+    print(f"Lookups:        {n:,}")
+    print(f"SQL:            {sql_s:8.3f} s  ({sql_s / n * 1e6:7.2f} us/lookup)")
+    print(f"In-memory:      {lex_s:8.3f} s  ({lex_s / n * 1e6:7.2f} us/lookup)")
+    print(f"Speedup:        {sql_s / lex_s:.1f}x")
+    print(f"Mismatches:     {count_mismatches(sql_results, lex_results):,}")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
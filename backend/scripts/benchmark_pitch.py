@@ -0,0 +1,151 @@
+"""Benchmark pitch engines (Praat vs NumPy YIN) for speed and agreement.
+
+Runs extract_pitch_timed on each clip with:
+- praat (Parselmouth autocorrelation, the default)
+- yin after decimation to 16kHz (settings.yin_sample_rate)
+- yin at the original sample rate
+
+and reports the time per clip plus how closely each YIN variant agrees
+with Praat frame by frame: voicing agreement, median deviation in cents
+on frames both engines voice, and the gross error rate (> 50 cents,
+i.e. octave jumps and wrong harmonics).
+
+The repo doesn't ship recordings, so by default the clips are synthetic
+48kHz 16-bit mono WAVs (Azure's Riff48Khz16BitMonoPcm format) with
+pitch-accent-like contours, pauses and background noise. Pass real
+recordings with --wav to benchmark those as well.
+
+Usage:
+    python scripts/benchmark_pitch.py [--wav a.wav b.wav] [--repeat 5]
+"""
+
+import argparse
+import io
+import sys
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings  # noqa: E402
+from app.services.audio_compare import extract_pitch_timed  # noqa: E402
+
+RATE = 48000
+GROSS_ERROR_CENTS = 50
+
+# (name, seconds, pitch anchors in Hz spread evenly over the clip, noise level)
+SYNTHETIC_CLIPS = [
+    ("heiban (rise)", 1.0, [180, 230, 235, 235], 0.0),
+    ("atamadaka (fall)", 1.0, [240, 170, 160, 150], 0.0),
+    ("male low", 2.0, [110, 140, 120, 95], 0.01),
+    ("female high", 2.0, [260, 330, 300, 220], 0.01),
+    ("phrase + pauses", 5.0, [200, 250, 180, 230, 170, 210, 160], 0.02),
+    ("long noisy", 10.0, [190, 240, 200, 260, 180, 220, 170, 230, 160], 0.05),
+]
+
+
+def synth_clip(seconds: float, anchors: list[float], noise: float, rng: np.random.Generator) -> bytes:
+    """Voice-like WAV: decaying harmonics along a smooth contour, with pauses."""
+    n = int(seconds * RATE)
+    t = np.arange(n) / RATE
+    f0 = np.interp(t, np.linspace(0, seconds, len(anchors)), anchors)
+    phase = 2 * np.pi * np.cumsum(f0) / RATE
+    signal = sum(np.sin(k * phase) / k for k in range(1, 10))
+
+    # Syllable-like amplitude envelope with a 150ms pause every ~0.8s
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4.0 * t) ** 2
+    envelope[(t % 0.8) > 0.65] = 0.0
+    envelope[t < 0.1] = 0.0
+    audio = 0.25 * signal * envelope + rng.normal(scale=noise, size=n)
+
+    pcm = (np.clip(audio, -1, 1) * 32767).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(RATE)
+        w.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def best_of(fn, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def agreement(reference: list[float], candidate: list[float]) -> tuple[float, float, float]:
+    """(voicing agreement %, median |cents|, gross error %) of candidate vs reference."""
+    ref = np.asarray(reference)
+    cand = np.asarray(candidate)
+    n = min(len(ref), len(cand))
+    ref, cand = ref[:n], cand[:n]
+
+    voicing = float(np.mean((ref > 0) == (cand > 0))) * 100
+    both = (ref > 0) & (cand > 0)
+    if not both.any():
+        return voicing, float("nan"), float("nan")
+    cents = 1200 * np.abs(np.log2(cand[both] / ref[both]))
+    return voicing, float(np.median(cents)), float(np.mean(cents > GROSS_ERROR_CENTS)) * 100
+
+
+def run_yin(audio: bytes, sample_rate: int):
+    original = settings.yin_sample_rate
+    settings.yin_sample_rate = sample_rate
+    try:
+        return extract_pitch_timed(audio, engine="yin")
+    finally:
+        settings.yin_sample_rate = original
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--wav", type=Path, nargs="*", default=[], help="Extra WAV recordings")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    parser.add_argument("--no-synthetic", action="store_true", help="Only benchmark --wav files")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    clips = []
+    if not args.no_synthetic:
+        clips += [(name, synth_clip(seconds, anchors, noise, rng)) for name, seconds, anchors, noise in SYNTHETIC_CLIPS]
+    clips += [(path.name, path.read_bytes()) for path in args.wav]
+    if not clips:
+        parser.error("No clips to benchmark")
+
+    target = settings.yin_sample_rate or 16000
+    print(f"=== Pitch Engine Benchmark (best of {args.repeat}) ===\n")
+    print(
+        f"{'clip':<18} {'len':>6} {'praat':>9} {f'yin@{target // 1000}k':>9} {'yin@orig':>9}"
+        f"  {'voicing':>8} {'median':>8} {'gross':>7}  (yin@{target // 1000}k vs praat)"
+    )
+
+    totals = np.zeros(3)
+    for name, audio in clips:
+        praat_s, praat = best_of(lambda: extract_pitch_timed(audio), args.repeat)
+        yin_s, yin = best_of(lambda: run_yin(audio, target), args.repeat)
+        yin_full_s, _ = best_of(lambda: run_yin(audio, 0), args.repeat)
+        totals += (praat_s, yin_s, yin_full_s)
+
+        voicing, median_cents, gross = agreement(praat.full_curve, yin.full_curve)
+        print(
+            f"{name:<18} {praat.duration_ms / 1000:5.1f}s "
+            f"{praat_s * 1000:7.1f}ms {yin_s * 1000:7.1f}ms {yin_full_s * 1000:7.1f}ms"
+            f"  {voicing:7.1f}% {median_cents:6.1f}c {gross:6.1f}%"
+        )
+
+    print(
+        f"\n{'total':<18} {'':>6} {totals[0] * 1000:7.1f}ms {totals[1] * 1000:7.1f}ms {totals[2] * 1000:7.1f}ms"
+        f"  (yin@{target // 1000}k {totals[0] / totals[1]:.1f}x, yin@orig {totals[0] / totals[2]:.1f}x vs praat)"
+    )
+
+
+if __name__ == "__main__":
+    main()
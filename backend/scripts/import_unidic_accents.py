@@ -0,0 +1,144 @@
+"""Precompute UniDic accent types (aType) into pitch.db.
+
+Runs the fugashi/UniDic tagger once per surface offline, so the API can
+cross-validate Kanjium with a table lookup instead of a second
+morphological analysis per token. This also means the runtime image
+doesn't need the UniDic dictionary download.
+
+Surfaces come from the Kanjium pitch_accents table plus, when present,
+the UniDic lexicon CSV shipped in unidic.DICDIR (covers UniDic-only words
+such as proper nouns).
+
+Usage:
+    python scripts/import_unidic_accents.py
+"""
+
+import csv
+import sys
+import sqlite3
+
+# Fix Windows console encoding
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8")
+from pathlib import Path
+
+from fugashi import Tagger
+import unidic
+from tqdm import tqdm
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.pitch.unidic import analyze_unidic_accents  # noqa: E402
+
+DB_PATH = Path(__file__).parent.parent / "data" / "pitch.db"
+
+
+def create_table(conn: sqlite3.Connection):
+    """(Re)create the unidic_accents table."""
+    cursor = conn.cursor()
+    cursor.execute("DROP TABLE IF EXISTS unidic_accents")
+    cursor.execute("""
+        CREATE TABLE unidic_accents (
+            id INTEGER PRIMARY KEY,
+            surface TEXT NOT NULL,
+            reading TEXT NOT NULL,
+            accent INTEGER NOT NULL,
+            is_word INTEGER NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX idx_unidic_surface ON unidic_accents(surface)")
+    conn.commit()
+
+
+def collect_surfaces(conn: sqlite3.Connection) -> list[str]:
+    """Distinct surfaces from Kanjium and the UniDic lexicon CSV (if shipped)."""
+    cursor = conn.cursor()
+    cursor.execute("SELECT DISTINCT surface FROM pitch_accents")
+    surfaces = {row[0] for row in cursor.fetchall()}
+    print(f"Kanjium surfaces: {len(surfaces):,}")
+
+    lex_files = sorted(Path(unidic.DICDIR).glob("lex*.csv"))
+    for lex_file in lex_files:
+        before = len(surfaces)
+        with open(lex_file, encoding="utf-8", newline="") as f:
+            for row in csv.reader(f):
+                if row and row[0]:
+                    surfaces.add(row[0])
+        print(f"{lex_file.name}: +{len(surfaces) - before:,} surfaces")
+
+    if not lex_files:
+        print("No UniDic lexicon CSV found - using Kanjium surfaces only.")
+
+    return sorted(surfaces)
+
+
+def import_accents(conn: sqlite3.Connection, tagger: Tagger, surfaces: list[str]) -> int:
+    """Tag every surface and store its accent candidates."""
+    cursor = conn.cursor()
+    inserted = 0
+    batch = []
+    batch_size = 1000
+
+    for surface in tqdm(surfaces, desc="Processing"):
+        try:
+            candidates = analyze_unidic_accents(tagger, surface)
+        except Exception:
+            continue
+
+        for reading, accent, is_word in candidates:
+            batch.append((surface, reading, accent, int(is_word)))
+
+        if len(batch) >= batch_size:
+            cursor.executemany(
+                "INSERT INTO unidic_accents (surface, reading, accent, is_word) VALUES (?, ?, ?, ?)",
+                batch
+            )
+            conn.commit()
+            inserted += len(batch)
+            batch = []
+
+    # Final batch
+    if batch:
+        cursor.executemany(
+            "INSERT INTO unidic_accents (surface, reading, accent, is_word) VALUES (?, ?, ?, ?)",
+            batch
+        )
+        conn.commit()
+        inserted += len(batch)
+
+    return inserted
+
+
+def main():
+    print("=== UniDic Accent (aType) Import ===\n")
+
+    if not DB_PATH.exists():
+        print(f"Error: Database not found at {DB_PATH}")
+        print("Run 'python scripts/download_dictionary.py' first.")
+        return
+
+    # Check if UniDic is downloaded
+    if not Path(unidic.DICDIR).exists() or not any(Path(unidic.DICDIR).iterdir()):
+        print("Error: UniDic dictionary not found.")
+        print("Please download it first with:")
+        print("  python -m unidic download")
+        return
+
+    # Initialize UniDic tagger
+    print("Loading UniDic dictionary...")
+    tagger = Tagger(f'-d "{unidic.DICDIR}"')
+
+    conn = sqlite3.connect(DB_PATH)
+
+    surfaces = collect_surfaces(conn)
+    create_table(conn)
+    inserted = import_accents(conn, tagger, surfaces)
+    print(f"\nStored {inserted:,} accent rows for {len(surfaces):,} surfaces.")
+
+    conn.execute("VACUUM")
+    conn.close()
+    print("\nDone!")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,6 @@ from fastapi.testclient import TestClient
 # Skip imports if dependencies not available
 pytest.importorskip("azure.cognitiveservices.speech", reason="Azure SDK required for app import")
 pytest.importorskip("parselmouth", reason="parselmouth required for app import")
-pytest.importorskip("fastdtw", reason="fastdtw required for app import")
 pytest.importorskip("numpy", reason="numpy required for app import")
 pytest.importorskip("scipy", reason="scipy required for app import")
 pytest.importorskip("sudachipy", reason="sudachipy required for app import")
@@ -16,6 +15,15 @@ pytest.importorskip("redis", reason="redis required for app import")
 pytest.importorskip("boto3", reason="boto3 required for app import")
 
 
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Memoized token analyses must not leak between tests that stub lookups."""
+    from app.services.pitch.token_cache import clear_token_cache
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
 @pytest.fixture
 def mock_token_data():
     """Create mock TokenData for authenticated requests."""
@@ -0,0 +1,111 @@
+"""Unit tests for the analysis result cache."""
+
+import pytest
+
+pytest.importorskip("redis", reason="redis required for cache service")
+
+from app.models.schemas import AnalyzeResponse, WordPitch
+from app.services import analyze_cache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, data):
+        self.store[key] = data
+
+
+def make_response(text: str, surface: str = "word") -> AnalyzeResponse:
+    return AnalyzeResponse(
+        text=text,
+        words=[
+            WordPitch(
+                surface=surface,
+                reading="よみ",
+                accent_type=1,
+                mora_count=2,
+                morae=["よ", "み"],
+                pitch_pattern=["H", "L"],
+                part_of_speech="名詞",
+            )
+        ],
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_cache_state(monkeypatch):
+    analyze_cache.clear_analyze_cache()
+    monkeypatch.setattr(analyze_cache.settings, "analyze_cache_enabled", True)
+    monkeypatch.setattr(analyze_cache.settings, "analyze_cache_redis", False)
+    monkeypatch.setattr(analyze_cache.settings, "analyze_cache_max_mb", 1)
+    yield
+    analyze_cache.clear_analyze_cache()
+
+
+async def test_save_then_get_round_trips_response():
+    await analyze_cache.save_analysis(" 雨 ", make_response(" 雨 "))
+
+    result = await analyze_cache.get_cached_analysis("雨")
+
+    assert result is not None
+    assert result.text == "雨"
+    assert result.words[0].pitch_pattern == ["H", "L"]
+    stats = analyze_cache.get_analyze_cache_stats()
+    assert (stats.hits, stats.memory_hits, stats.misses) == (1, 1, 0)
+
+
+async def test_miss_increments():
+    assert await analyze_cache.get_cached_analysis("雨") is None
+    assert analyze_cache.get_analyze_cache_stats().misses == 1
+
+
+async def test_dictionary_version_is_part_of_key(monkeypatch):
+    await analyze_cache.save_analysis("雨", make_response("雨"))
+    monkeypatch.setattr(analyze_cache, "dictionary_version", lambda: "new-db-hash")
+
+    assert await analyze_cache.get_cached_analysis("雨") is None
+
+
+async def test_lru_evicts_past_byte_budget(monkeypatch):
+    payload_size = len(make_response("0").model_dump_json().encode())
+    monkeypatch.setattr(analyze_cache, "_max_bytes", lambda: payload_size * 2 + 1)
+
+    await analyze_cache.save_analysis("0", make_response("0"))
+    await analyze_cache.save_analysis("1", make_response("1"))
+    await analyze_cache.get_cached_analysis("0")  # 0 is now most recently used
+    await analyze_cache.save_analysis("2", make_response("2"))
+
+    assert await analyze_cache.get_cached_analysis("1") is None
+    assert await analyze_cache.get_cached_analysis("0") is not None
+    assert await analyze_cache.get_cached_analysis("2") is not None
+    assert analyze_cache.get_analyze_cache_stats().entries == 2
+
+
+async def test_redis_hit_promotes_to_memory(monkeypatch):
+    redis_client = FakeRedis()
+    monkeypatch.setattr(analyze_cache.settings, "analyze_cache_redis", True)
+    monkeypatch.setattr(analyze_cache.tts_cache, "_get_redis_client", lambda: redis_client)
+
+    await analyze_cache.save_analysis("雨", make_response("雨"))
+    analyze_cache._entries.clear()
+
+    first = await analyze_cache.get_cached_analysis("雨")
+    second = await analyze_cache.get_cached_analysis("雨")
+
+    assert first is not None and second is not None
+    stats = analyze_cache.get_analyze_cache_stats()
+    assert stats.redis_hits == 1
+    assert stats.memory_hits == 1
+
+
+async def test_disabled_cache_is_bypassed(monkeypatch):
+    monkeypatch.setattr(analyze_cache.settings, "analyze_cache_enabled", False)
+
+    await analyze_cache.save_analysis("雨", make_response("雨"))
+
+    assert await analyze_cache.get_cached_analysis("雨") is None
+    assert analyze_cache.get_analyze_cache_stats().entries == 0
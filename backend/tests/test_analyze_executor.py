@@ -0,0 +1,103 @@
+"""Unit tests for the bounded analysis executor."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.services import analyze_executor
+from app.services.analyze_executor import BoundedExecutor, ExecutorSaturated
+
+
+async def test_run_returns_result_and_timing():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0)
+    try:
+        result, timing = await executor.run(lambda x: x * 2, 21)
+    finally:
+        executor.shutdown()
+
+    assert result == 42
+    assert timing.queue_ms >= 0
+    assert timing.run_ms >= 0
+    assert executor.stats().completed == 1
+    assert executor.stats().in_flight == 0
+
+
+async def test_run_rejects_when_saturated():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ExecutorSaturated):
+            await executor.run(release.wait)
+
+        release.set()
+        await asyncio.gather(running, queued)
+    finally:
+        release.set()
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert stats.rejected == 1
+    assert stats.completed == 2
+    assert stats.in_flight == 0
+
+
+async def test_queue_wait_is_measured():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+    try:
+        first = asyncio.ensure_future(executor.run(lambda: threading.Event().wait(0.05)))
+        await asyncio.sleep(0)
+        _, timing = await executor.run(lambda: None)
+        await first
+    finally:
+        executor.shutdown()
+
+    assert timing.queue_ms >= 30
+
+
+async def test_run_propagates_errors_and_frees_slot():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0)
+
+    def boom():
+        raise ValueError("bad")
+
+    try:
+        with pytest.raises(ValueError):
+            await executor.run(boom)
+        result, _ = await executor.run(lambda: "ok")
+    finally:
+        executor.shutdown()
+
+    assert result == "ok"
+
+
+def test_get_analyze_executor_uses_settings(monkeypatch):
+    analyze_executor.shutdown_analyze_executor()
+    monkeypatch.setattr(analyze_executor.settings, "analyze_threads", 3)
+    monkeypatch.setattr(analyze_executor.settings, "analyze_queue_size", 7)
+
+    executor = analyze_executor.get_analyze_executor()
+    try:
+        assert executor.max_workers == 3
+        assert executor.max_queue == 7
+        assert analyze_executor.get_analyze_executor() is executor
+    finally:
+        analyze_executor.shutdown_analyze_executor()
+
+
+async def test_get_analyze_executor_stats():
+    analyze_executor.shutdown_analyze_executor()
+    assert analyze_executor.get_analyze_executor_stats() is None
+
+    try:
+        await analyze_executor.get_analyze_executor().run(lambda: None)
+        stats = analyze_executor.get_analyze_executor_stats()
+    finally:
+        analyze_executor.shutdown_analyze_executor()
+
+    assert stats.completed == 1
+    assert stats.rejected == 0
@@ -0,0 +1,84 @@
+"""Unit tests for the batch analysis process pool."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("sudachipy", reason="sudachipy is required for pitch analyzer")
+pytest.importorskip("jaconv", reason="jaconv is required for pitch analyzer")
+
+from app.services import analyze_pool
+from app.services.analyze_executor import ExecutorSaturated
+
+
+def test_chunk_preserves_order_and_covers_all_texts():
+    texts = [str(i) for i in range(23)]
+
+    chunks = analyze_pool._chunk(texts, workers=2)
+
+    assert len(chunks) <= 2 * analyze_pool.CHUNKS_PER_WORKER
+    assert [t for chunk in chunks for t in chunk] == texts
+
+
+async def test_analyze_batch_returns_results_in_input_order(monkeypatch):
+    monkeypatch.setattr(analyze_pool, "analyze_text", lambda text: [text])
+    texts = [f"text-{i}" for i in range(50)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = await analyze_pool.analyze_batch(texts, pool=pool, workers=4)
+
+    assert results == [[text] for text in texts]
+
+
+async def test_analyze_batch_rejects_beyond_concurrency_limit(monkeypatch):
+    monkeypatch.setattr(analyze_pool.settings, "analyze_batch_concurrency", 1)
+    release = threading.Event()
+    monkeypatch.setattr(analyze_pool, "analyze_text", lambda text: release.wait() and [text])
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        running = asyncio.ensure_future(analyze_pool.analyze_batch(["a"], pool=pool, workers=1))
+        await asyncio.sleep(0.01)
+        try:
+            with pytest.raises(ExecutorSaturated):
+                await analyze_pool.analyze_batch(["b"], pool=pool, workers=1)
+        finally:
+            release.set()
+        assert await running == [["a"]]
+
+        # The slot is released once the running batch finishes
+        assert await analyze_pool.analyze_batch(["c"], pool=pool, workers=1) == [["c"]]
+
+
+async def test_analyze_batch_in_default_threadpool_with_real_tokenizer(monkeypatch):
+    # analyze_workers=0: chunks of one batch tokenize on several threads at once
+    monkeypatch.setattr(analyze_pool.settings, "analyze_workers", 0)
+    texts = ["雨が降っています。" * 300] * 16
+
+    results = await analyze_pool.analyze_batch(texts)
+
+    assert all(len(words) == len(results[0]) > 0 for words in results)
+
+
+async def test_analyze_batch_rejects_overlong_text_before_scheduling(monkeypatch):
+    monkeypatch.setattr(analyze_pool, "_run_batch", None)  # Must not be reached
+
+    with pytest.raises(ValueError, match="maximum length"):
+        await analyze_pool.analyze_batch(["ok", "x" * (analyze_pool.MAX_TEXT_LENGTH + 1)])
+
+
+async def test_analyze_batch_empty():
+    assert await analyze_pool.analyze_batch([]) == []
+
+
+async def test_analyze_batch_in_worker_processes():
+    pool = analyze_pool.create_analyze_pool(2)
+    try:
+        results = await analyze_pool.analyze_batch(["猫です", "", "雨"], pool=pool, workers=2)
+    finally:
+        pool.shutdown()
+
+    assert [w.surface for w in results[0]] == ["猫", "です"]
+    assert results[1] == []
+    assert [w.surface for w in results[2]] == ["雨"]
@@ -5,10 +5,12 @@ import pytest
 pytest.importorskip("sudachipy", reason="sudachipy is required for pitch analyzer")
 pytest.importorskip("jaconv", reason="jaconv is required for pitch analyzer")
 
+from app.models.schemas import WordPitch
 from app.services import pitch_analyzer
 from app.services.pitch import analyzer as pitch_analyzer_module
 from app.services.pitch import tokenizer as tokenizer_module
 from app.services.pitch import lookup as lookup_module
+from app.services.pitch import token_cache as token_cache_module
 
 
 class StubToken:
@@ -144,3 +146,83 @@ def test_analyze_text_proper_noun_in_dictionary(monkeypatch):
     assert result[0].source == "dictionary_proper"
     assert result[0].confidence == "high"
     assert result[0].pitch_pattern
+
+
+def test_analyze_text_memoizes_repeated_tokens(monkeypatch, stub_particle, stub_proper):
+    tokens = [
+        StubToken("hello", "hello", "noun"),
+        StubToken("world", "world", "noun"),
+        StubToken("hello", "hello", "noun"),
+    ]
+    calls = []
+
+    def counting_lookup(surface, *_args, **_kwargs):
+        calls.append(surface)
+        return pitch_analyzer.PitchLookupResult(0, None, None, source="dictionary")
+
+    monkeypatch.setattr(pitch_analyzer_module, "get_tokenizer", lambda: StubTokenizer(tokens))
+    monkeypatch.setattr(pitch_analyzer_module, "lookup_pitch", counting_lookup)
+
+    first = pitch_analyzer.analyze_text("ignored")
+    second = pitch_analyzer.analyze_text("ignored")
+
+    assert calls == ["hello", "world"]
+    assert first == second
+    assert first[0] is not first[2]  # Each occurrence gets its own instance
+    stats = pitch_analyzer.get_token_cache_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (4, 2, 2)
+
+
+def test_token_cache_entries_are_independent_of_callers():
+    key = ("hello", "hello", "hello", "hello", ("noun",))
+    word = WordPitch(
+        surface="hello",
+        reading="hello",
+        accent_type=0,
+        mora_count=2,
+        morae=["he", "llo"],
+        pitch_pattern=["L", "H"],
+        part_of_speech="noun",
+    )
+    token_cache_module.save_token(key, word)
+    word.morae.append("saved")
+
+    hit = token_cache_module.get_cached_token(key)
+    hit.morae.append("mutated")
+    hit.pitch_pattern[0] = "H"
+
+    again = token_cache_module.get_cached_token(key)
+    assert again.morae == ["he", "llo"]
+    assert again.pitch_pattern == ["L", "H"]
+
+
+def test_analyze_text_token_cache_keys_on_pos(monkeypatch, default_lookup, stub_particle, stub_proper):
+    tokens = [
+        StubToken("hello", "hello", "noun"),
+        StubToken("hello", "hello", "verb"),
+    ]
+    monkeypatch.setattr(pitch_analyzer_module, "get_tokenizer", lambda: StubTokenizer(tokens))
+
+    result = pitch_analyzer.analyze_text("ignored")
+
+    assert [word.part_of_speech for word in result] == ["noun", "verb"]
+
+
+def test_analyze_text_token_cache_disabled(monkeypatch, stub_tokenizer, default_lookup, stub_particle, stub_proper):
+    monkeypatch.setattr(token_cache_module.settings, "token_cache_size", 0)
+
+    pitch_analyzer.analyze_text("ignored")
+
+    assert pitch_analyzer.get_token_cache_stats().entries == 0
+
+
+def test_iter_analyze_text_validates_eagerly():
+    with pytest.raises(ValueError):
+        pitch_analyzer.iter_analyze_text("あ" * (pitch_analyzer_module.MAX_TEXT_LENGTH + 1))
+
+
+def test_iter_analyze_text_yields_words_lazily(stub_tokenizer, default_lookup, stub_particle, stub_proper):
+    words = pitch_analyzer.iter_analyze_text("ignored")
+
+    assert next(words).surface == "hello"
+    assert [word.surface for word in words] == ["world"]
@@ -1,18 +1,26 @@
 """API tests for analyze endpoint."""
 
+import asyncio
+import json
+import threading
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 pytest.importorskip("sudachipy", reason="sudachipy is required for analyze router")
 pytest.importorskip("jaconv", reason="jaconv is required for analyze router")
 
 from app.models.schemas import WordPitch
 from app.routers import analyze as analyze_router
+from app.services import analyze_cache
+from app.services.analyze_executor import BoundedExecutor
 
 
 @pytest.fixture()
 def client():
+    analyze_cache.clear_analyze_cache()
     app = FastAPI()
     app.include_router(analyze_router.router, prefix="/api")
     return TestClient(app)
@@ -56,3 +64,272 @@ def test_analyze_missing_text(client):
     response = client.post("/api/analyze", json={})
 
     assert response.status_code == 422
+
+
+def test_analyze_batch_preserves_order(client, monkeypatch):
+    async def fake_analyze_batch(texts):
+        return [
+            [
+                WordPitch(
+                    surface=text,
+                    reading=text,
+                    accent_type=0,
+                    mora_count=1,
+                    morae=[text],
+                    pitch_pattern=["L"],
+                    part_of_speech="noun",
+                )
+            ]
+            for text in texts
+        ]
+
+    monkeypatch.setattr(analyze_router, "analyze_batch", fake_analyze_batch)
+
+    response = client.post("/api/analyze/batch", json={"texts": ["one", " two ", "three"]})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["text"] for r in results] == ["one", " two ", "three"]
+    assert [r["words"][0]["surface"] for r in results] == ["one", "two", "three"]
+
+
+def test_analyze_batch_rejects_empty_list(client):
+    response = client.post("/api/analyze/batch", json={"texts": []})
+
+    assert response.status_code == 422
+
+
+def test_analyze_batch_pool_failure_returns_503(client, monkeypatch):
+    async def broken_batch(texts):
+        raise analyze_router.BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(analyze_router, "analyze_batch", broken_batch)
+
+    response = client.post("/api/analyze/batch", json={"texts": ["one"]})
+
+    assert response.status_code == 503
+
+
+def test_analyze_batch_saturated_returns_503(client, monkeypatch):
+    async def saturated_batch(texts):
+        raise analyze_router.ExecutorSaturated("full")
+
+    monkeypatch.setattr(analyze_router, "analyze_batch", saturated_batch)
+
+    response = client.post("/api/analyze/batch", json={"texts": ["one"]})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+def test_analyze_reports_server_timing(client, monkeypatch):
+    monkeypatch.setattr(analyze_router, "analyze_text", lambda text: [])
+
+    response = client.post("/api/analyze", json={"text": "test"})
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("queue;dur=")
+    assert "analyze;dur=" in response.headers["server-timing"]
+
+
+def test_analyze_saturated_returns_503(client, monkeypatch):
+    class SaturatedExecutor:
+        async def run(self, fn, *args):
+            raise analyze_router.ExecutorSaturated("full")
+
+    monkeypatch.setattr(analyze_router, "get_analyze_executor", lambda: SaturatedExecutor())
+
+    response = client.post("/api/analyze", json={"text": "test"})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+def test_analyze_serves_repeat_text_from_cache(client, monkeypatch):
+    calls = []
+
+    def fake_analyze_text(text: str):
+        calls.append(text)
+        return [
+            WordPitch(
+                surface="test",
+                reading="test",
+                accent_type=0,
+                mora_count=1,
+                morae=["te"],
+                pitch_pattern=["L"],
+                part_of_speech="noun",
+            )
+        ]
+
+    monkeypatch.setattr(analyze_router, "analyze_text", fake_analyze_text)
+
+    first = client.post("/api/analyze", json={"text": "test"})
+    second = client.post("/api/analyze", json={"text": "  test "})
+
+    assert calls == ["test"]
+    assert second.status_code == 200
+    assert second.headers["server-timing"] == "cache;desc=hit"
+    assert second.json()["text"] == "  test "
+    assert second.json()["words"] == first.json()["words"]
+
+
+def test_analyze_cache_stats_endpoint(client, monkeypatch):
+    monkeypatch.setattr(analyze_router.settings, "debug", True)
+    monkeypatch.setattr(analyze_router.settings, "admin_api_key", "")
+    monkeypatch.setattr(analyze_router, "analyze_text", lambda text: [])
+
+    client.post("/api/analyze", json={"text": "test"})
+    client.post("/api/analyze", json={"text": "test"})
+    response = client.get("/api/analyze/cache/stats")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["hits"] == 1
+    assert payload["misses"] == 1
+    assert payload["memory"]["entries"] == 1
+    assert payload["executor"]["completed"] >= 1
+    assert payload["executor"]["in_flight"] == 0
+
+
+def test_analyze_stream_emits_one_word_per_line(client, monkeypatch):
+    def fake_iter_analyze_text(text: str):
+        for surface in ("a", "b"):
+            yield WordPitch(
+                surface=surface,
+                reading=surface,
+                accent_type=0,
+                mora_count=1,
+                morae=[surface],
+                pitch_pattern=["L"],
+                part_of_speech="noun",
+            )
+
+    monkeypatch.setattr(analyze_router, "iter_analyze_text", fake_iter_analyze_text)
+
+    response = client.post("/api/analyze/stream", json={"text": "ab"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["surface"] for line in lines] == ["a", "b"]
+
+
+def _stream_words(surfaces, threads=None):
+    for surface in surfaces:
+        if threads is not None:
+            threads.append(threading.current_thread().name)
+        yield WordPitch(
+            surface=surface,
+            reading=surface,
+            accent_type=0,
+            mora_count=1,
+            morae=[surface],
+            pitch_pattern=["L"],
+            part_of_speech="noun",
+        )
+
+
+def test_analyze_stream_runs_chunks_on_executor(client, monkeypatch):
+    threads = []
+    executor = BoundedExecutor("stream-test", max_workers=1, max_queue=0)
+    monkeypatch.setattr(analyze_router, "STREAM_CHUNK_WORDS", 2)
+    monkeypatch.setattr(analyze_router, "get_analyze_executor", lambda: executor)
+    monkeypatch.setattr(
+        analyze_router, "iter_analyze_text", lambda text: _stream_words("abcde", threads)
+    )
+
+    try:
+        response = client.post("/api/analyze/stream", json={"text": "abcde"})
+    finally:
+        executor.shutdown()
+
+    assert response.status_code == 200
+    assert [json.loads(line)["surface"] for line in response.text.splitlines()] == list("abcde")
+    assert all(name.startswith("stream-test") for name in threads)
+    assert executor.stats().completed == 4  # 2 + 2 + 1 words, then the empty end chunk
+
+
+def test_analyze_stream_saturated_returns_503(client, monkeypatch):
+    class SaturatedExecutor:
+        async def run(self, fn, *args):
+            raise analyze_router.ExecutorSaturated("full")
+
+    monkeypatch.setattr(analyze_router, "get_analyze_executor", lambda: SaturatedExecutor())
+    monkeypatch.setattr(analyze_router, "iter_analyze_text", lambda text: _stream_words("ab"))
+
+    response = client.post("/api/analyze/stream", json={"text": "ab"})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+def test_analyze_stream_waits_when_saturated_mid_stream(client, monkeypatch):
+    class FlakyExecutor:
+        calls = 0
+
+        async def run(self, fn, *args):
+            self.calls += 1
+            if self.calls == 2:
+                raise analyze_router.ExecutorSaturated("full")
+            return fn(*args), None
+
+    monkeypatch.setattr(analyze_router, "STREAM_CHUNK_WORDS", 1)
+    monkeypatch.setattr(analyze_router, "STREAM_RETRY_SECONDS", 0)
+    monkeypatch.setattr(analyze_router, "get_analyze_executor", lambda: FlakyExecutor())
+    monkeypatch.setattr(analyze_router, "iter_analyze_text", lambda text: _stream_words("ab"))
+
+    response = client.post("/api/analyze/stream", json={"text": "ab"})
+
+    assert response.status_code == 200
+    assert [json.loads(line)["surface"] for line in response.text.splitlines()] == ["a", "b"]
+
+
+async def test_analyze_concurrent_requests_share_no_tokenizer():
+    # Real tokenizer: a SudachiPy Tokenizer can't be used by two executor threads at once
+    executor = BoundedExecutor("tokenizer-test", max_workers=8, max_queue=0)
+    texts = [f"東京都の天気は晴れです。{i}" * 100 for i in range(8)]
+    try:
+        results = await asyncio.gather(
+            *(executor.run(analyze_router._analyze_blocking, text) for text in texts)
+        )
+    finally:
+        executor.shutdown()
+
+    words = [words for (_, words), _ in results]
+    assert all(len(w) == len(words[0]) > 0 for w in words)
+
+
+async def test_analyze_concurrent_streams_with_real_tokenizer(monkeypatch):
+    monkeypatch.setattr(analyze_router, "STREAM_CHUNK_WORDS", 8)
+    app = FastAPI()
+    app.include_router(analyze_router.router, prefix="/api")
+    text = "東京都の天気は晴れです。" * 100
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
+        responses = await asyncio.gather(
+            *(http.post("/api/analyze/stream", json={"text": text}) for _ in range(4)),
+            *(http.post("/api/analyze", json={"text": text}) for _ in range(4)),
+        )
+
+    assert [r.status_code for r in responses] == [200] * 8
+    streamed = [len(r.text.splitlines()) for r in responses[:4]]
+    assert streamed == [len(responses[4].json()["words"])] * 4
+
+
+def test_analyze_stream_rejects_empty_text(client):
+    response = client.post("/api/analyze/stream", json={"text": "   "})
+
+    assert response.status_code == 400
+
+
+def test_analyze_stream_value_error_returns_400(client, monkeypatch):
+    def fake_iter_analyze_text(text: str):
+        raise ValueError("Text exceeds maximum length")
+
+    monkeypatch.setattr(analyze_router, "iter_analyze_text", fake_iter_analyze_text)
+
+    response = client.post("/api/analyze/stream", json={"text": "test"})
+
+    assert response.status_code == 400
+    assert "maximum length" in response.json()["detail"]
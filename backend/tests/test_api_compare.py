@@ -1,6 +1,8 @@
 """API tests for compare endpoints."""
 
+import asyncio
 import base64
+import threading
 from types import SimpleNamespace
 
 import pytest
@@ -9,10 +11,12 @@ from fastapi.testclient import TestClient
 
 pytest.importorskip("azure.cognitiveservices.speech", reason="Azure SDK required for TTS")
 pytest.importorskip("parselmouth", reason="parselmouth required for audio compare")
-pytest.importorskip("fastdtw", reason="fastdtw required for audio compare")
 pytest.importorskip("numpy", reason="numpy required for audio compare")
 pytest.importorskip("scipy", reason="scipy required for audio compare")
 
+import numpy as np
+
+from app.models.schemas import WordPitch
 from app.routers import compare as compare_router
 
 
@@ -21,6 +25,36 @@ def make_wav_bytes(payload_len: int = 0) -> bytes:
     return header + (b"\x00" * payload_len)
 
 
+def make_user_pitch(trim_start_ms: int = 0, trim_end_ms: int = 0):
+    return SimpleNamespace(
+        pitch_values=[100.0, 105.0], trim_start_ms=trim_start_ms, trim_end_ms=trim_end_ms
+    )
+
+
+def as_async(fn):
+    async def wrapper(*args, **kwargs):
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+@pytest.fixture(autouse=True)
+def stub_native_pitch(monkeypatch):
+    monkeypatch.setattr(
+        compare_router,
+        "get_native_pitch",
+        as_async(lambda text, audio: SimpleNamespace(pitch_values=[110.0, 120.0])),
+    )
+
+
+@pytest.fixture(autouse=True)
+def stub_user_pitch(monkeypatch):
+    monkeypatch.setattr(
+        compare_router,
+        "extract_pitch_in_pool",
+        as_async(lambda audio, engine, trim: make_user_pitch()),
+    )
+
+
 @pytest.fixture()
 def client():
     app = FastAPI()
@@ -34,7 +68,7 @@ def test_compare_base64_success(client, monkeypatch):
     def fake_synthesize_speech(text: str):
         return wav_bytes, False
 
-    def fake_compare_audio(native_audio: bytes, user_audio: bytes):
+    def fake_compare_pitch(native_pitch, user_pitch):
         return SimpleNamespace(
             score=80,
             native_pitch=[1.0, 2.0],
@@ -43,8 +77,8 @@ def test_compare_base64_success(client, monkeypatch):
             aligned_user=[1.0],
         )
 
-    monkeypatch.setattr(compare_router, "synthesize_speech", fake_synthesize_speech)
-    monkeypatch.setattr(compare_router, "compare_audio", fake_compare_audio)
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
 
     payload = {
         "text": "hello",
@@ -66,7 +100,7 @@ def test_compare_base64_data_uri_success(client, monkeypatch):
     def fake_synthesize_speech(text: str):
         return wav_bytes, False
 
-    def fake_compare_audio(native_audio: bytes, user_audio: bytes):
+    def fake_compare_pitch(native_pitch, user_pitch):
         return SimpleNamespace(
             score=95,
             native_pitch=[1.0],
@@ -75,8 +109,8 @@ def test_compare_base64_data_uri_success(client, monkeypatch):
             aligned_user=[1.0],
         )
 
-    monkeypatch.setattr(compare_router, "synthesize_speech", fake_synthesize_speech)
-    monkeypatch.setattr(compare_router, "compare_audio", fake_compare_audio)
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
 
     payload = {
         "text": "hello",
@@ -134,7 +168,7 @@ def test_compare_tts_error(client, monkeypatch):
     def fake_synthesize_speech(text: str):
         raise compare_router.TTSError("boom")
 
-    monkeypatch.setattr(compare_router, "synthesize_speech", fake_synthesize_speech)
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
 
     payload = {
         "text": "hello",
@@ -153,11 +187,11 @@ def test_compare_compare_error(client, monkeypatch):
     def fake_synthesize_speech(text: str):
         return wav_bytes, False
 
-    def fake_compare_audio(native_audio: bytes, user_audio: bytes):
+    def fake_compare_pitch(native_pitch, user_pitch):
         raise compare_router.CompareError("no pitch")
 
-    monkeypatch.setattr(compare_router, "synthesize_speech", fake_synthesize_speech)
-    monkeypatch.setattr(compare_router, "compare_audio", fake_compare_audio)
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
 
     payload = {
         "text": "hello",
@@ -176,11 +210,11 @@ def test_compare_compare_unexpected_error(client, monkeypatch):
     def fake_synthesize_speech(text: str):
         return wav_bytes, False
 
-    def fake_compare_audio(native_audio: bytes, user_audio: bytes):
+    def fake_compare_pitch(native_pitch, user_pitch):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(compare_router, "synthesize_speech", fake_synthesize_speech)
-    monkeypatch.setattr(compare_router, "compare_audio", fake_compare_audio)
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
 
     payload = {
         "text": "hello",
@@ -199,7 +233,7 @@ def test_compare_upload_success(client, monkeypatch):
     def fake_synthesize_speech(text: str):
         return wav_bytes, False
 
-    def fake_compare_audio(native_audio: bytes, user_audio: bytes):
+    def fake_compare_pitch(native_pitch, user_pitch):
         return SimpleNamespace(
             score=90,
             native_pitch=[1.0],
@@ -208,8 +242,8 @@ def test_compare_upload_success(client, monkeypatch):
             aligned_user=[1.0],
         )
 
-    monkeypatch.setattr(compare_router, "synthesize_speech", fake_synthesize_speech)
-    monkeypatch.setattr(compare_router, "compare_audio", fake_compare_audio)
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
 
     response = client.post(
         "/api/compare/upload",
@@ -229,7 +263,7 @@ def test_compare_upload_audio_too_small(client, monkeypatch):
     def fake_synthesize_speech(text: str):
         return wav_bytes, False
 
-    monkeypatch.setattr(compare_router, "synthesize_speech", fake_synthesize_speech)
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
 
     response = client.post(
         "/api/compare/upload",
@@ -248,7 +282,7 @@ def test_compare_upload_invalid_audio_format(client, monkeypatch):
     def fake_synthesize_speech(text: str):
         return wav_bytes, False
 
-    monkeypatch.setattr(compare_router, "synthesize_speech", fake_synthesize_speech)
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
 
     response = client.post(
         "/api/compare/upload",
@@ -258,3 +292,762 @@ def test_compare_upload_invalid_audio_format(client, monkeypatch):
 
     assert response.status_code == 400
     assert response.json()["detail"] == "Invalid audio format - expected WAV, WebM, MP4, or OGG"
+
+
+def test_compare_uses_native_pitch_from_cache(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+    seen = {}
+
+    def fake_compare_pitch(native_pitch, user_pitch):
+        seen["native_pitch"] = native_pitch
+        seen["user_pitch"] = user_pitch
+        return SimpleNamespace(
+            score=95,
+            native_pitch=[1.0],
+            user_pitch=[1.0],
+            aligned_native=[1.0],
+            aligned_user=[1.0],
+        )
+
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(lambda text: (wav_bytes, True)))
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
+
+    payload = {
+        "text": "hello",
+        "user_audio_base64": base64.b64encode(wav_bytes).decode("ascii"),
+    }
+
+    response = client.post("/api/compare", json=payload)
+
+    assert response.status_code == 200
+    assert seen["native_pitch"] == [110.0, 120.0]
+    assert seen["user_pitch"] == [100.0, 105.0]
+
+
+def test_compare_with_tts_key_skips_synthesis(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+    seen = {}
+
+    def fail_synthesize(text):
+        raise AssertionError("should not synthesize when the clip is cached")
+
+    async def fake_by_key(cache_key):
+        seen["key"] = cache_key
+        return SimpleNamespace(pitch_values=[130.0, 140.0])
+
+    def fake_compare_pitch(native_pitch, user_pitch):
+        seen["native_pitch"] = native_pitch
+        return SimpleNamespace(
+            score=90,
+            native_pitch=[1.0],
+            user_pitch=[1.0],
+            aligned_native=[1.0],
+            aligned_user=[1.0],
+        )
+
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fail_synthesize))
+    monkeypatch.setattr(compare_router, "get_native_pitch_by_key", fake_by_key)
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
+
+    response = client.post(
+        "/api/compare",
+        json={
+            "text": "hello",
+            "user_audio_base64": base64.b64encode(wav_bytes).decode("ascii"),
+            "tts_key": "0123456789abcdef",
+        },
+    )
+
+    assert response.status_code == 200
+    assert seen == {"key": "0123456789abcdef", "native_pitch": [130.0, 140.0]}
+
+
+def test_compare_with_evicted_tts_key_falls_back_to_tts(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+    seen = {}
+
+    def fake_compare_pitch(native_pitch, user_pitch):
+        seen["native_pitch"] = native_pitch
+        return SimpleNamespace(
+            score=90,
+            native_pitch=[1.0],
+            user_pitch=[1.0],
+            aligned_native=[1.0],
+            aligned_user=[1.0],
+        )
+
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(lambda text: (wav_bytes, False)))
+    monkeypatch.setattr(compare_router, "get_native_pitch_by_key", as_async(lambda cache_key: None))
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
+
+    response = client.post(
+        "/api/compare/upload",
+        data={"text": "hello", "tts_key": "0123456789abcdef"},
+        files={"user_audio": ("audio.wav", wav_bytes, "audio/wav")},
+    )
+
+    assert response.status_code == 200
+    assert seen["native_pitch"] == [110.0, 120.0]
+
+
+def test_compare_rejects_malformed_tts_key(client):
+    response = client.post(
+        "/api/compare",
+        json={
+            "text": "hello",
+            "user_audio_base64": base64.b64encode(make_wav_bytes()).decode("ascii"),
+            "tts_key": "../../etc",
+        },
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [{"voices": ["female1", "male1"]}, {"segments": True}, {"mode": "target"}],
+)
+def test_compare_rejects_tts_key_it_would_ignore(client, monkeypatch, extra):
+    monkeypatch.setattr(compare_router, "get_native_pitch_by_key", None)  # Must not be reached
+
+    response = client.post(
+        "/api/compare",
+        json={
+            "text": "hello",
+            "user_audio_base64": base64.b64encode(make_wav_bytes()).decode("ascii"),
+            "tts_key": "0123456789abcdef",
+            **extra,
+        },
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("tts_key can only be used")
+
+
+def test_compare_upload_rejects_tts_key_with_segments(client):
+    response = client.post(
+        "/api/compare/upload",
+        data={"text": "hello", "tts_key": "0123456789abcdef", "segments": "true"},
+        files={"user_audio": ("rec.wav", make_wav_bytes(), "audio/wav")},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("tts_key can only be used")
+
+
+def test_compare_live_rejects_tts_key_in_target_mode(client):
+    with client.websocket_connect("/api/compare/live") as ws:
+        ws.send_json({"text": "hello", "mode": "target", "tts_key": "0123456789abcdef"})
+        message = ws.receive_json()
+
+    assert message["detail"] == "Invalid start message: tts_key can only be used with mode 'tts'"
+
+
+def test_compare_timeout_returns_504(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+
+    def fake_compare_pitch(native_pitch, user_pitch):
+        raise compare_router.AudioTaskTimeout("too slow")
+
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(lambda text: (wav_bytes, False)))
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
+
+    payload = {
+        "text": "hello",
+        "user_audio_base64": base64.b64encode(wav_bytes).decode("ascii"),
+    }
+
+    response = client.post("/api/compare", json=payload)
+
+    assert response.status_code == 504
+
+
+def test_compare_user_extraction_error_returns_422(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+
+    async def failing_extract(audio, engine, trim):
+        raise compare_router.CompareError("no voice")
+
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(lambda text: (wav_bytes, False)))
+    monkeypatch.setattr(compare_router, "extract_pitch_in_pool", failing_extract)
+
+    response = client.post(
+        "/api/compare/upload",
+        data={"text": "hello"},
+        files={"user_audio": ("test.wav", wav_bytes, "audio/wav")},
+    )
+
+    assert response.status_code == 422
+
+
+def test_compare_extracts_user_pitch_while_tts_runs(client, monkeypatch):
+    """User extraction must start before native synthesis finishes."""
+    wav_bytes = make_wav_bytes()
+    user_started = threading.Event()
+    seen = {}
+
+    def slow_synthesize_speech(text: str):
+        # Blocks the TTS branch until the user branch has started
+        seen["overlapped"] = user_started.wait(timeout=5)
+        return wav_bytes, False
+
+    async def fake_extract(audio, engine, trim):
+        user_started.set()
+        return make_user_pitch()
+
+    def fake_compare_pitch(native_pitch, user_pitch):
+        return SimpleNamespace(
+            score=90,
+            native_pitch=[1.0],
+            user_pitch=[1.0],
+            aligned_native=[1.0],
+            aligned_user=[1.0],
+        )
+
+    monkeypatch.setattr(
+        compare_router, "synthesize_speech_async", lambda text: asyncio.to_thread(slow_synthesize_speech, text)
+    )
+    monkeypatch.setattr(compare_router, "extract_pitch_in_pool", fake_extract)
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
+
+    payload = {
+        "text": "hello",
+        "user_audio_base64": base64.b64encode(wav_bytes).decode("ascii"),
+    }
+
+    response = client.post("/api/compare", json=payload)
+
+    assert response.status_code == 200
+    assert seen["overlapped"] is True
+
+
+def live_pcm(seconds: float = 0.5, freq: float = 180.0, rate: int = 16000) -> bytes:
+    t = np.arange(int(seconds * rate)) / rate
+    return (0.5 * np.sin(2 * np.pi * freq * t) * 32767).astype("<i2").tobytes()
+
+
+def test_compare_live_streams_pitch_then_result(client, monkeypatch):
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(lambda text: (make_wav_bytes(), True)))
+    pcm = live_pcm()
+
+    with client.websocket_connect("/api/compare/live") as ws:
+        ws.send_json({"text": "hello", "sample_rate": 16000})
+        messages = []
+        for i in range(0, len(pcm), 3200):
+            ws.send_bytes(pcm[i:i + 3200])
+            messages.append(ws.receive_json())
+            if messages[-1]["type"] == "native":
+                messages.append(ws.receive_json())
+        ws.send_json({"type": "end"})
+        result = ws.receive_json()
+        if result["type"] == "native":
+            messages.append(result)
+            result = ws.receive_json()
+
+    pitch_messages = [m for m in messages if m["type"] == "pitch"]
+    assert len(pitch_messages) == len(range(0, len(pcm), 3200))
+    frames = [hz for m in pitch_messages for hz in m["pitch"]]
+    assert sum(hz > 0 for hz in frames) > 30
+    assert {"type": "native", "native_pitch": [110.0, 120.0]} in messages
+    assert result["type"] == "result"
+    assert 0 <= result["score"] <= 100
+    assert result["feedback"]
+
+
+def test_compare_live_refuses_sessions_beyond_limit(client, monkeypatch):
+    monkeypatch.setattr(compare_router.settings, "live_max_sessions", 1)
+
+    with client.websocket_connect("/api/compare/live") as first:
+        with client.websocket_connect("/api/compare/live") as second:
+            message = second.receive_json()
+        first.send_json({"sample_rate": 16000})
+        first.receive_json()
+
+    assert message == {"type": "error", "detail": "Too many live sessions - please try again"}
+
+    # The slot is released when a session ends
+    with client.websocket_connect("/api/compare/live") as ws:
+        ws.send_json({"sample_rate": 16000})
+        assert ws.receive_json()["detail"].startswith("Invalid start message")
+    assert compare_router._live_sessions == 0
+
+
+def test_compare_live_invalid_start_message(client):
+    with client.websocket_connect("/api/compare/live") as ws:
+        ws.send_json({"sample_rate": 16000})
+        message = ws.receive_json()
+
+    assert message["type"] == "error"
+    assert message["detail"].startswith("Invalid start message")
+
+
+@pytest.mark.parametrize("raw", ["[]", "1", '"end"', "{not json"])
+def test_compare_live_rejects_non_object_messages(client, monkeypatch, raw):
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(lambda text: (make_wav_bytes(), True)))
+
+    with client.websocket_connect("/api/compare/live") as ws:
+        ws.send_json({"text": "hello", "sample_rate": 16000})
+        ws.send_text(raw)
+        message = ws.receive_json()
+        if message["type"] == "native":
+            message = ws.receive_json()
+        close = ws.receive()
+
+    assert message["type"] == "error"
+    assert message["detail"].startswith("Invalid message")
+    assert close["code"] == 1008
+
+
+def test_compare_live_rejects_non_object_start_message(client):
+    with client.websocket_connect("/api/compare/live") as ws:
+        ws.send_text("[]")
+        message = ws.receive_json()
+        close = ws.receive()
+
+    assert message["detail"] == "Invalid start message: expected a JSON object"
+    assert close["code"] == 1008
+
+
+def test_compare_live_tts_error(client, monkeypatch):
+    def fake_synthesize_speech(text: str):
+        raise compare_router.TTSError("boom")
+
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
+
+    with client.websocket_connect("/api/compare/live") as ws:
+        ws.send_json({"text": "hello", "sample_rate": 16000})
+        ws.send_json({"type": "end"})
+        message = ws.receive_json()
+
+    assert message == {"type": "error", "detail": "Speech synthesis temporarily unavailable"}
+
+
+def test_compare_live_no_voice_returns_error(client, monkeypatch):
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(lambda text: (make_wav_bytes(), True)))
+
+    with client.websocket_connect("/api/compare/live") as ws:
+        ws.send_json({"text": "hello", "sample_rate": 16000})
+        ws.send_bytes(b"\x00" * 16000)
+        while ws.receive_json()["type"] != "pitch":
+            pass
+        ws.send_json({"type": "end"})
+        message = ws.receive_json()
+        if message["type"] == "native":  # Native may resolve after the last chunk
+            message = ws.receive_json()
+
+    assert message == {"type": "error", "detail": "Could not process audio - please try recording again"}
+
+
+def test_compare_upload_reports_vad_trim(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+    seen = {}
+
+    async def fake_extract(audio, engine, trim):
+        seen["trim"] = trim
+        return make_user_pitch(trim_start_ms=850, trim_end_ms=1200)
+
+    def fake_compare_pitch(native_pitch, user_pitch):
+        return SimpleNamespace(
+            score=90,
+            native_pitch=[1.0],
+            user_pitch=[1.0],
+            aligned_native=[1.0],
+            aligned_user=[1.0],
+        )
+
+    monkeypatch.setattr(compare_router.settings, "compare_vad_trim", True)
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(lambda text: (wav_bytes, True)))
+    monkeypatch.setattr(compare_router, "extract_pitch_in_pool", fake_extract)
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
+
+    response = client.post(
+        "/api/compare/upload",
+        data={"text": "hello"},
+        files={"user_audio": ("test.wav", wav_bytes, "audio/wav")},
+    )
+
+    assert response.status_code == 200
+    assert seen["trim"] is True
+    assert response.json()["user_trim_start_ms"] == 850
+    assert response.json()["user_trim_end_ms"] == 1200
+
+
+def test_compare_target_mode_skips_tts(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+    seen = {}
+
+    def fail_synthesize_speech(text: str):
+        raise AssertionError("target mode must not call TTS")
+
+    async def no_cached_analysis(text):
+        return None
+
+    def fake_analyze_text(text):
+        return [
+            WordPitch(
+                surface="雨",
+                reading="あめ",
+                accent_type=1,
+                mora_count=2,
+                morae=["あ", "め"],
+                pitch_pattern=["H", "L"],
+                part_of_speech="名詞",
+            )
+        ]
+
+    def fake_compare_pitch(native_pitch, user_pitch):
+        seen["native_pitch"] = native_pitch
+        return SimpleNamespace(
+            score=70,
+            native_pitch=[1.0],
+            user_pitch=[1.0],
+            aligned_native=[1.0],
+            aligned_user=[1.0],
+        )
+
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fail_synthesize_speech))
+    monkeypatch.setattr(compare_router, "get_cached_analysis", no_cached_analysis)
+    monkeypatch.setattr(compare_router, "analyze_text", fake_analyze_text)
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
+
+    payload = {
+        "text": "雨",
+        "user_audio_base64": base64.b64encode(wav_bytes).decode("ascii"),
+        "mode": "target",
+    }
+
+    response = client.post("/api/compare", json=payload)
+
+    assert response.status_code == 200
+    assert response.json()["score"] == 70
+    # High-then-low target, 12 frames per mora
+    assert len(seen["native_pitch"]) == 24
+    assert seen["native_pitch"][0] > seen["native_pitch"][-1]
+
+
+async def test_target_pitch_concurrent_with_real_tokenizer(monkeypatch):
+    # Real tokenizer on several analysis executor threads at once
+    monkeypatch.setattr(compare_router, "get_cached_analysis", as_async(lambda text: None))
+    texts = ["雨が降っています。" * 300] * 8
+
+    contours = await asyncio.gather(*(compare_router._target_pitch(text) for text in texts))
+
+    assert all(len(contour) == len(contours[0]) > 0 for contour in contours)
+
+
+def test_compare_target_mode_without_morae_returns_400(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+
+    async def no_cached_analysis(text):
+        return None
+
+    monkeypatch.setattr(compare_router, "get_cached_analysis", no_cached_analysis)
+    monkeypatch.setattr(compare_router, "analyze_text", lambda text: [])
+
+    response = client.post(
+        "/api/compare/upload",
+        data={"text": "!!!", "mode": "target"},
+        files={"user_audio": ("test.wav", wav_bytes, "audio/wav")},
+    )
+
+    assert response.status_code == 400
+
+
+def test_compare_rejects_unknown_mode(client):
+    payload = {
+        "text": "hello",
+        "user_audio_base64": base64.b64encode(make_wav_bytes()).decode("ascii"),
+        "mode": "karaoke",
+    }
+
+    response = client.post("/api/compare", json=payload)
+
+    assert response.status_code == 422
+
+
+def test_compare_multiple_voices_scores_each_once(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+    synthesized = []
+    seen = {}
+
+    def fake_synthesize_speech(text, voice):
+        synthesized.append(voice)
+        return wav_bytes, True
+
+    async def fake_get_native_pitch(text, audio, voice):
+        return SimpleNamespace(pitch_values=[float(len(voice))])
+
+    def fake_compare_multi(native_pitches, user_pitch):
+        seen["native_pitches"] = native_pitches
+        seen["user_pitch"] = user_pitch
+        return compare_router.MultiComparisonResult(
+            score=88,
+            distance=1.0,
+            native_pitch=[1.0],
+            user_pitch=[1.0],
+            aligned_native=[1.0],
+            aligned_user=[1.0],
+            alignment_path=[(0, 0)],
+            voice="male1",
+            voice_scores={"female1": 70, "male1": 88},
+        )
+
+    monkeypatch.setattr(compare_router, "get_cached_native_pitches", as_async(lambda text, voices: {}))
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
+    monkeypatch.setattr(compare_router, "get_native_pitch", fake_get_native_pitch)
+    monkeypatch.setattr(compare_router, "compare_pitch_multi_in_pool", as_async(fake_compare_multi))
+
+    payload = {
+        "text": "hello",
+        "user_audio_base64": base64.b64encode(wav_bytes).decode("ascii"),
+        "voices": ["female1", "male1", "female1"],
+    }
+
+    response = client.post("/api/compare", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["score"] == 88
+    assert data["voice"] == "male1"
+    assert data["voice_scores"] == {"female1": 70, "male1": 88}
+    assert sorted(synthesized) == ["female1", "male1"]
+    assert seen == {"native_pitches": {"female1": [7.0], "male1": [5.0]}, "user_pitch": [100.0, 105.0]}
+
+
+def test_compare_multiple_voices_skips_synthesis_for_cached_contours(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+    synthesized = []
+    seen = {}
+
+    def fake_synthesize_speech(text, voice):
+        synthesized.append(voice)
+        return wav_bytes, False
+
+    def fake_cached(text, voices):
+        seen["lookup"] = voices
+        return {"male1": SimpleNamespace(pitch_values=[5.0])}
+
+    def fake_compare_multi(native_pitches, user_pitch):
+        seen["native_pitches"] = native_pitches
+        return compare_router.MultiComparisonResult(
+            score=88, distance=1.0, native_pitch=[1.0], user_pitch=[1.0],
+            aligned_native=[1.0], aligned_user=[1.0], alignment_path=[(0, 0)],
+            voice="male1", voice_scores={"female1": 70, "male1": 88},
+        )
+
+    monkeypatch.setattr(compare_router, "get_cached_native_pitches", as_async(fake_cached))
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
+    monkeypatch.setattr(
+        compare_router, "get_native_pitch", as_async(lambda text, audio, voice: SimpleNamespace(pitch_values=[7.0]))
+    )
+    monkeypatch.setattr(compare_router, "compare_pitch_multi_in_pool", as_async(fake_compare_multi))
+
+    response = client.post(
+        "/api/compare",
+        json={
+            "text": "hello",
+            "user_audio_base64": base64.b64encode(wav_bytes).decode("ascii"),
+            "voices": ["female1", "male1"],
+        },
+    )
+
+    assert response.status_code == 200
+    assert seen["lookup"] == ["female1", "male1"]
+    assert synthesized == ["female1"]
+    assert seen["native_pitches"] == {"female1": [7.0], "male1": [5.0]}
+
+
+def test_compare_single_voice_has_no_voice_scores(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(lambda text: (wav_bytes, True)))
+    monkeypatch.setattr(
+        compare_router,
+        "compare_pitch_in_pool",
+        as_async(lambda native, user: compare_router.ComparisonResult(
+            score=80, distance=1.0, native_pitch=[1.0], user_pitch=[1.0],
+            aligned_native=[1.0], aligned_user=[1.0], alignment_path=[(0, 0)],
+        )),
+    )
+
+    response = client.post(
+        "/api/compare",
+        json={"text": "hello", "user_audio_base64": base64.b64encode(wav_bytes).decode("ascii")},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["voice"] is None
+    assert response.json()["voice_scores"] is None
+
+
+@pytest.mark.parametrize("extra", [{"voices": ["female1", "robot"]}, {"voices": ["female1"], "mode": "target"}])
+def test_compare_rejects_invalid_voices(client, extra):
+    payload = {
+        "text": "hello",
+        "user_audio_base64": base64.b64encode(make_wav_bytes()).decode("ascii"),
+        **extra,
+    }
+
+    response = client.post("/api/compare", json=payload)
+
+    assert response.status_code == 400
+
+
+def test_compare_batch_scores_in_order_and_bulk_inserts(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+    inserts = []
+
+    class FakeTable:
+        def insert(self, rows):
+            inserts.append(rows)
+            return SimpleNamespace(execute=lambda: None)
+
+    def fake_compare_pitch(native_pitch, user_pitch):
+        return SimpleNamespace(score=80, native_pitch=[], user_pitch=[], aligned_native=[], aligned_user=[])
+
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(lambda text: (wav_bytes, True)))
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
+    monkeypatch.setattr(
+        compare_router, "get_supabase_client", lambda token: SimpleNamespace(table=lambda name: FakeTable())
+    )
+    client.app.dependency_overrides[compare_router.get_current_user] = lambda: SimpleNamespace(
+        user_id="u1", access_token="token"
+    )
+
+    response = client.post(
+        "/api/compare/batch",
+        data={"texts": ["one", "two", "three"]},
+        files=[
+            ("recordings", ("1.wav", wav_bytes, "audio/wav")),
+            ("recordings", ("2.wav", b"not audio at all", "audio/wav")),
+            ("recordings", ("3.wav", wav_bytes, "audio/wav")),
+        ],
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["text"] for item in results] == ["one", "two", "three"]
+    assert [item["score"] for item in results] == [80, None, 80]
+    assert results[1]["error"] == "Audio file too small - upload may have failed"
+    assert inserts == [[
+        {"user_id": "u1", "text": "one", "score": 80},
+        {"user_id": "u1", "text": "three", "score": 80},
+    ]]
+
+
+def test_compare_batch_item_failure_does_not_fail_batch(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+
+    def fake_synthesize_speech(text):
+        if text == "bad":
+            raise compare_router.TTSError("down")
+        return wav_bytes, True
+
+    def fake_compare_pitch(native_pitch, user_pitch):
+        return SimpleNamespace(score=70, native_pitch=[], user_pitch=[], aligned_native=[], aligned_user=[])
+
+    monkeypatch.setattr(compare_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
+    monkeypatch.setattr(compare_router, "compare_pitch_in_pool", as_async(fake_compare_pitch))
+
+    response = client.post(
+        "/api/compare/batch",
+        data={"texts": ["bad", "good"]},
+        files=[("recordings", ("1.wav", wav_bytes, "audio/wav")), ("recordings", ("2.wav", wav_bytes, "audio/wav"))],
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["error"] == "Speech synthesis temporarily unavailable"
+    assert results[1]["score"] == 70
+
+
+def test_compare_batch_rejects_mismatched_pairs(client):
+    wav_bytes = make_wav_bytes()
+
+    response = client.post(
+        "/api/compare/batch",
+        data={"texts": ["one", "two"]},
+        files=[("recordings", ("1.wav", wav_bytes, "audio/wav"))],
+    )
+
+    assert response.status_code == 400
+
+
+def test_compare_segments_returns_mora_and_word_scores(client, monkeypatch):
+    wav_bytes = make_wav_bytes()
+    contour = [220.0] * 10 + [150.0] * 10
+    timed = compare_router.TimedPitch(pitch_values=contour, full_curve=contour, duration_ms=200)
+
+    async def no_cached_analysis(text):
+        return None
+
+    def fake_analyze_text(text):
+        return [
+            WordPitch(
+                surface="雨",
+                reading="あめ",
+                accent_type=1,
+                mora_count=2,
+                morae=["あ", "め"],
+                pitch_pattern=["H", "L"],
+                part_of_speech="名詞",
+            )
+        ]
+
+    monkeypatch.setattr(compare_router.settings, "audio_workers", 0)
+    monkeypatch.setattr(
+        compare_router,
+        "get_speech_timings",
+        lambda text: (wav_bytes, [{"text": "雨", "offset_ms": 0.0, "duration_ms": 200.0}]),
+    )
+    monkeypatch.setattr(compare_router, "get_native_pitch", as_async(lambda text, audio: timed))
+    monkeypatch.setattr(compare_router, "extract_pitch_in_pool", as_async(lambda audio, engine, trim: timed))
+    monkeypatch.setattr(compare_router, "get_cached_analysis", no_cached_analysis)
+    monkeypatch.setattr(compare_router, "analyze_text", fake_analyze_text)
+
+    payload = {
+        "text": "雨",
+        "user_audio_base64": base64.b64encode(wav_bytes).decode("ascii"),
+        "segments": True,
+    }
+
+    response = client.post("/api/compare", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["score"] == 100
+    assert [(m["mora"], m["start_ms"], m["end_ms"], m["score"]) for m in data["morae"]] == [
+        ("あ", 0.0, 100.0, 100),
+        ("め", 100.0, 200.0, 100),
+    ]
+    assert data["morae"][1]["user_start_ms"] == 100.0
+    assert data["words"] == [{"surface": "雨", "start_ms": 0.0, "end_ms": 200.0, "score": 100}]
+
+
+async def test_segmented_native_concurrent_with_real_tokenizer(monkeypatch):
+    # Real tokenizer on several analysis executor threads at once
+    text = "雨が降っています。" * 300
+    timed = compare_router.TimedPitch(pitch_values=[200.0] * 10, full_curve=[200.0] * 10, duration_ms=60000)
+    monkeypatch.setattr(compare_router, "get_cached_analysis", as_async(lambda text: None))
+    monkeypatch.setattr(
+        compare_router,
+        "get_speech_timings",
+        lambda text: (make_wav_bytes(), [{"text": "雨", "offset_ms": 0.0, "duration_ms": 200.0}]),
+    )
+    monkeypatch.setattr(compare_router, "get_native_pitch", as_async(lambda text, audio: timed))
+
+    results = await asyncio.gather(*(compare_router._segmented_native(text) for _ in range(8)))
+
+    assert all(len(segments) == len(results[0][1]) > 0 for _, segments, _ in results)
+
+
+def test_compare_segments_rejects_target_mode(client):
+    payload = {
+        "text": "雨",
+        "user_audio_base64": base64.b64encode(make_wav_bytes()).decode("ascii"),
+        "mode": "target",
+        "segments": True,
+    }
+
+    response = client.post("/api/compare", json=payload)
+
+    assert response.status_code == 400
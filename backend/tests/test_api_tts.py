@@ -10,7 +10,6 @@ from fastapi.testclient import TestClient
 
 pytest.importorskip("azure.cognitiveservices.speech", reason="Azure SDK required for TTS")
 pytest.importorskip("parselmouth", reason="parselmouth required for audio compare")
-pytest.importorskip("fastdtw", reason="fastdtw required for audio compare")
 pytest.importorskip("numpy", reason="numpy required for audio compare")
 pytest.importorskip("scipy", reason="scipy required for audio compare")
 
@@ -22,6 +21,12 @@ def make_wav_bytes(payload_len: int = 0) -> bytes:
     return header + (b"\x00" * payload_len)
 
 
+def as_async(fn):
+    async def wrapper(*args, **kwargs):
+        return fn(*args, **kwargs)
+    return wrapper
+
+
 @pytest.fixture()
 def client():
     app = FastAPI()
@@ -35,7 +40,7 @@ def test_tts_audio_response(client, monkeypatch):
     def fake_synthesize_speech(text, voice, rate, pitch, volume):
         return wav_bytes, False
 
-    monkeypatch.setattr(tts_router, "synthesize_speech", fake_synthesize_speech)
+    monkeypatch.setattr(tts_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
 
     response = client.post("/api/tts", json={"text": "hello"})
 
@@ -44,6 +49,7 @@ def test_tts_audio_response(client, monkeypatch):
     assert response.headers["content-disposition"] == "inline; filename=speech.wav"
     assert response.headers["cache-control"] == "public, max-age=86400"
     assert response.headers["content-type"].startswith("audio/wav")
+    assert response.headers["x-tts-key"] == tts_router.tts_cache_key("hello")
     assert response.content == wav_bytes
 
 
@@ -54,7 +60,8 @@ def test_tts_missing_text_validation(client):
 
 
 def test_tts_timeout(client, monkeypatch):
-    async def fake_wait_for(*args, **kwargs):
+    async def fake_wait_for(awaitable, timeout):
+        awaitable.close()
         raise asyncio.TimeoutError
 
     monkeypatch.setattr(tts_router.asyncio, "wait_for", fake_wait_for)
@@ -69,7 +76,7 @@ def test_tts_tts_error(client, monkeypatch):
     def fake_synthesize_speech(*args, **kwargs):
         raise tts_router.TTSError("boom")
 
-    monkeypatch.setattr(tts_router, "synthesize_speech", fake_synthesize_speech)
+    monkeypatch.setattr(tts_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
 
     response = client.post("/api/tts", json={"text": "hello"})
 
@@ -81,7 +88,7 @@ def test_tts_unexpected_error(client, monkeypatch):
     def fake_synthesize_speech(*args, **kwargs):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(tts_router, "synthesize_speech", fake_synthesize_speech)
+    monkeypatch.setattr(tts_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
 
     response = client.post("/api/tts", json={"text": "hello"})
 
@@ -124,12 +131,18 @@ def test_cache_stats(client, monkeypatch):
     stats = SimpleNamespace(
         hits=2,
         misses=1,
+        memory_hits=0,
+        memory_entries=3,
+        memory_size_bytes=1572864,
         redis_hits=1,
         redis_connected=True,
         r2_hits=1,
         r2_connected=False,
         r2_objects=2,
         r2_size_mb=1.5,
+        pitch_hits=4,
+        pitch_misses=1,
+        coalesced=3,
     )
     monkeypatch.setattr(tts_router, "get_cache_stats", lambda: stats)
 
@@ -140,8 +153,11 @@ def test_cache_stats(client, monkeypatch):
         "hits": 2,
         "misses": 1,
         "hit_rate": "66.7%",
+        "memory": {"hits": 0, "entries": 3, "size_mb": 1.5},
         "redis": {"hits": 1, "connected": True},
         "r2": {"hits": 1, "connected": False, "objects": 2, "size_mb": 1.5},
+        "pitch": {"hits": 4, "misses": 1},
+        "coalesced": 3,
     }
 
 
@@ -186,11 +202,11 @@ def test_tts_with_pitch(client, monkeypatch):
     def fake_synthesize_speech(text, voice, rate):
         return wav_bytes, False
 
-    def fake_extract_pitch_timed(audio_bytes: bytes):
+    async def fake_get_native_pitch(text, audio_bytes: bytes, voice, rate):
         return fake_pitch
 
-    monkeypatch.setattr(tts_router, "synthesize_speech", fake_synthesize_speech)
-    monkeypatch.setattr(tts_router, "extract_pitch_timed", fake_extract_pitch_timed)
+    monkeypatch.setattr(tts_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
+    monkeypatch.setattr(tts_router, "get_native_pitch", fake_get_native_pitch)
 
     response = client.get("/api/tts/with-pitch", params={"text": "hello"})
 
@@ -200,6 +216,7 @@ def test_tts_with_pitch(client, monkeypatch):
     assert data["pitch_curve"] == [0.0, 110.0]
     assert data["voiced_curve"] == [110.0]
     assert data["duration_ms"] == 20
+    assert data["tts_key"] == tts_router.tts_cache_key("hello", tts_router.DEFAULT_FEMALE, 1.0)
 
 
 def test_tts_with_pitch_compare_error(client, monkeypatch):
@@ -208,11 +225,11 @@ def test_tts_with_pitch_compare_error(client, monkeypatch):
     def fake_synthesize_speech(text, voice, rate):
         return wav_bytes, False
 
-    def fake_extract_pitch_timed(audio_bytes: bytes):
+    async def fake_get_native_pitch(text, audio_bytes: bytes, voice, rate):
         raise tts_router.CompareError("bad pitch")
 
-    monkeypatch.setattr(tts_router, "synthesize_speech", fake_synthesize_speech)
-    monkeypatch.setattr(tts_router, "extract_pitch_timed", fake_extract_pitch_timed)
+    monkeypatch.setattr(tts_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
+    monkeypatch.setattr(tts_router, "get_native_pitch", fake_get_native_pitch)
 
     response = client.get("/api/tts/with-pitch", params={"text": "hello"})
 
@@ -267,7 +284,7 @@ def test_tts_didactic_ssml(client, monkeypatch):
         seen["is_ssml"] = is_ssml
         return wav_bytes, False
 
-    monkeypatch.setattr(tts_router, "synthesize_speech", fake_synthesize_speech)
+    monkeypatch.setattr(tts_router, "synthesize_speech_async", as_async(fake_synthesize_speech))
 
     response = client.post(
         "/api/tts/didactic",
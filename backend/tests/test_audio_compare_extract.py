@@ -1,4 +1,4 @@
-"""Unit tests for extract_pitch_timed cleanup and errors."""
+"""Unit tests for extract_pitch_timed loading and errors."""
 
 import pytest
 
@@ -36,7 +36,7 @@ class StubPitch:
 
 
 class StubSound:
-    def __init__(self, _path, freqs, duration=0.1):
+    def __init__(self, freqs, duration=0.1):
         self._freqs = freqs
         self.duration = duration
 
@@ -44,43 +44,56 @@ class StubSound:
         return StubPitch(self._freqs)
 
 
-def test_extract_pitch_timed_success_cleans_up(monkeypatch):
-    calls = []
+def test_extract_pitch_timed_decodes_in_memory(monkeypatch):
+    loaded = []
 
-    def fake_unlink(self, missing_ok=False):
-        calls.append(self)
-
-    monkeypatch.setattr(audio_compare.Path, "unlink", fake_unlink, raising=False)
+    def fake_sound(values, sampling_frequency):
+        loaded.append((values.shape, sampling_frequency))
+        return StubSound([0, 100, 110, 120, 130, 140])
 
-    def fake_sound(path):
-        return StubSound(path, [0, 100, 110, 120, 130, 140])
+    def fail_file_load(_audio_data):
+        raise AssertionError("PCM audio should not touch disk")
 
     monkeypatch.setattr(audio_compare.parselmouth, "Sound", fake_sound)
+    monkeypatch.setattr(audio_compare, "_load_sound_from_file", fail_file_load)
 
     result = audio_compare.extract_pitch_timed(make_wav_bytes())
 
     assert result.duration_ms == 100
     assert len(result.pitch_values) >= 5
-    assert calls
+    assert loaded == [((1, 50), 44100)]
 
 
 def test_extract_pitch_timed_short_audio_raises(monkeypatch):
+    monkeypatch.setattr(
+        audio_compare.parselmouth, "Sound", lambda *_args, **_kwargs: StubSound([0, 0, 0])
+    )
+
+    with pytest.raises(audio_compare.CompareError):
+        audio_compare.extract_pitch_timed(make_wav_bytes())
+
+
+def test_extract_pitch_timed_unsupported_encoding_falls_back_to_file(monkeypatch):
     calls = []
 
     def fake_unlink(self, missing_ok=False):
         calls.append(self)
 
-    monkeypatch.setattr(audio_compare.Path, "unlink", fake_unlink, raising=False)
-
     def fake_sound(path):
-        return StubSound(path, [0, 0, 0])
+        assert isinstance(path, str)
+        return StubSound([0, 100, 110, 120, 130, 140])
 
+    monkeypatch.setattr(audio_compare.Path, "unlink", fake_unlink, raising=False)
     monkeypatch.setattr(audio_compare.parselmouth, "Sound", fake_sound)
 
-    with pytest.raises(audio_compare.CompareError):
-        audio_compare.extract_pitch_timed(make_wav_bytes())
+    # Format tag 7 = mu-law, which only Praat's reader handles
+    wav = bytearray(make_wav_bytes())
+    wav[20:22] = (7).to_bytes(2, "little")
+
+    result = audio_compare.extract_pitch_timed(bytes(wav))
 
-    assert calls
+    assert result.duration_ms == 100
+    assert calls  # Temp file cleaned up
 
 
 def test_extract_pitch_timed_invalid_wav_raises():
@@ -95,3 +108,47 @@ def test_extract_pitch_timed_empty_data_raises():
     """Test that empty data raises CompareError."""
     with pytest.raises(audio_compare.CompareError, match="empty or too small"):
         audio_compare.extract_pitch_timed(b"")
+
+
+def test_extract_pitch_timed_yin_engine_matches_frame_layout():
+    rate = 16000
+    t = np.arange(rate // 2) / rate
+    samples = (0.5 * np.sin(2 * np.pi * 180.0 * t) * 32767).astype("<i2")
+    data_size = samples.nbytes
+    wav = bytearray(make_wav_bytes(data_size))
+    wav[24:28] = rate.to_bytes(4, "little")
+    wav[28:32] = (rate * 2).to_bytes(4, "little")
+    wav[44:] = samples.tobytes()
+
+    praat = audio_compare.extract_pitch_timed(bytes(wav))
+    yin = audio_compare.extract_pitch_timed(bytes(wav), engine="yin")
+
+    assert len(yin.full_curve) == len(praat.full_curve)
+    assert yin.duration_ms == praat.duration_ms == 500
+    assert np.median(yin.pitch_values) == pytest.approx(180.0, rel=0.01)
+
+
+def test_extract_pitch_timed_unknown_engine_raises():
+    with pytest.raises(ValueError, match="Unknown pitch engine"):
+        audio_compare.extract_pitch_timed(make_wav_bytes(), engine="crepe")
+
+
+def test_extract_pitch_timed_trim_silence_reports_offsets():
+    rate = 16000
+    t = np.arange(rate // 2) / rate
+    voiced = 0.5 * np.sin(2 * np.pi * 180.0 * t)
+    audio = np.concatenate([np.zeros(rate), voiced, np.zeros(rate)])
+    samples = (audio * 32767).astype("<i2")
+    wav = bytearray(make_wav_bytes(samples.nbytes))
+    wav[24:28] = rate.to_bytes(4, "little")
+    wav[28:32] = (rate * 2).to_bytes(4, "little")
+    wav[44:] = samples.tobytes()
+
+    full = audio_compare.extract_pitch_timed(bytes(wav))
+    trimmed = audio_compare.extract_pitch_timed(bytes(wav), trim_silence=True)
+
+    assert trimmed.duration_ms == full.duration_ms == 2500
+    assert trimmed.trim_start_ms == 900
+    assert trimmed.trim_end_ms == 900
+    assert len(trimmed.full_curve) < len(full.full_curve) / 2
+    assert np.median(trimmed.pitch_values) == pytest.approx(180.0, rel=0.01)
@@ -3,7 +3,6 @@
 import pytest
 
 pytest.importorskip("parselmouth", reason="parselmouth required for audio compare")
-pytest.importorskip("fastdtw", reason="fastdtw required for audio compare")
 pytest.importorskip("numpy", reason="numpy required for audio compare")
 pytest.importorskip("scipy", reason="scipy required for audio compare")
 
@@ -31,7 +30,7 @@ def test_normalize_pitch_handles_zero_std():
 def test_compare_audio_happy_path(monkeypatch):
     monkeypatch.setattr(audio_compare, "extract_pitch", lambda *_: np.array([1.0, 2.0]))
     monkeypatch.setattr(audio_compare, "normalize_pitch", lambda x: x)
-    monkeypatch.setattr(audio_compare, "fastdtw", lambda *args, **kwargs: (0.0, [(0, 0), (1, 1)]))
+    monkeypatch.setattr(audio_compare, "dtw", lambda *args, **kwargs: (0.0, [(0, 0), (1, 1)]))
 
     result = audio_compare.compare_audio(b"native", b"user")
 
@@ -40,6 +39,49 @@ def test_compare_audio_happy_path(monkeypatch):
     assert result.aligned_user == [1.0, 2.0]
 
 
+def test_compare_pitch_accepts_lists(monkeypatch):
+    monkeypatch.setattr(audio_compare, "normalize_pitch", lambda x: x)
+    monkeypatch.setattr(audio_compare, "dtw", lambda *args, **kwargs: (0.0, [(0, 0), (1, 1)]))
+
+    result = audio_compare.compare_pitch([1.0, 2.0], [1.0, 2.0])
+
+    assert result.score == 100
+    assert result.native_pitch == [1.0, 2.0]
+    assert result.user_pitch == [1.0, 2.0]
+
+
+def test_compare_pitch_multi_picks_best_voice():
+    user = [100.0, 120.0, 140.0, 120.0, 100.0]
+    natives = {
+        "female1": [200.0, 150.0, 100.0, 150.0, 200.0],  # Opposite shape
+        "male1": [90.0, 110.0, 130.0, 110.0, 90.0],  # Same shape, lower register
+    }
+
+    result = audio_compare.compare_pitch_multi(natives, user)
+
+    assert result.voice == "male1"
+    assert list(result.voice_scores) == ["female1", "male1"]
+    assert result.voice_scores["male1"] == result.score == 100
+    assert result.voice_scores["female1"] < result.score
+    assert result.aligned_native == audio_compare.compare_pitch(natives["male1"], user).aligned_native
+
+
+def test_compare_pitch_multi_reports_the_score_it_ranked_by(monkeypatch):
+    monkeypatch.setattr(audio_compare.settings, "dtw_band", 1)
+    rng = np.random.default_rng(3)
+    user = 150 + 30 * np.sin(np.linspace(0, 3, 40)) + rng.normal(scale=5, size=40)
+    natives = {
+        "female1": (150 + 30 * np.sin(np.linspace(0.4, 3.4, 25))).tolist(),
+        "male1": (120 + 20 * np.sin(np.linspace(-0.3, 2.7, 60))).tolist(),
+    }
+
+    result = audio_compare.compare_pitch_multi(natives, user.tolist())
+
+    assert result.score == result.voice_scores[result.voice] == max(result.voice_scores.values())
+    exact = audio_compare.compare_pitch(natives[result.voice], user.tolist(), band=0)
+    assert result.alignment_path == exact.alignment_path
+
+
 def test_compare_audio_extract_pitch_error(monkeypatch):
     def boom(*_):
         raise ValueError("bad audio")
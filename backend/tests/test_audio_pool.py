@@ -0,0 +1,77 @@
+"""Unit tests for the audio analysis process pool."""
+
+import io
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+pytest.importorskip("parselmouth", reason="parselmouth required for audio compare")
+pytest.importorskip("numpy", reason="numpy required for audio compare")
+
+import numpy as np
+
+from app.services import audio_pool
+
+
+def make_tone_wav(seconds: float = 0.5, freq: float = 180.0, rate: int = 16000) -> bytes:
+    t = np.arange(int(seconds * rate)) / rate
+    samples = (0.5 * np.sin(2 * np.pi * freq * t) * 32767).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def test_shared_audio_round_trip_and_unlink():
+    with audio_pool._shared_audio(b"RIFF-data") as handle:
+        assert audio_pool._read_shared(handle) == b"RIFF-data"
+        name = handle[0]
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
+
+
+async def test_extract_pitch_in_worker_process(monkeypatch):
+    pool = audio_pool.create_audio_pool(1)
+    monkeypatch.setattr(audio_pool, "get_audio_pool", lambda: pool)
+    try:
+        result = await audio_pool.extract_pitch_in_pool(make_tone_wav())
+    finally:
+        pool.shutdown()
+
+    assert result.duration_ms == 500
+    assert np.median(result.pitch_values) == pytest.approx(180.0, rel=0.02)
+
+
+async def test_compare_pitch_in_worker_process(monkeypatch):
+    pool = audio_pool.create_audio_pool(1)
+    monkeypatch.setattr(audio_pool, "get_audio_pool", lambda: pool)
+    try:
+        user = await audio_pool.extract_pitch_in_pool(make_tone_wav())
+        result = await audio_pool.compare_pitch_in_pool([180.0] * 40, user.pitch_values)
+    finally:
+        pool.shutdown()
+
+    assert 0 <= result.score <= 100
+    assert result.alignment_path[0] == (0, 0)
+
+
+async def test_disabled_pool_runs_in_thread(monkeypatch):
+    monkeypatch.setattr(audio_pool.settings, "audio_workers", 0)
+    monkeypatch.setattr(audio_pool, "extract_pitch_timed", lambda audio, engine, trim: ("extracted", audio, engine, trim))
+
+    assert await audio_pool.extract_pitch_in_pool(b"wav") == ("extracted", b"wav", "praat", False)
+
+
+async def test_task_timeout_raises(monkeypatch):
+    monkeypatch.setattr(audio_pool.settings, "audio_task_timeout_seconds", 0.05)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        with pytest.raises(audio_pool.AudioTaskTimeout):
+            await audio_pool._run(pool, time.sleep, 0.5)
@@ -1,10 +1,16 @@
 """Unit tests for cache service."""
 
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
 import pytest
 
 pytest.importorskip("redis", reason="redis required for cache service")
 
 from app.services import cache as cache_service
+from app.services.r2_writer import R2WriteStats
 
 
 class FakeRedis:
@@ -24,7 +30,8 @@ class FakeRedis:
     def scan(self, cursor, match=None, count=100):
         self.scan_calls += 1
         if cursor == 0:
-            return 0, [b"tts:one", b"tts:two"]
+            prefix = match.rstrip("*").encode()
+            return 0, [key for key in (b"tts:one", b"tts:two", b"pitch:one") if key.startswith(prefix)]
         return 0, []
 
     def delete(self, *keys):
@@ -34,6 +41,19 @@ class FakeRedis:
     def ping(self):
         return True
 
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def eval(self, _script, _numkeys, key, token):
+        # Compare-and-delete, as the release script does
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
 
 @pytest.fixture(autouse=True)
 def reset_cache_state(monkeypatch):
@@ -42,12 +62,20 @@ def reset_cache_state(monkeypatch):
     monkeypatch.setattr(cache_service.settings, "redis_enabled", True)
     monkeypatch.setattr(cache_service.settings, "redis_ttl_seconds", 120)
     monkeypatch.setattr(cache_service.settings, "r2_enabled", False)
+    monkeypatch.setattr(cache_service.settings, "tts_single_flight", True)
+    monkeypatch.setattr(cache_service.settings, "tts_single_flight_redis", False)
+    monkeypatch.setattr(cache_service.settings, "tts_single_flight_timeout_seconds", 5.0)
+    monkeypatch.setattr(cache_service.settings, "tts_memory_cache_mb", 1)
+    monkeypatch.setattr(cache_service.settings, "tts_memory_cache_max_entry_kb", 512)
+    monkeypatch.setattr(cache_service.settings, "r2_write_behind", False)
+    cache_service._memory_clear()
     yield
+    cache_service._memory_clear()
 
 
 def test_get_cached_audio_redis_hit(monkeypatch):
     redis_client = FakeRedis()
-    cache_key = cache_service._get_cache_key("text", "voice", "params")
+    cache_key = cache_service.get_cache_key("text", "voice", "params")
     redis_client.store[cache_service._redis_key(cache_key)] = b"data"
     monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
 
@@ -93,6 +121,93 @@ def test_save_to_cache_writes_both_layers(monkeypatch):
     assert len(redis_client.setex_calls) == 1
 
 
+def test_memory_hit_skips_redis(monkeypatch):
+    redis_client = FakeRedis()
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
+    cache_service.save_to_cache("text", "voice", "params", b"data")
+    redis_client.store.clear()
+
+    assert cache_service.get_cached_audio("text", "voice", "params") == b"data"
+    assert cache_service._stats.memory_hits == 1
+    assert cache_service._stats.redis_hits == 0
+
+
+def test_redis_hit_populates_memory(monkeypatch):
+    redis_client = FakeRedis()
+    cache_key = cache_service.get_cache_key("text", "voice", "params")
+    redis_client.store[cache_service._redis_key(cache_key)] = b"data"
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
+
+    cache_service.get_cached_audio("text", "voice", "params")
+    cache_service.get_cached_audio("text", "voice", "params")
+
+    assert cache_service._stats.redis_hits == 1
+    assert cache_service._stats.memory_hits == 1
+
+
+def test_memory_cache_evicts_least_recently_used_past_budget(monkeypatch):
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+    clip = b"x" * (400 * 1024)
+
+    cache_service.save_to_cache("a", "voice", "params", clip)
+    cache_service.save_to_cache("b", "voice", "params", clip)
+    cache_service.get_cached_audio("a", "voice", "params")  # a is now most recent
+    cache_service.save_to_cache("c", "voice", "params", clip)  # 1.2 MB > 1 MB budget
+
+    assert cache_service.get_cached_audio("a", "voice", "params") == clip
+    assert cache_service.get_cached_audio("b", "voice", "params") is None
+    assert cache_service.get_cached_audio("c", "voice", "params") == clip
+    assert cache_service.get_cache_stats().memory_size_bytes == 2 * len(clip)
+
+
+def test_memory_cache_skips_oversized_clips(monkeypatch):
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+
+    cache_service.save_to_cache("long", "voice", "params", b"x" * (600 * 1024))
+
+    assert cache_service.get_cached_audio("long", "voice", "params") is None
+    assert cache_service.get_cache_stats().memory_entries == 0
+
+
+def test_memory_cache_disabled_with_zero_budget(monkeypatch):
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+    monkeypatch.setattr(cache_service.settings, "tts_memory_cache_mb", 0)
+
+    cache_service.save_to_cache("text", "voice", "params", b"data")
+
+    assert cache_service.get_cached_audio("text", "voice", "params") is None
+
+
+def test_save_to_cache_queues_r2_write_behind(monkeypatch):
+    queued = []
+    writer = SimpleNamespace(put=lambda key, data, content_type: queued.append((key, content_type)) or True)
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: FakeRedis())
+    monkeypatch.setattr(cache_service.settings, "r2_enabled", True)
+    monkeypatch.setattr(cache_service, "get_r2_writer", lambda: writer)
+
+    def fail_put(*_args, **_kwargs):
+        raise AssertionError("should not upload in the request")
+
+    monkeypatch.setattr(cache_service, "r2_put", fail_put)
+
+    cache_service.save_to_cache("text", "voice", "params", b"data")
+
+    cache_key = cache_service.get_cache_key("text", "voice", "params")
+    assert queued == [(cache_service._r2_key(cache_key), "audio/wav")]
+
+
+def test_save_to_cache_uploads_directly_when_queue_full(monkeypatch):
+    uploaded = []
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+    monkeypatch.setattr(cache_service.settings, "r2_enabled", True)
+    monkeypatch.setattr(cache_service, "get_r2_writer", lambda: SimpleNamespace(put=lambda *_: False))
+    monkeypatch.setattr(cache_service, "r2_put", lambda key, data, content_type: uploaded.append(key))
+
+    cache_service.save_to_cache("text", "voice", "params", b"data")
+
+    assert len(uploaded) == 1
+
+
 def test_clear_cache_scans_and_resets_stats(monkeypatch):
     redis_client = FakeRedis()
     monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
@@ -101,9 +216,15 @@ def test_clear_cache_scans_and_resets_stats(monkeypatch):
     cache_service._stats.redis_hits = 3
     cache_service._stats.r2_hits = 1
 
+    cache_service.save_to_cache("text", "voice", "params", b"data")
+    cache_service._stats.memory_hits = 4
+
     result = cache_service.clear_cache()
 
-    assert result["redis_keys"] == 2
+    assert result["redis_keys"] == 3
+    assert result["memory_entries"] == 1
+    assert cache_service._stats.memory_hits == 0
+    assert cache_service.get_cache_stats().memory_entries == 0
     assert cache_service._stats.hits == 0
     assert cache_service._stats.misses == 0
     assert cache_service._stats.redis_hits == 0
@@ -133,7 +254,426 @@ def test_health_check_reports_layers(monkeypatch):
     monkeypatch.setattr(cache_service.settings, "r2_enabled", True)
     monkeypatch.setattr(cache_service, "r2_health_check", lambda: True)
 
+    monkeypatch.setattr(cache_service, "get_r2_writer_stats", lambda: R2WriteStats(pending=2, failed=1))
+
     result = cache_service.health_check()
 
     assert result["redis"]["connected"] is True
     assert result["r2"]["connected"] is True
+    assert result["r2"]["write_queue"]["pending"] == 2
+    assert result["r2"]["write_queue"]["failed"] == 1
+
+
+def test_pitch_round_trips_through_redis(monkeypatch):
+    redis_client = FakeRedis()
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
+    timed_pitch = cache_service.TimedPitch(
+        pitch_values=[110.5, 120.25],
+        full_curve=[0.0, 110.5, 0.0, 120.25],
+        duration_ms=40,
+    )
+
+    cache_service.save_pitch_to_cache("text", "voice", "params", timed_pitch)
+    result = cache_service.get_cached_pitch("text", "voice", "params")
+
+    cache_key = cache_service.get_cache_key("text", "voice", "params")
+    assert cache_service._pitch_redis_key(cache_key) in redis_client.store
+    assert result == timed_pitch
+    assert cache_service._stats.pitch_hits == 1
+
+
+def test_get_cached_pitch_miss_and_corrupt_blob(monkeypatch):
+    redis_client = FakeRedis()
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
+    cache_key = cache_service.get_cache_key("text", "voice", "params")
+
+    assert cache_service.get_cached_pitch("text", "voice", "params") is None
+
+    redis_client.store[cache_service._pitch_redis_key(cache_key)] = b"garbage"
+    assert cache_service.get_cached_pitch("text", "voice", "params") is None
+    assert cache_service._stats.pitch_misses == 2
+
+
+def test_pitch_by_key_is_keyed_per_engine(monkeypatch):
+    redis_client = FakeRedis()
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
+    timed_pitch = cache_service.TimedPitch(pitch_values=[110.0], full_curve=[110.0], duration_ms=10)
+    cache_key = cache_service.get_cache_key("text", "voice", "params")
+
+    cache_service.save_pitch_by_key(cache_key, timed_pitch, "yin")
+
+    assert cache_service.get_cached_pitch_by_key(cache_key, "yin") == timed_pitch
+    assert cache_service.get_cached_pitch_by_key(cache_key) is None
+    assert cache_service._pitch_redis_key(cache_key, "yin") == f"pitch:{cache_key}:yin"
+    assert cache_service._pitch_r2_key(cache_key, "yin") == f"pitch/{cache_key}.yin.bin"
+
+
+def test_get_cached_audio_by_key_matches_text_lookup(monkeypatch):
+    redis_client = FakeRedis()
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
+    cache_service.save_to_cache("text", "voice", "params", b"data")
+
+    cache_key = cache_service.get_cache_key("text", "voice", "params")
+    assert cache_service.get_cached_audio_by_key(cache_key) == b"data"
+
+
+def test_timings_round_trip_and_corrupt_blob(monkeypatch):
+    redis_client = FakeRedis()
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
+    timings = [{"text": "雨", "offset_ms": 50.0, "duration_ms": 200.0}]
+
+    cache_service.save_timings_by_key("abc", timings)
+
+    assert cache_service.get_cached_timings_by_key("abc") == timings
+    redis_client.store[cache_service._timings_redis_key("abc")] = b"{not json"
+    assert cache_service.get_cached_timings_by_key("abc") is None
+    assert cache_service.get_cached_timings_by_key("missing") is None
+
+
+def test_single_flight_coalesces_concurrent_loads(monkeypatch):
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return b"wav"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(cache_service.single_flight("k", load)))
+    leader.start()
+    started.wait(5)
+    waiters = [
+        threading.Thread(target=lambda: results.append(cache_service.single_flight("k", load)))
+        for _ in range(3)
+    ]
+    for waiter in waiters:
+        waiter.start()
+    while cache_service._stats.coalesced < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader, *waiters]:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(results) == [(b"wav", False)] + [(b"wav", True)] * 3
+    assert cache_service._flights == {}
+
+
+def test_single_flight_shares_leader_error(monkeypatch):
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing_load():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("azure down")
+
+    errors = []
+
+    def call():
+        try:
+            cache_service.single_flight("k", failing_load)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    waiter = threading.Thread(target=call)
+    waiter.start()
+    while cache_service._stats.coalesced < 1:
+        time.sleep(0.001)
+    release.set()
+    leader.join(5)
+    waiter.join(5)
+
+    assert errors == ["azure down", "azure down"]
+    # A later miss retries instead of reusing the failure
+    assert cache_service.single_flight("k", lambda: b"wav") == (b"wav", False)
+
+
+def test_single_flight_leader_rechecks_cache_before_loading(monkeypatch):
+    # A caller that missed just before the previous leader saved the clip
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+    cache_service._memory_put("k", b"saved")
+
+    def fail_load():
+        raise AssertionError("clip is already cached")
+
+    assert cache_service.single_flight("k", fail_load) == (b"saved", True)
+    assert cache_service._stats.coalesced == 1
+    assert cache_service._stats.misses == 0
+
+
+def test_single_flight_leader_rechecks_redis_when_memory_disabled(monkeypatch):
+    redis_client = FakeRedis()
+    redis_client.store[cache_service._redis_key("k")] = b"saved"
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
+    monkeypatch.setattr(cache_service.settings, "tts_memory_cache_mb", 0)
+
+    assert cache_service.single_flight("k", lambda: b"fresh") == (b"saved", True)
+
+
+def test_single_flight_disabled_always_loads(monkeypatch):
+    monkeypatch.setattr(cache_service.settings, "tts_single_flight", False)
+
+    assert cache_service.single_flight("k", lambda: b"wav") == (b"wav", False)
+
+
+async def test_single_flight_async_waiters_share_one_thread(monkeypatch):
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(threading.current_thread().name)
+        release.wait(5)
+        return b"wav"
+
+    tasks = [asyncio.ensure_future(cache_service.single_flight_async("k", load)) for _ in range(20)]
+    while cache_service._stats.coalesced < 19:
+        await asyncio.sleep(0.001)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert len(calls) == 1
+    assert sorted(results) == [(b"wav", False)] + [(b"wav", True)] * 19
+    assert cache_service._async_flights == {}
+    assert cache_service._flights == {}
+
+
+async def test_single_flight_async_leader_cancel_does_not_cancel_waiters(monkeypatch):
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+    release = threading.Event()
+
+    def load():
+        release.wait(5)
+        return b"wav"
+
+    leader = asyncio.ensure_future(cache_service.single_flight_async("k", load))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(cache_service.single_flight_async("k", load))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await waiter == (b"wav", True)
+    assert leader.cancelled()
+
+
+async def test_single_flight_async_shares_leader_error(monkeypatch):
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+    release = threading.Event()
+
+    def failing_load():
+        release.wait(5)
+        raise RuntimeError("azure down")
+
+    tasks = [asyncio.ensure_future(cache_service.single_flight_async("k", failing_load)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert [str(r) for r in results] == ["azure down"] * 3
+    # A later miss retries instead of reusing the failure
+    assert await cache_service.single_flight_async("k", lambda: b"wav") == (b"wav", False)
+
+
+async def test_single_flight_async_waiter_times_out_and_loads(monkeypatch):
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+    monkeypatch.setattr(cache_service.settings, "tts_single_flight_timeout_seconds", 0.01)
+    release = threading.Event()
+
+    def slow_load():
+        release.wait(5)
+        return b"slow"
+
+    leader = asyncio.ensure_future(cache_service.single_flight_async("k", slow_load))
+    await asyncio.sleep(0)
+    try:
+        assert await cache_service.single_flight_async("k", lambda: b"own") == (b"own", False)
+    finally:
+        release.set()
+    assert await leader == (b"slow", False)
+
+
+def test_single_flight_redis_lock_holder_loads_and_releases(monkeypatch):
+    redis_client = FakeRedis()
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
+    monkeypatch.setattr(cache_service.settings, "tts_single_flight_redis", True)
+
+    assert cache_service.single_flight("k", lambda: b"wav") == (b"wav", False)
+    assert cache_service._lock_redis_key("k") not in redis_client.store
+
+
+def test_single_flight_redis_lock_waits_for_other_worker(monkeypatch):
+    redis_client = FakeRedis()
+    redis_client.store[cache_service._lock_redis_key("k")] = "other-worker"
+    polls = []
+
+    def get(key):
+        polls.append(key)
+        if len(polls) == 3:
+            # The other worker finishes and saves the clip
+            redis_client.store[cache_service._redis_key("k")] = b"wav"
+        return redis_client.store.get(key)
+
+    redis_client.get = get
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
+    monkeypatch.setattr(cache_service.settings, "tts_single_flight_redis", True)
+    monkeypatch.setattr(cache_service, "_LOCK_POLL_SECONDS", 0.0)
+
+    def fail_load():
+        raise AssertionError("should use the other worker's clip")
+
+    assert cache_service.single_flight("k", fail_load) == (b"wav", True)
+    assert cache_service._stats.coalesced == 1
+
+
+def test_single_flight_redis_lock_released_without_clip_loads(monkeypatch):
+    redis_client = FakeRedis()
+    lock_key = cache_service._lock_redis_key("k")
+    redis_client.store[lock_key] = "other-worker"
+    original_get = redis_client.get
+
+    def get(key):
+        value = original_get(key)
+        redis_client.store.pop(lock_key, None)  # The other worker failed and released
+        return value
+
+    redis_client.get = get
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: redis_client)
+    monkeypatch.setattr(cache_service.settings, "tts_single_flight_redis", True)
+    monkeypatch.setattr(cache_service, "_LOCK_POLL_SECONDS", 0.0)
+
+    assert cache_service.single_flight("k", lambda: b"wav") == (b"wav", False)
+
+
+class FakeAsyncRedis:
+    def __init__(self, store=None):
+        self.store = store if store is not None else {}
+        self.mget_calls = []
+        self.pipelines = []
+        self.closed = False
+
+    async def mget(self, keys):
+        self.mget_calls.append(list(keys))
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        pipe = FakePipeline(self)
+        self.pipelines.append(pipe)
+        return pipe
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    def setex(self, key, ttl, data):
+        self.commands.append(("setex", key, ttl))
+
+    async def execute(self):
+        for _, key, _ in self.commands:
+            self.client.store[key] = b"promoted"
+
+
+async def test_get_cached_audio_many_async_uses_memory_mget_and_r2(monkeypatch):
+    keys = ["mem", "hot", "cold", "none"]
+    redis_client = FakeAsyncRedis({cache_service._redis_key("hot"): b"hot-data"})
+    monkeypatch.setattr(cache_service, "_get_async_redis_client", lambda: redis_client)
+    monkeypatch.setattr(cache_service.settings, "r2_enabled", True)
+    monkeypatch.setattr(
+        cache_service, "r2_get", lambda key: b"cold-data" if key == cache_service._r2_key("cold") else None
+    )
+    cache_service._memory_put("mem", b"mem-data")
+
+    found = await cache_service.get_cached_audio_many_async(keys)
+
+    assert found == {"mem": b"mem-data", "hot": b"hot-data", "cold": b"cold-data"}
+    # One MGET for everything not in memory, one pipeline promoting the R2 hit
+    assert redis_client.mget_calls == [[cache_service._redis_key(key) for key in ("hot", "cold", "none")]]
+    assert [pipe.commands for pipe in redis_client.pipelines] == [
+        [("setex", cache_service._redis_key("cold"), 120)]
+    ]
+    stats = cache_service._stats
+    assert (stats.hits, stats.memory_hits, stats.redis_hits, stats.r2_hits, stats.misses) == (3, 1, 1, 1, 1)
+    # Redis and R2 hits are now in memory
+    assert cache_service._memory_get("hot") == b"hot-data"
+    assert cache_service._memory_get("cold") == b"cold-data"
+
+
+async def test_get_cached_audio_by_key_async_memory_hit_skips_redis(monkeypatch):
+    def fail_client():
+        raise AssertionError("memory hit should not reach Redis")
+
+    cache_service._memory_put("k", b"data")
+    monkeypatch.setattr(cache_service, "_get_async_redis_client", fail_client)
+
+    assert await cache_service.get_cached_audio_by_key_async("k") == b"data"
+
+
+async def test_get_cached_audio_async_redis_error_is_miss(monkeypatch):
+    class BrokenRedis(FakeAsyncRedis):
+        async def mget(self, keys):
+            raise cache_service.redis.ConnectionError("down")
+
+    monkeypatch.setattr(cache_service, "_get_async_redis_client", lambda: BrokenRedis())
+
+    assert await cache_service.get_cached_audio_async("text", "voice", "params") is None
+    assert cache_service._stats.misses == 1
+
+
+async def test_get_cached_pitch_many_async_reads_engine_keys(monkeypatch):
+    timed = cache_service.TimedPitch(
+        pitch_values=[200.0], full_curve=[0.0, 200.0], duration_ms=20, time_step_ms=10
+    )
+    blob = cache_service._pack_pitch(timed)
+    redis_client = FakeAsyncRedis({
+        cache_service._pitch_redis_key("a", "yin"): blob,
+        cache_service._pitch_redis_key("b", "yin"): b"corrupt",
+    })
+    monkeypatch.setattr(cache_service, "_get_async_redis_client", lambda: redis_client)
+
+    found = await cache_service.get_cached_pitch_many_async(["a", "b", "c"], "yin")
+
+    assert list(found) == ["a"]
+    assert found["a"].full_curve == [0.0, 200.0]
+    assert len(redis_client.mget_calls) == 1
+    assert (cache_service._stats.pitch_hits, cache_service._stats.pitch_misses) == (1, 2)
+
+
+async def test_close_async_redis_closes_client(monkeypatch):
+    redis_client = FakeAsyncRedis()
+    monkeypatch.setattr(cache_service, "_async_redis_client", redis_client)
+
+    await cache_service.close_async_redis()
+
+    assert redis_client.closed
+    assert cache_service._async_redis_client is None
+
+
+def test_async_redis_client_uses_bounded_pool(monkeypatch):
+    monkeypatch.setattr(cache_service, "_async_redis_client", None)
+    monkeypatch.setattr(cache_service.settings, "redis_url", "redis://localhost:6379")
+    monkeypatch.setattr(cache_service.settings, "redis_max_connections", 7)
+
+    client = cache_service._get_async_redis_client()
+
+    assert client is cache_service._get_async_redis_client()
+    assert client.connection_pool.max_connections == 7
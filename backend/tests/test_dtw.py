@@ -0,0 +1,135 @@
+"""Unit tests for the DTW engine."""
+
+import pytest
+
+pytest.importorskip("numpy", reason="numpy required for DTW")
+
+import numpy as np
+
+from app.services.dtw import dtw, dtw_batch
+
+
+def reference_dtw(x, y) -> float:
+    """Textbook O(n*m) DTW distance."""
+    n, m = len(x), len(y)
+    cost = np.full((n + 1, m + 1), np.inf)
+    cost[0, 0] = 0.0
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            cost[i, j] = abs(x[i - 1] - y[j - 1]) + min(
+                cost[i - 1, j - 1], cost[i - 1, j], cost[i, j - 1]
+            )
+    return cost[n, m]
+
+
+def assert_valid_path(path, n, m):
+    assert path[0] == (0, 0)
+    assert path[-1] == (n - 1, m - 1)
+    for (i, j), (next_i, next_j) in zip(path, path[1:]):
+        assert (next_i - i, next_j - j) in ((1, 1), (1, 0), (0, 1))
+
+
+def test_identical_series_align_on_diagonal():
+    x = [1.0, 2.0, 3.0, 2.0]
+
+    distance, path = dtw(x, x)
+
+    assert distance == 0.0
+    assert path == [(0, 0), (1, 1), (2, 2), (3, 3)]
+
+
+def test_repeated_frames_are_absorbed():
+    distance, path = dtw([0.0, 1.0, 2.0], [0.0, 1.0, 1.0, 1.0, 2.0])
+
+    assert distance == 0.0
+    assert path == [(0, 0), (1, 1), (1, 2), (1, 3), (2, 4)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_exact_matches_reference(seed):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=rng.integers(1, 30))
+    y = rng.normal(size=rng.integers(1, 30))
+
+    distance, path = dtw(x, y)
+
+    assert distance == pytest.approx(reference_dtw(x, y))
+    assert_valid_path(path, len(x), len(y))
+
+
+@pytest.mark.parametrize("n, m", [(50, 50), (30, 90), (90, 30), (1, 10), (10, 1)])
+def test_banded_path_is_valid_and_not_better_than_exact(n, m):
+    rng = np.random.default_rng(n * 100 + m)
+    x = rng.normal(size=n)
+    y = rng.normal(size=m)
+
+    exact, _ = dtw(x, y)
+    banded, path = dtw(x, y, band=2)
+
+    assert_valid_path(path, n, m)
+    assert banded >= exact - 1e-9
+
+
+def test_wide_band_equals_exact():
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=40)
+    y = rng.normal(size=55)
+
+    assert dtw(x, y, band=100) == dtw(x, y)
+
+
+def test_empty_series_raises():
+    with pytest.raises(ValueError):
+        dtw([], [1.0])
+
+
+def test_open_end_aligns_to_reference_prefix():
+    reference = [0.0, 1.0, 2.0, 3.0, 2.0, 1.0]
+
+    distance, path = dtw(reference, [0.0, 1.0, 2.0], open_end=True)
+
+    assert distance == 0.0
+    assert path == [(0, 0), (1, 1), (2, 2)]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_open_end_matches_best_prefix_reference(seed):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=rng.integers(1, 25))
+    y = rng.normal(size=rng.integers(1, 25))
+
+    distance, path = dtw(x, y, open_end=True)
+
+    best_prefix = min(reference_dtw(x[:end], y) for end in range(1, len(x) + 1))
+    assert distance == pytest.approx(best_prefix)
+    end = path[-1][0]
+    assert_valid_path(path, end + 1, len(y))
+
+
+def test_open_end_rejects_band():
+    with pytest.raises(ValueError):
+        dtw([1.0, 2.0], [1.0], band=1, open_end=True)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_batch_matches_individual_alignments(seed):
+    rng = np.random.default_rng(seed)
+    xs = [rng.normal(size=rng.integers(1, 30)) for _ in range(rng.integers(1, 6))]
+    y = rng.normal(size=rng.integers(1, 30))
+    if seed % 2:
+        # Integer series produce cost ties - path lengths must still agree
+        xs, y = [np.round(x) for x in xs], np.round(y)
+
+    distances, path_lengths = dtw_batch(xs, y)
+
+    for x, distance, path_length in zip(xs, distances, path_lengths):
+        expected_distance, expected_path = dtw(x, y)
+        assert distance == pytest.approx(expected_distance)
+        assert path_length == len(expected_path)
+
+
+def test_batch_rejects_empty_input():
+    with pytest.raises(ValueError):
+        dtw_batch([], [1.0])
+    with pytest.raises(ValueError):
+        dtw_batch([[1.0], []], [1.0])
@@ -0,0 +1,120 @@
+"""Unit tests for live (streamed PCM) comparison."""
+
+import pytest
+
+pytest.importorskip("parselmouth", reason="parselmouth required for audio compare")
+pytest.importorskip("numpy", reason="numpy required for audio compare")
+
+import numpy as np
+
+from app.services import audio_compare, live_compare
+from app.services.live_compare import LiveCompareSession
+from app.services.yin import YinStream, yin_pitch
+
+RATE = 16000
+
+
+def glide_samples(start_hz: float, end_hz: float, seconds: float, rate: int = RATE) -> np.ndarray:
+    t = np.arange(int(seconds * rate)) / rate
+    f0 = start_hz + (end_hz - start_hz) * t / seconds
+    phase = 2 * np.pi * np.cumsum(f0) / rate
+    return 0.3 * sum(np.sin(k * phase) / k for k in range(1, 8))
+
+
+def to_pcm(samples: np.ndarray) -> bytes:
+    return (samples * 32767).astype("<i2").tobytes()
+
+
+def test_yin_stream_matches_batch_for_any_chunking():
+    samples = glide_samples(150.0, 250.0, 1.5)
+    samples[:3000] = 0.0
+    stream = YinStream(RATE)
+
+    rng = np.random.default_rng(0)
+    pieces = []
+    i = 0
+    while i < len(samples):
+        n = int(rng.integers(1, 3000))
+        pieces.append(stream.push(samples[i:i + n]))
+        i += n
+
+    batch = yin_pitch(samples, RATE, target_rate=0)
+    assert len(np.concatenate(pieces)) == len(batch)
+    assert np.allclose(stream.finish(), batch)
+
+
+def test_yin_stream_buffer_stays_bounded():
+    stream = YinStream(RATE)
+    for _ in range(50):
+        stream.push(glide_samples(200.0, 200.0, 0.2))
+
+    assert len(stream._buffer) < 2 * RATE
+
+
+def test_session_streams_pitch_and_partial_score():
+    native = glide_samples(150.0, 250.0, 1.0)
+    native_pitch = yin_pitch(native, RATE, target_rate=0)
+    session = LiveCompareSession(RATE, native_pitch=native_pitch[native_pitch > 0].tolist())
+
+    pcm = to_pcm(native)
+    updates = [session.push(pcm[i:i + 1601]) for i in range(0, len(pcm), 1601)]  # Odd split
+
+    frame_indices = [u.frame_index for u in updates]
+    assert frame_indices == sorted(frame_indices)
+    assert sum(len(u.pitch) for u in updates) == len(native_pitch)
+    assert updates[0].score is None
+    assert updates[-1].score is not None and updates[-1].score >= 90
+
+    timed_pitch, result = session.finish()
+    assert timed_pitch.duration_ms == 1000
+    assert result.score >= 90
+
+
+def test_session_partial_score_tracks_prefix():
+    native = glide_samples(150.0, 250.0, 1.0)
+    native_pitch = yin_pitch(native, RATE, target_rate=0)
+    session = LiveCompareSession(RATE, native_pitch=native_pitch[native_pitch > 0].tolist())
+
+    # First half of a good rendition scores well against the native prefix
+    update = session.push(to_pcm(native[:RATE // 2]))
+
+    assert update.score is not None and update.score >= 90
+
+
+@pytest.mark.parametrize("interval, min_calls, max_calls", [(0.0, 5, None), (3600.0, 1, 1)])
+def test_session_partial_score_is_throttled_by_time(monkeypatch, interval, min_calls, max_calls):
+    calls = []
+
+    def fake_compare_pitch(native, user, open_end=False):
+        calls.append(len(user))
+        return audio_compare.ComparisonResult(80, 0.0, native, user, native, user, [])
+
+    monkeypatch.setattr(live_compare.settings, "live_score_interval_seconds", interval)
+    monkeypatch.setattr(live_compare, "compare_pitch", fake_compare_pitch)
+    session = LiveCompareSession(RATE, native_pitch=[200.0] * 50)
+
+    pcm = to_pcm(glide_samples(150.0, 250.0, 1.0))
+    updates = [session.push(pcm[i:i + 1600]) for i in range(0, len(pcm), 1600)]
+
+    assert updates[-1].score == 80
+    assert len(calls) >= min_calls
+    if max_calls is not None:
+        assert len(calls) <= max_calls
+
+
+def test_session_finish_without_voice_raises():
+    session = LiveCompareSession(RATE, native_pitch=[200.0] * 50)
+    session.push(to_pcm(np.zeros(RATE)))
+
+    with pytest.raises(audio_compare.CompareError):
+        session.finish()
+
+
+def test_session_rejects_bad_sample_rate_and_oversized_audio(monkeypatch):
+    with pytest.raises(ValueError):
+        LiveCompareSession(1000)
+
+    monkeypatch.setattr("app.services.live_compare.MAX_AUDIO_SIZE", 100)
+    session = LiveCompareSession(RATE)
+    with pytest.raises(audio_compare.CompareError):
+        session.push(b"\x00" * 200)
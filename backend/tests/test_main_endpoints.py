@@ -5,7 +5,6 @@ from fastapi.testclient import TestClient
 
 pytest.importorskip("azure.cognitiveservices.speech", reason="Azure SDK required for app import")
 pytest.importorskip("parselmouth", reason="parselmouth required for app import")
-pytest.importorskip("fastdtw", reason="fastdtw required for app import")
 pytest.importorskip("numpy", reason="numpy required for app import")
 pytest.importorskip("scipy", reason="scipy required for app import")
 pytest.importorskip("sudachipy", reason="sudachipy required for app import")
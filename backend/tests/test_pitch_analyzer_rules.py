@@ -9,6 +9,7 @@ pytest.importorskip("jaconv", reason="jaconv is required for pitch analyzer")
 
 from app.services import pitch_analyzer
 from app.services.pitch import lookup as lookup_module
+from app.services.pitch.lexicon import PitchLexicon
 
 
 def make_db(rows: list[tuple[str, str, str, str | None, str | None]]):
@@ -31,7 +32,7 @@ def test_lookup_prefers_lemma_before_normalized(monkeypatch):
         ("lemma", "read", "3", None, None),
         ("normalized", "read", "4", None, None),
     ])
-    monkeypatch.setattr(lookup_module, "get_db_connection", lambda: conn)
+    monkeypatch.setattr(lookup_module, "get_lexicon", lambda: PitchLexicon.from_connection(conn))
     monkeypatch.setattr(lookup_module, "lookup_unidic_accent", lambda *_: None)
 
     result = pitch_analyzer.lookup_pitch(
@@ -50,7 +51,7 @@ def test_lookup_reading_fallback_prefers_shorter_surface(monkeypatch):
         ("longer", "read", "6", None, None),
         ("short", "read", "5", None, None),
     ])
-    monkeypatch.setattr(lookup_module, "get_db_connection", lambda: conn)
+    monkeypatch.setattr(lookup_module, "get_lexicon", lambda: PitchLexicon.from_connection(conn))
     monkeypatch.setattr(lookup_module, "lookup_unidic_accent", lambda *_: None)
 
     result = pitch_analyzer.lookup_pitch(surface="unknown", reading_hira="read")
@@ -61,7 +62,7 @@ def test_lookup_reading_fallback_prefers_shorter_surface(monkeypatch):
 
 def test_lookup_unidic_fallback_when_db_missing(monkeypatch):
     conn = make_db([])
-    monkeypatch.setattr(lookup_module, "get_db_connection", lambda: conn)
+    monkeypatch.setattr(lookup_module, "get_lexicon", lambda: PitchLexicon.from_connection(conn))
     monkeypatch.setattr(lookup_module, "lookup_unidic_accent", lambda *_: 2)
 
     result = pitch_analyzer.lookup_pitch(surface="surface", reading_hira="read")
@@ -75,7 +76,7 @@ def test_sources_agree_true_and_false(monkeypatch):
     conn = make_db([
         ("word", "read", "2", None, None),
     ])
-    monkeypatch.setattr(lookup_module, "get_db_connection", lambda: conn)
+    monkeypatch.setattr(lookup_module, "get_lexicon", lambda: PitchLexicon.from_connection(conn))
 
     monkeypatch.setattr(lookup_module, "lookup_unidic_accent", lambda *_: 2)
     result = pitch_analyzer.lookup_pitch(surface="word", reading_hira="read")
@@ -90,7 +91,7 @@ def test_multiple_patterns_flag(monkeypatch):
     conn = make_db([
         ("word", "read", "1,2", None, None),
     ])
-    monkeypatch.setattr(lookup_module, "get_db_connection", lambda: conn)
+    monkeypatch.setattr(lookup_module, "get_lexicon", lambda: PitchLexicon.from_connection(conn))
     monkeypatch.setattr(lookup_module, "lookup_unidic_accent", lambda *_: None)
 
     result = pitch_analyzer.lookup_pitch(surface="word", reading_hira="read")
@@ -98,6 +99,66 @@ def test_multiple_patterns_flag(monkeypatch):
     assert result.has_multiple_patterns is True
 
 
+def test_lookup_surface_prefers_matching_reading(monkeypatch):
+    conn = make_db([
+        ("word", "other", "1", None, None),
+        ("word", "read", "2", "kango", "漢語"),
+    ])
+    monkeypatch.setattr(lookup_module, "get_lexicon", lambda: PitchLexicon.from_connection(conn))
+    monkeypatch.setattr(lookup_module, "lookup_unidic_accent", lambda *_: None)
+
+    exact = pitch_analyzer.lookup_pitch(surface="word", reading_hira="read")
+    surface_only = pitch_analyzer.lookup_pitch(surface="word", reading_hira="nope")
+
+    assert (exact.accent_type, exact.goshu, exact.goshu_jp) == (2, "kango", "漢語")
+    assert exact.source == "dictionary"
+    assert surface_only.accent_type == 1
+    assert surface_only.source == "dictionary"
+
+
+def test_lexicon_skips_invalid_accent_values():
+    conn = make_db([
+        ("word", "read", "x,3", None, None),
+    ])
+    lexicon = PitchLexicon.from_connection(conn)
+
+    (accents, has_multiple, _, _), source = lexicon.find("word", "read")
+
+    assert accents == (3,)
+    assert has_multiple is True
+    assert source == "dictionary"
+    assert lexicon.find("missing", "") is None
+
+
+def test_lookup_uses_precomputed_unidic_table(monkeypatch):
+    conn = make_db([
+        ("word", "read", "2", None, None),
+    ])
+    conn.execute(
+        "CREATE TABLE unidic_accents (surface TEXT, reading TEXT, accent INTEGER, is_word INTEGER)"
+    )
+    conn.executemany(
+        "INSERT INTO unidic_accents (surface, reading, accent, is_word) VALUES (?, ?, ?, ?)",
+        [("word", "other", 2, 1), ("multi", "yomi", 4, 0)],
+    )
+    monkeypatch.setattr(lookup_module, "get_lexicon", lambda: PitchLexicon.from_connection(conn))
+
+    def fail(*_):
+        raise AssertionError("fugashi should not run when the table exists")
+
+    monkeypatch.setattr(lookup_module, "lookup_unidic_accent", fail)
+
+    word = pitch_analyzer.lookup_pitch(surface="word", reading_hira="read")
+    part = pitch_analyzer.lookup_pitch(surface="multi", reading_hira="yomi")
+    part_other_reading = pitch_analyzer.lookup_pitch(surface="multi", reading_hira="nope")
+
+    assert word.unidic_accent == 2
+    assert word.sources_agree is True
+    assert part.source == "dictionary_unidic"
+    assert part.accent_type == 4
+    assert part_other_reading.source == "unknown"
+
+
 def test_confidence_rules():
     assert pitch_analyzer.get_confidence_for_source("dictionary") == "high"
     assert pitch_analyzer.get_confidence_for_source("dictionary_lemma") == "medium"
@@ -0,0 +1,139 @@
+"""Unit tests for the R2 write-behind queue."""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("boto3", reason="boto3 required for R2 storage")
+
+from app.services import r2_writer
+from app.services.r2_writer import R2WriteQueue
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+class RecordingPut:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, key, data, content_type):
+        with self.lock:
+            self.calls.append((key, data, content_type))
+            if self.failures:
+                self.failures -= 1
+                return False
+        return True
+
+
+def make_queue(put, **kwargs):
+    options = {"max_bytes": 1024, "batch_size": 4, "max_attempts": 3, "retry_base_seconds": 0.01}
+    options.update(kwargs)
+    return R2WriteQueue(put, **options)
+
+
+def test_queued_writes_are_uploaded_in_background():
+    put = RecordingPut()
+    queue = make_queue(put)
+
+    assert queue.put("tts/a.wav", b"aa")
+    assert queue.put("pitch/a.bin", b"p", "application/octet-stream")
+    wait_for(lambda: queue.stats().written == 2)
+
+    assert sorted(put.calls) == [("pitch/a.bin", b"p", "application/octet-stream"), ("tts/a.wav", b"aa", "audio/wav")]
+    assert queue.stats().pending == 0
+    queue.close(1.0)
+
+
+def test_failed_upload_is_retried_with_backoff():
+    put = RecordingPut(failures=2)
+    queue = make_queue(put)
+
+    queue.put("tts/a.wav", b"aa")
+    wait_for(lambda: queue.stats().written == 1)
+
+    assert len(put.calls) == 3
+    assert queue.stats().retried == 2
+    queue.close(1.0)
+
+
+def test_upload_gives_up_after_max_attempts():
+    put = RecordingPut(failures=10)
+    queue = make_queue(put, max_attempts=2)
+
+    queue.put("tts/a.wav", b"aa")
+    wait_for(lambda: queue.stats().failed == 1)
+
+    assert len(put.calls) == 2
+    assert queue.stats().pending == 0
+    queue.close(1.0)
+
+
+def test_pending_write_for_same_key_is_replaced():
+    release = threading.Event()
+    uploaded = []
+
+    def blocking_put(key, data, content_type):
+        release.wait(5)
+        uploaded.append((key, data))
+        return True
+
+    queue = make_queue(blocking_put, batch_size=1)
+    queue.put("tts/first.wav", b"1")  # Occupies the uploader
+    wait_for(lambda: queue.stats().pending == 1 and not queue._pending)
+    queue.put("tts/a.wav", b"old")
+    queue.put("tts/a.wav", b"new")
+    release.set()
+    wait_for(lambda: queue.stats().written == 2)
+
+    assert uploaded == [("tts/first.wav", b"1"), ("tts/a.wav", b"new")]
+    assert queue.stats().deduplicated == 1
+    queue.close(1.0)
+
+
+def test_full_queue_rejects_writes():
+    release = threading.Event()
+    queue = make_queue(lambda *_: release.wait(5), max_bytes=10)
+
+    assert queue.put("tts/a.wav", b"x" * 8)
+    assert not queue.put("tts/b.wav", b"x" * 8)
+    assert queue.stats().overflowed == 1
+    release.set()
+    queue.close(1.0)
+
+
+def test_close_drains_pending_writes_ignoring_backoff():
+    put = RecordingPut(failures=1)
+    queue = make_queue(put, retry_base_seconds=60.0)
+
+    queue.put("tts/a.wav", b"aa")
+    wait_for(lambda: queue.stats().retried == 1)
+    lost = queue.close(2.0)
+
+    assert lost == 0
+    assert queue.stats().written == 1
+    assert not queue.put("tts/b.wav", b"bb")
+
+
+def test_close_reports_writes_left_at_deadline():
+    release = threading.Event()
+    queue = make_queue(lambda *_: release.wait(5), batch_size=1)
+    queue.put("tts/a.wav", b"aa")
+    queue.put("tts/b.wav", b"bb")
+
+    assert queue.close(0.05) == 2
+    release.set()
+
+
+def test_writer_disabled_without_r2(monkeypatch):
+    monkeypatch.setattr(r2_writer.settings, "r2_enabled", False)
+
+    assert r2_writer.get_r2_writer() is None
+    assert r2_writer.get_r2_writer_stats() is None
@@ -0,0 +1,121 @@
+"""Unit tests for per-mora segmented scoring."""
+
+import pytest
+
+pytest.importorskip("numpy", reason="numpy required for segmented scoring")
+pytest.importorskip("parselmouth", reason="parselmouth required for audio compare")
+pytest.importorskip("scipy", reason="scipy required for audio compare")
+
+import numpy as np
+
+from app.models.schemas import WordPitch
+from app.services.audio_compare import compare_pitch
+from app.services.dtw import dtw
+from app.services.segment_score import (
+    mora_segments,
+    score_segments,
+    segment_window,
+    voiced_segment_index,
+)
+
+
+def word(surface: str, morae: list[str]) -> WordPitch:
+    return WordPitch(
+        surface=surface,
+        reading="".join(morae),
+        accent_type=0 if morae else None,
+        mora_count=len(morae),
+        morae=morae,
+        pitch_pattern=[],
+        part_of_speech="名詞" if morae else "補助記号",
+    )
+
+
+WORDS = [word("桜", ["さ", "く", "ら"]), word("が", ["が"]), word("、", []), word("綺麗", ["き", "れ", "い"])]
+TEXT = "桜が、綺麗"
+TIMINGS = [
+    {"text": "桜", "offset_ms": 100.0, "duration_ms": 300.0},
+    {"text": "が", "offset_ms": 400.0, "duration_ms": 100.0},
+    {"text": "綺麗", "offset_ms": 700.0, "duration_ms": 300.0},
+]
+
+
+def test_mora_segments_follow_word_boundaries():
+    segments = mora_segments(TEXT, WORDS, TIMINGS, duration_ms=1100)
+
+    assert [s.mora for s in segments] == ["さ", "く", "ら", "が", "き", "れ", "い"]
+    assert [s.word_index for s in segments] == [0, 0, 0, 1, 3, 3, 3]
+    assert [(s.start_ms, s.end_ms) for s in segments[:4]] == [
+        (100.0, 200.0), (200.0, 300.0), (300.0, 400.0), (400.0, 500.0)
+    ]
+    # The pause at the comma belongs to no mora
+    assert segments[4].start_ms == 700.0
+    assert segments[-1].end_ms == 1000.0
+
+
+def test_mora_segments_without_timings_spread_over_clip():
+    segments = mora_segments("さくら", [word("さくら", ["さ", "く", "ら"])], [], duration_ms=300)
+
+    assert [(s.start_ms, s.end_ms) for s in segments] == [(0.0, 100.0), (100.0, 200.0), (200.0, 300.0)]
+
+
+def test_voiced_segment_index_maps_frames_to_morae():
+    segments = mora_segments(TEXT, WORDS, TIMINGS, duration_ms=1100)
+    curve = [0.0] * 110
+    for frame in (5, 15, 45, 60, 75, 99):
+        curve[frame] = 200.0
+
+    index = voiced_segment_index(curve, segments)
+
+    # 50ms: before speech, 150: さ, 450: が, 600: pause, 750: き, 990: い
+    assert index.tolist() == [-1, 0, 3, -1, 4, 6]
+
+
+def test_segment_window_is_valid_and_narrower_than_full_matrix():
+    index = np.repeat(np.arange(10), 12)  # 10 morae of 12 voiced frames
+    m = 150
+
+    lo, hi = segment_window(index, m, margin=10)
+
+    assert lo[0] == 0 and hi[-1] == m - 1
+    assert np.all(np.diff(lo) >= 0) and np.all(np.diff(hi) >= 0)
+    assert np.all(lo[1:] <= hi[:-1] + 1)
+    assert (hi - lo + 1).sum() < 0.4 * len(index) * m
+
+
+def test_windowed_dtw_matches_exact_on_similar_tempo():
+    rng = np.random.default_rng(0)
+    t = np.linspace(0, 1, 120)
+    native = np.sin(2 * np.pi * 1.5 * t)
+    user = np.interp(np.linspace(0, 1, 140), t, native) + rng.normal(scale=0.05, size=140)
+
+    window = segment_window(np.repeat(np.arange(10), 12), len(user))
+    windowed, _ = dtw(native, user, window=window)
+    exact, _ = dtw(native, user)
+
+    assert windowed == pytest.approx(exact)
+
+
+def test_dtw_rejects_window_that_misses_the_end():
+    with pytest.raises(ValueError):
+        dtw([1.0, 2.0], [1.0, 2.0], window=(np.array([0, 0]), np.array([0, 0])))
+
+
+def test_score_segments_flags_the_wrong_mora():
+    # Native L-H-H-L (odaka + particle); the user drops a mora early: L-H-L-L
+    words = [word("はなが", ["は", "な", "が"]), word("。", []), word("ね", ["ね"])]
+    segments = mora_segments("はなが。ね", words, [], duration_ms=400)
+    native = [150.0] * 10 + [220.0] * 20 + [150.0] * 10
+    user = [150.0] * 10 + [220.0] * 10 + [150.0] * 20
+
+    index = voiced_segment_index(native, segments)
+    result = compare_pitch(native, user, window=segment_window(index, len(user), margin=3))
+    scored = score_segments(result, index, segments, words, user)
+
+    scores = [mora.score for mora in scored.morae]
+    assert scores[2] == min(scores)
+    assert scores[2] <= scores[0] - 10
+    assert [w.surface for w in scored.words] == ["はなが", "ね"]
+    assert scored.words[1].score == scores[3]
+    assert scored.morae[0].user_start_ms == 0.0
+    assert scored.score == result.score
@@ -6,7 +6,6 @@ from datetime import datetime, timezone, timedelta
 # Skip if dependencies not available
 pytest.importorskip("azure.cognitiveservices.speech", reason="Azure SDK required for app import")
 pytest.importorskip("parselmouth", reason="parselmouth required for app import")
-pytest.importorskip("fastdtw", reason="fastdtw required for app import")
 pytest.importorskip("numpy", reason="numpy required for app import")
 pytest.importorskip("scipy", reason="scipy required for app import")
 pytest.importorskip("sudachipy", reason="sudachipy required for app import")
@@ -0,0 +1,65 @@
+"""Unit tests for synthetic pitch targets."""
+
+import pytest
+
+pytest.importorskip("numpy", reason="numpy required for target contours")
+
+import numpy as np
+
+from app.models.schemas import WordPitch
+from app.services.pitch.patterns import get_pitch_pattern
+from app.services.target_contour import DOWNSTEP, build_target_contour, mora_levels
+
+
+def word(surface: str, accent_type: int | None, mora_count: int, patterned: bool = True) -> WordPitch:
+    return WordPitch(
+        surface=surface,
+        reading=surface,
+        accent_type=accent_type,
+        mora_count=mora_count,
+        morae=list(surface)[:mora_count],
+        pitch_pattern=get_pitch_pattern(accent_type, mora_count) if patterned else [],
+        part_of_speech="名詞" if patterned else "助詞",
+    )
+
+
+def test_heiban_rises_and_particle_stays_high():
+    levels = mora_levels([word("さくら", 0, 3), word("が", None, 1, patterned=False)])
+
+    assert levels == [0.0, 1.0, 1.0, 1.0]
+
+
+def test_odaka_particle_drops():
+    levels = mora_levels([word("はな", 2, 2), word("が", None, 1, patterned=False)])
+
+    assert levels == [0.0, 1.0, 0.0]
+
+
+def test_downstep_after_accented_word():
+    levels = mora_levels([word("あめ", 1, 2), word("さくら", 0, 3)])
+
+    assert levels == [1.0, 0.0, 0.0, DOWNSTEP, DOWNSTEP]
+
+
+def test_punctuation_is_skipped():
+    punctuation = WordPitch(
+        surface="。", reading="", accent_type=None, mora_count=0, morae=[], pitch_pattern=[], part_of_speech="補助記号"
+    )
+
+    assert mora_levels([word("あめ", 1, 2), punctuation]) == [1.0, 0.0]
+
+
+def test_build_target_contour_frames_and_smoothing():
+    contour = np.array(build_target_contour([word("あめ", 1, 2)], frames_per_mora=10))
+
+    assert len(contour) == 20
+    assert contour[0] == pytest.approx(1.0)
+    assert contour[-1] == pytest.approx(0.0)
+    # Transition glides over a few frames instead of a step
+    assert 0.0 < contour[10] < 1.0
+    assert np.all(np.diff(contour) <= 0)
+
+
+def test_build_target_contour_without_morae_raises():
+    with pytest.raises(ValueError):
+        build_target_contour([])
@@ -0,0 +1,149 @@
+"""Unit tests for the per-voice synthesizer pool."""
+
+import types
+
+import pytest
+
+pytest.importorskip("azure.cognitiveservices.speech", reason="Azure SDK required for TTS module")
+
+from app.services import tts_pool
+from app.services.tts_pool import SynthesizerPool
+
+
+class StubConnection:
+    def __init__(self, synthesizer):
+        self.synthesizer = synthesizer
+        self.handlers = []
+        self.disconnected = types.SimpleNamespace(connect=self.handlers.append)
+        self.opened = False
+        self.closed = False
+
+    def open(self, _for_continuous_recognition):
+        self.opened = True
+
+    def close(self):
+        self.closed = True
+
+    def drop(self):
+        """Simulate Azure closing the connection."""
+        for handler in self.handlers:
+            handler(None)
+
+
+@pytest.fixture()
+def connections(monkeypatch):
+    opened = []
+
+    def from_speech_synthesizer(synthesizer):
+        connection = StubConnection(synthesizer)
+        opened.append(connection)
+        return connection
+
+    sdk = types.SimpleNamespace(Connection=types.SimpleNamespace(from_speech_synthesizer=from_speech_synthesizer))
+    monkeypatch.setattr(tts_pool, "speechsdk", sdk)
+    return opened
+
+
+def make_pool(size=2, max_idle_seconds=60.0):
+    return SynthesizerPool(lambda voice_name: object(), size=size, max_idle_seconds=max_idle_seconds)
+
+
+def test_synthesizer_is_preconnected_and_reused(connections):
+    pool = make_pool()
+
+    with pool.synthesizer("ja-JP-NanamiNeural") as first:
+        pass
+    with pool.synthesizer("ja-JP-NanamiNeural") as second:
+        pass
+
+    assert first is second
+    assert len(connections) == 1 and connections[0].opened
+    assert pool.stats().reused == 1
+
+
+def test_voices_get_separate_synthesizers(connections):
+    pool = make_pool()
+
+    with pool.synthesizer("ja-JP-NanamiNeural") as nanami, pool.synthesizer("ja-JP-KeitaNeural") as keita:
+        assert nanami is not keita
+
+
+def test_exception_evicts_synthesizer(connections):
+    pool = make_pool()
+
+    with pytest.raises(RuntimeError):
+        with pool.synthesizer("ja-JP-NanamiNeural"):
+            raise RuntimeError("synthesis failed")
+
+    assert connections[0].closed
+    assert pool.stats().idle == 0
+    assert pool.stats().evicted == 1
+
+
+def test_disconnected_synthesizer_is_replaced(connections):
+    pool = make_pool()
+    with pool.synthesizer("ja-JP-NanamiNeural") as first:
+        pass
+
+    connections[0].drop()
+    with pool.synthesizer("ja-JP-NanamiNeural") as second:
+        pass
+
+    assert second is not first
+    assert connections[0].closed
+    assert pool.stats().evicted == 1
+
+
+def test_idle_synthesizer_is_replaced(connections):
+    pool = make_pool(max_idle_seconds=0.0)
+    with pool.synthesizer("ja-JP-NanamiNeural") as first:
+        pass
+
+    with pool.synthesizer("ja-JP-NanamiNeural") as second:
+        pass
+
+    assert second is not first
+
+
+def test_pool_keeps_at_most_size_idle_per_voice(connections):
+    pool = make_pool(size=1)
+
+    with pool.synthesizer("ja-JP-NanamiNeural") as first, pool.synthesizer("ja-JP-NanamiNeural") as second:
+        assert first is not second
+
+    assert pool.stats().idle == 1
+    assert pool.stats().created == 2
+    assert sum(connection.closed for connection in connections) == 1
+
+
+def test_warm_fills_each_voice_to_size(connections):
+    pool = make_pool(size=2)
+
+    assert pool.warm(["ja-JP-NanamiNeural", "ja-JP-KeitaNeural"]) == 4
+    assert pool.warm(["ja-JP-NanamiNeural"]) == 0
+    assert all(connection.opened for connection in connections)
+    assert pool.stats().idle == 4
+
+
+def test_failed_preconnect_still_yields_synthesizer(monkeypatch):
+    def refuse(_synthesizer):
+        raise RuntimeError("no network")
+
+    monkeypatch.setattr(
+        tts_pool, "speechsdk", types.SimpleNamespace(Connection=types.SimpleNamespace(from_speech_synthesizer=refuse))
+    )
+    pool = make_pool()
+
+    with pool.synthesizer("ja-JP-NanamiNeural") as synthesizer:
+        assert synthesizer is not None
+
+
+def test_close_releases_idle_and_returned_synthesizers(connections):
+    pool = make_pool()
+    pool.warm(["ja-JP-NanamiNeural"])
+
+    with pool.synthesizer("ja-JP-KeitaNeural"):
+        pool.close()
+
+    assert all(connection.closed for connection in connections)
+    assert pool.stats().idle == 0
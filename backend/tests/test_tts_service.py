@@ -1,12 +1,17 @@
 """Unit tests for TTS service behavior."""
 
+import asyncio
+import threading
 import types
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 pytest.importorskip("azure.cognitiveservices.speech", reason="Azure SDK required for TTS module")
 
+from app.services import cache as cache_service
 from app.services import tts as tts_service
+from app.services import tts_pool
 
 
 class StubConfig:
@@ -30,11 +35,35 @@ class StubCancellationDetails:
         self.error_details = error_details
 
 
+class StubEventSignal:
+    def __init__(self):
+        self.handlers = []
+
+    def connect(self, handler):
+        self.handlers.append(handler)
+
+    def disconnect_all(self):
+        self.handlers.clear()
+
+
+class StubConnection:
+    def __init__(self):
+        self.disconnected = StubEventSignal()
+        self.opened = False
+
+    def open(self, _for_continuous_recognition):
+        self.opened = True
+
+    def close(self):
+        self.opened = False
+
+
 class StubSynthesizer:
     def __init__(self, speech_config, audio_config=None):
         self.speech_config = speech_config
         self.audio_config = audio_config
         self.next_result = None
+        self.synthesis_word_boundary = StubEventSignal()
 
     def speak_ssml_async(self, _ssml):
         return types.SimpleNamespace(get=lambda: self.next_result)
@@ -45,7 +74,20 @@ class StubSpeechSDK:
     CancellationReason = types.SimpleNamespace(Error="error")
 
     def __init__(self, synthesizer):
-        self.SpeechSynthesizer = lambda **kwargs: synthesizer
+        self.created = 0
+        self.Connection = types.SimpleNamespace(from_speech_synthesizer=lambda _synthesizer: StubConnection())
+
+        def create(**_kwargs):
+            self.created += 1
+            return synthesizer
+
+        self.SpeechSynthesizer = create
+
+
+def as_async(fn):
+    async def wrapper(*args, **kwargs):
+        return fn(*args, **kwargs)
+    return wrapper
 
 
 @pytest.fixture()
@@ -53,8 +95,12 @@ def stub_sdk(monkeypatch):
     synthesizer = StubSynthesizer(StubConfig())
     sdk = StubSpeechSDK(synthesizer)
     monkeypatch.setattr(tts_service, "speechsdk", sdk)
+    monkeypatch.setattr(tts_pool, "speechsdk", sdk)
     monkeypatch.setattr(tts_service, "_get_speech_config", lambda: StubConfig())
-    return synthesizer
+    monkeypatch.setattr(tts_service, "_synthesizer_pool", None)
+    monkeypatch.setattr(tts_service.settings, "tts_pool_size", 2)
+    yield synthesizer
+    tts_service.shutdown_synthesizer_pool()
 
 
 def test_synthesize_speech_uses_cache(monkeypatch):
@@ -129,6 +175,59 @@ def test_synthesize_speech_unknown_reason(stub_sdk, monkeypatch):
     assert "Azure Speech failed with reason" in str(exc.value)
 
 
+def test_synthesize_speech_reuses_pooled_synthesizer(stub_sdk, monkeypatch):
+    stub_sdk.next_result = StubResult(
+        tts_service.speechsdk.ResultReason.SynthesizingAudioCompleted,
+        audio_data=b"data",
+    )
+    monkeypatch.setattr(tts_service, "get_cached_audio", lambda *_: None)
+    monkeypatch.setattr(tts_service, "save_to_cache", lambda *_: None)
+
+    tts_service.synthesize_speech("hello")
+    tts_service.synthesize_speech("world")
+
+    assert tts_service.speechsdk.created == 1
+    assert tts_service.get_synthesizer_pool().stats().reused == 1
+
+
+def test_synthesize_speech_failure_evicts_synthesizer(stub_sdk, monkeypatch):
+    stub_sdk.next_result = StubResult("unknown")
+    monkeypatch.setattr(tts_service, "get_cached_audio", lambda *_: None)
+
+    with pytest.raises(tts_service.TTSError):
+        tts_service.synthesize_speech("hello")
+
+    stats = tts_service.get_synthesizer_pool().stats()
+    assert stats.idle == 0
+    assert stats.evicted == 1
+
+
+def test_synthesize_speech_with_timings_detaches_handler(stub_sdk):
+    stub_sdk.next_result = StubResult(
+        tts_service.speechsdk.ResultReason.SynthesizingAudioCompleted,
+        audio_data=b"data",
+    )
+
+    audio, timings = tts_service.synthesize_speech_with_timings("hello")
+
+    assert (audio, timings) == (b"data", [])
+    assert stub_sdk.synthesis_word_boundary.handlers == []
+    assert tts_service.get_synthesizer_pool().stats().idle == 1
+
+
+def test_warm_synthesizer_pool_connects_every_voice(stub_sdk, monkeypatch):
+    monkeypatch.setattr(tts_service.settings, "azure_speech_key", "key")
+
+    assert tts_service.warm_synthesizer_pool() == 2 * len(tts_service.AZURE_VOICES)
+    assert tts_service.warm_synthesizer_pool() == 0
+
+
+def test_warm_synthesizer_pool_without_key(stub_sdk, monkeypatch):
+    monkeypatch.setattr(tts_service.settings, "azure_speech_key", "")
+
+    assert tts_service.warm_synthesizer_pool() == 0
+
+
 def test_check_azure_health_without_key(monkeypatch):
     monkeypatch.setattr(tts_service.settings, "azure_speech_key", "")
 
@@ -144,3 +243,191 @@ def test_check_azure_health_success(stub_sdk, monkeypatch):
     monkeypatch.setattr(tts_service.settings, "azure_speech_key", "key")
 
     assert tts_service.check_azure_health() is True
+
+
+async def test_get_native_pitch_cache_hit_skips_extraction(monkeypatch):
+    cached = object()
+    monkeypatch.setattr(tts_service, "get_cached_pitch_by_key_async", as_async(lambda *_: cached))
+
+    async def fail_extract(_audio, _engine):
+        raise AssertionError("should not extract on cache hit")
+
+    monkeypatch.setattr(tts_service, "extract_pitch_in_pool", fail_extract)
+
+    assert await tts_service.get_native_pitch("text", b"audio") is cached
+
+
+async def test_get_native_pitch_miss_extracts_and_saves(monkeypatch):
+    saved = {}
+    extracted = object()
+
+    def fake_save(cache_key, timed_pitch, engine):
+        saved.update(cache_key=cache_key, timed_pitch=timed_pitch, engine=engine)
+
+    monkeypatch.setattr(tts_service, "get_cached_pitch_by_key_async", as_async(lambda *_: None))
+    async def fake_extract(_audio, _engine):
+        return extracted
+
+    monkeypatch.setattr(tts_service, "extract_pitch_in_pool", fake_extract)
+    monkeypatch.setattr(tts_service, "save_pitch_by_key", fake_save)
+
+    result = await tts_service.get_native_pitch("text", b"audio", voice="male1", rate=1.25)
+
+    assert result is extracted
+    assert saved == {
+        "cache_key": tts_service.get_cache_key("text", "male1", "1.25_0.0_0.0"),
+        "timed_pitch": extracted,
+        "engine": "praat",
+    }
+
+
+async def test_get_native_pitch_keys_cache_by_engine(monkeypatch):
+    seen = {}
+
+    def fake_get_cached(cache_key, engine):
+        seen["lookup_engine"] = engine
+        return None
+
+    async def fake_extract(_audio, engine):
+        seen["engine"] = engine
+        return object()
+
+    monkeypatch.setattr(tts_service.settings, "native_pitch_engine", "yin")
+    monkeypatch.setattr(tts_service, "get_cached_pitch_by_key_async", as_async(fake_get_cached))
+    monkeypatch.setattr(tts_service, "extract_pitch_in_pool", fake_extract)
+    monkeypatch.setattr(tts_service, "save_pitch_by_key", lambda *_: None)
+
+    await tts_service.get_native_pitch("text", b"audio")
+
+    assert seen == {"lookup_engine": "yin", "engine": "yin"}
+
+
+async def test_get_native_pitch_by_key_uses_cached_audio(monkeypatch):
+    extracted = object()
+    seen = {}
+
+    async def fake_extract(audio, _engine):
+        seen["audio"] = audio
+        return extracted
+
+    monkeypatch.setattr(tts_service, "get_cached_pitch_by_key_async", as_async(lambda *_: None))
+    monkeypatch.setattr(
+        tts_service, "get_cached_audio_by_key_async", as_async(lambda key: b"wav" if key == "k" else None)
+    )
+    monkeypatch.setattr(tts_service, "extract_pitch_in_pool", fake_extract)
+    monkeypatch.setattr(tts_service, "save_pitch_by_key", lambda *_: None)
+
+    assert await tts_service.get_native_pitch_by_key("k") is extracted
+    assert seen == {"audio": b"wav"}
+    assert await tts_service.get_native_pitch_by_key("missing") is None
+
+
+async def test_synthesize_speech_async_hit_stays_on_event_loop(monkeypatch):
+    monkeypatch.setattr(tts_service, "get_cached_audio_async", as_async(lambda text, voice, params: b"cached"))
+
+    def fail_to_thread(*_args, **_kwargs):
+        raise AssertionError("cache hit should not use a thread")
+
+    monkeypatch.setattr(tts_service.asyncio, "to_thread", fail_to_thread)
+
+    assert await tts_service.synthesize_speech_async("hello") == (b"cached", True)
+
+
+async def test_synthesize_speech_async_miss_synthesizes(monkeypatch):
+    calls = []
+    monkeypatch.setattr(tts_service, "get_cached_audio_async", as_async(lambda text, voice, params: None))
+    monkeypatch.setattr(
+        tts_service, "_synthesis_loader", lambda *args: calls.append(args) or ("k", lambda: b"data")
+    )
+    monkeypatch.setattr(tts_service, "single_flight_async", as_async(lambda key, load: (load(), False)))
+
+    assert await tts_service.synthesize_speech_async("hello", "male1", rate=1.25) == (b"data", False)
+    assert calls == [("hello", "male1", 1.25, 0.0, 0.0, False)]
+
+
+async def test_synthesize_speech_async_miss_stampede_leaves_threadpool_free(monkeypatch):
+    loop = asyncio.get_running_loop()
+    threadpool = ThreadPoolExecutor(max_workers=2)
+    loop.set_default_executor(threadpool)
+    release = threading.Event()
+    loads = []
+
+    def synthesize():
+        loads.append(1)
+        release.wait(5)
+        return b"data"
+
+    monkeypatch.setattr(tts_service, "get_cached_audio_async", as_async(lambda text, voice, params: None))
+    monkeypatch.setattr(tts_service, "_synthesis_loader", lambda *args: ("k", synthesize))
+    monkeypatch.setattr(cache_service, "_get_redis_client", lambda: None)
+    monkeypatch.setattr(cache_service.settings, "tts_single_flight", True)
+    monkeypatch.setattr(cache_service.settings, "tts_single_flight_redis", False)
+
+    try:
+        misses = [asyncio.ensure_future(tts_service.synthesize_speech_async("hello")) for _ in range(50)]
+        await asyncio.sleep(0.05)
+
+        # 50 misses on one key hold one thread; the other is still free
+        assert await asyncio.wait_for(loop.run_in_executor(None, lambda: "free"), 1) == "free"
+
+        release.set()
+        results = await asyncio.gather(*misses)
+    finally:
+        release.set()
+        threadpool.shutdown()
+
+    assert loads == [1]
+    assert sorted(results) == [(b"data", False)] + [(b"data", True)] * 49
+
+
+async def test_get_cached_native_pitches_looks_up_all_voices_at_once(monkeypatch):
+    timed = object()
+    seen = {}
+
+    def fake_many(cache_keys, engine):
+        seen.update(keys=cache_keys, engine=engine)
+        return {tts_service.tts_cache_key("雨", "male1"): timed}
+
+    monkeypatch.setattr(tts_service, "get_cached_pitch_many_async", as_async(fake_many))
+
+    result = await tts_service.get_cached_native_pitches("雨", ["female1", "male1"])
+
+    assert result == {"male1": timed}
+    assert seen == {
+        "keys": [tts_service.tts_cache_key("雨", "female1"), tts_service.tts_cache_key("雨", "male1")],
+        "engine": "praat",
+    }
+
+
+def test_tts_cache_key_matches_synthesis_cache_key():
+    assert tts_service.tts_cache_key("text", "male1", 1.25) == tts_service.get_cache_key(
+        "text", "male1", "1.25_0.0_0.0"
+    )
+
+
+def test_get_speech_timings_cache_hit_skips_synthesis(monkeypatch):
+    timings = [{"text": "雨", "offset_ms": 0.0, "duration_ms": 100.0}]
+    monkeypatch.setattr(tts_service, "get_cached_timings_by_key", lambda key: timings)
+    monkeypatch.setattr(tts_service, "get_cached_audio_by_key", lambda key: b"wav")
+
+    def fail_synthesize(*_):
+        raise AssertionError("should not synthesize on cache hit")
+
+    monkeypatch.setattr(tts_service, "synthesize_speech_with_timings", fail_synthesize)
+
+    assert tts_service.get_speech_timings("雨") == (b"wav", timings)
+
+
+def test_get_speech_timings_miss_caches_audio_and_timings(monkeypatch):
+    saved = {}
+    timings = [{"text": "雨", "offset_ms": 0.0, "duration_ms": 100.0}]
+    monkeypatch.setattr(tts_service, "get_cached_timings_by_key", lambda key: None)
+    monkeypatch.setattr(tts_service, "synthesize_speech_with_timings", lambda text, voice, rate: (b"wav", timings))
+    monkeypatch.setattr(
+        tts_service, "save_to_cache", lambda text, voice, params, audio: saved.update(audio_params=params)
+    )
+    monkeypatch.setattr(tts_service, "save_timings_by_key", lambda key, value: saved.update(key=key, timings=value))
+
+    assert tts_service.get_speech_timings("雨") == (b"wav", timings)
+    # Same key as plain synthesize_speech, so the audio and its pitch are shared
+    assert saved == {"audio_params": "1.00_0.0_0.0", "key": tts_service.tts_cache_key("雨"), "timings": timings}
@@ -0,0 +1,73 @@
+"""Unit tests for VAD edge trimming."""
+
+import pytest
+
+pytest.importorskip("numpy", reason="numpy required for VAD")
+
+import numpy as np
+
+from app.services.vad import frame_features, speech_bounds
+
+RATE = 16000
+
+
+def tone(seconds: float, freq: float = 200.0, amplitude: float = 0.3) -> np.ndarray:
+    t = np.arange(int(seconds * RATE)) / RATE
+    return amplitude * np.sin(2 * np.pi * freq * t)
+
+
+def noise(seconds: float, scale: float, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(scale=scale, size=int(seconds * RATE))
+
+
+def test_frame_features_energy_and_zcr():
+    energy, zcr = frame_features(np.concatenate([np.zeros(160), tone(0.01)]), RATE)
+
+    assert len(energy) == 2
+    assert energy[0] < -100
+    assert energy[1] == pytest.approx(10 * np.log10(0.3 ** 2 / 2), abs=0.5)
+    assert zcr[1] == pytest.approx(2 * 200 / RATE, abs=0.01)
+
+
+def test_trims_silence_and_room_noise():
+    samples = np.concatenate([noise(1.2, 0.002), tone(0.8), noise(1.5, 0.002, seed=1)])
+    samples[int(1.2 * RATE):int(2.0 * RATE)] += noise(0.8, 0.002, seed=2)
+
+    start, end = speech_bounds(samples, RATE)
+
+    # Speech 1.2s-2.0s, padded by 100ms
+    assert start / RATE == pytest.approx(1.1, abs=0.02)
+    assert end / RATE == pytest.approx(2.1, abs=0.02)
+
+
+def test_keeps_internal_pauses():
+    samples = np.concatenate([np.zeros(RATE // 2), tone(0.3), np.zeros(RATE // 2), tone(0.3), np.zeros(RATE // 2)])
+
+    start, end = speech_bounds(samples, RATE)
+
+    assert start / RATE == pytest.approx(0.4, abs=0.02)
+    assert end / RATE == pytest.approx(1.7, abs=0.02)
+
+
+def test_ignores_clicks():
+    samples = np.concatenate([np.zeros(RATE // 2), tone(0.5), np.zeros(RATE // 2)])
+    samples[1000:1040] = 0.9  # 2.5ms click in the leading silence
+
+    start, _ = speech_bounds(samples, RATE)
+
+    assert start / RATE == pytest.approx(0.4, abs=0.02)
+
+
+def test_keeps_leading_fricative():
+    fricative = noise(0.15, 0.02, seed=3)  # Quiet, noisy "s"
+    samples = np.concatenate([noise(0.5, 0.001), fricative, tone(0.5), noise(0.5, 0.001, seed=4)])
+
+    start, _ = speech_bounds(samples, RATE)
+
+    assert start / RATE == pytest.approx(0.4, abs=0.02)
+
+
+def test_no_speech_or_all_speech_keeps_everything():
+    assert speech_bounds(np.zeros(RATE), RATE) == (0, RATE)
+    assert speech_bounds(tone(1.0), RATE) == (0, RATE)
+    assert speech_bounds(np.zeros(10), RATE) == (0, 10)
@@ -0,0 +1,106 @@
+"""Unit tests for in-memory WAV decoding."""
+
+import io
+import struct
+import wave
+
+import pytest
+
+pytest.importorskip("numpy", reason="numpy required for WAV decoding")
+
+import numpy as np
+
+from app.services.wav import decode_wav, WavFormatError
+
+
+def make_wav(frames: bytes, channels: int = 1, width: int = 2, rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(width)
+        w.setframerate(rate)
+        w.writeframes(frames)
+    return buffer.getvalue()
+
+
+def test_decode_16bit_mono_scales_to_unit_range():
+    wav = decode_wav(make_wav(np.array([0, 16384, -32768], dtype="<i2").tobytes()))
+
+    assert wav.sample_rate == 16000
+    assert wav.samples.shape == (1, 3)
+    assert wav.samples[0].tolist() == [0.0, 0.5, -1.0]
+
+
+def test_decode_stereo_deinterleaves_channels():
+    frames = np.array([1, -1, 2, -2], dtype="<i2").tobytes()
+
+    wav = decode_wav(make_wav(frames, channels=2))
+
+    assert wav.samples.shape == (2, 2)
+    assert (wav.samples[0] > 0).all() and (wav.samples[1] < 0).all()
+
+
+def test_decode_24bit_keeps_sign():
+    frames = b"\x00\x00\x40" + b"\xff\xff\xff"  # +0.5 and -1 LSB
+
+    wav = decode_wav(make_wav(frames, width=3))
+
+    assert wav.samples[0, 0] == 0.5
+    assert -1e-6 < wav.samples[0, 1] < 0
+
+
+def test_decode_8bit_is_unsigned():
+    wav = decode_wav(make_wav(bytes([128, 192, 0]), width=1))
+
+    assert wav.samples[0].tolist() == [0.0, 0.5, -1.0]
+
+
+def test_decode_float32_and_extensible_header():
+    samples = np.array([0.25, -0.75], dtype="<f4").tobytes()
+    subformat = struct.pack("<H", 3) + b"\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71"
+    fmt = struct.pack("<HHIIHH", 0xFFFE, 1, 8000, 32000, 4, 32) + struct.pack("<HHI", 22, 32, 4) + subformat
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + b"data" + struct.pack("<I", len(samples)) + samples
+    data = b"RIFF" + struct.pack("<I", len(body)) + body
+
+    wav = decode_wav(data)
+
+    assert wav.sample_rate == 8000
+    assert wav.samples[0].tolist() == [0.25, -0.75]
+
+
+def test_decode_skips_unknown_odd_sized_chunks():
+    wav = make_wav(np.array([16384], dtype="<i2").tobytes())
+    # Insert a 3-byte LIST chunk (+1 pad byte) between fmt and data
+    data_at = wav.index(b"data")
+    data = wav[:data_at] + b"LIST" + struct.pack("<I", 3) + b"abc\x00" + wav[data_at:]
+
+    assert decode_wav(data).samples[0].tolist() == [0.5]
+
+
+def test_decode_truncated_data_drops_partial_frame():
+    wav = make_wav(np.array([1, 2, 3], dtype="<i2").tobytes())
+
+    assert decode_wav(wav[:-1]).samples.shape == (1, 2)
+
+
+def test_decode_rejects_compressed_encodings():
+    wav = bytearray(make_wav(b"\x00" * 10))
+    wav[20:22] = (7).to_bytes(2, "little")  # mu-law
+
+    with pytest.raises(WavFormatError):
+        decode_wav(bytes(wav))
+
+
+def test_decode_rejects_zero_bits_per_sample():
+    # bits=0 with block_align=0 is self-consistent but would divide by zero
+    fmt = struct.pack("<HHIIHH", 1, 1, 16000, 0, 0, 0)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + b"data" + struct.pack("<I", 4) + b"\x00" * 4
+    data = b"RIFF" + struct.pack("<I", len(body)) + body
+
+    with pytest.raises(WavFormatError):
+        decode_wav(data)
+
+
+def test_decode_rejects_missing_data_chunk():
+    with pytest.raises(WavFormatError):
+        decode_wav(b"RIFF\x04\x00\x00\x00WAVE")
@@ -0,0 +1,71 @@
+"""Unit tests for the YIN pitch tracker."""
+
+import pytest
+
+pytest.importorskip("numpy", reason="numpy required for YIN")
+pytest.importorskip("scipy", reason="scipy required for YIN")
+
+import numpy as np
+
+from app.services.yin import frame_times, yin_pitch
+
+
+def harmonic_glide(start_hz: float, end_hz: float, seconds: float, rate: int) -> np.ndarray:
+    """Voice-like signal (decaying harmonics) with a linear pitch glide."""
+    t = np.arange(int(seconds * rate)) / rate
+    f0 = start_hz + (end_hz - start_hz) * t / seconds
+    phase = 2 * np.pi * np.cumsum(f0) / rate
+    return 0.3 * sum(np.sin(k * phase) / k for k in range(1, 8))
+
+
+def test_frame_times_match_praat_layout():
+    # 1s, 10ms step, 40ms window → 97 frames centered on the signal
+    times = frame_times(1.0, 0.01, 0.04)
+
+    assert len(times) == 97
+    assert times[0] == pytest.approx(0.02)
+    assert times[0] + times[-1] == pytest.approx(1.0)
+
+
+def test_frame_times_shorter_than_window_is_empty():
+    assert len(frame_times(0.03, 0.01, 0.04)) == 0
+
+
+@pytest.mark.parametrize("rate, target_rate", [(48000, 16000), (44100, 16000), (16000, 0)])
+def test_yin_tracks_glide(rate, target_rate):
+    samples = harmonic_glide(150.0, 250.0, 1.0, rate)
+
+    pitch = yin_pitch(samples, rate, target_rate=target_rate)
+
+    times = frame_times(1.0, 0.01, 3.0 / 75)
+    expected = 150.0 + 100.0 * times
+    voiced = pitch > 0
+    assert voiced.mean() > 0.95
+    cents = 1200 * np.abs(np.log2(pitch[voiced] / expected[voiced]))
+    assert np.median(cents) < 10
+
+
+def test_yin_silence_is_unvoiced():
+    samples = harmonic_glide(200.0, 200.0, 1.0, 16000)
+    samples[:8000] = 0.0
+
+    pitch = yin_pitch(samples, 16000)
+
+    times = frame_times(1.0, 0.01, 3.0 / 75)
+    assert np.all(pitch[times < 0.45] == 0)
+    assert np.all(pitch[times > 0.55] > 0)
+
+
+def test_yin_noise_is_mostly_unvoiced():
+    samples = np.random.default_rng(0).normal(scale=0.3, size=16000)
+
+    pitch = yin_pitch(samples, 16000)
+
+    assert (pitch > 0).mean() < 0.1
+
+
+def test_yin_averages_channels_and_handles_all_zero():
+    stereo = np.vstack([harmonic_glide(200.0, 200.0, 0.5, 16000)] * 2)
+
+    assert np.median(yin_pitch(stereo, 16000)) == pytest.approx(200.0, rel=0.01)
+    assert not yin_pitch(np.zeros(8000), 16000).any()
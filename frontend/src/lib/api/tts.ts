@@ -65,6 +65,32 @@ export interface CompareResponse {
   user_pitch: number[];
   aligned_native: number[];
   aligned_user: number[];
+  // Leading/trailing silence trimmed from the user recording (ms)
+  user_trim_start_ms?: number;
+  user_trim_end_ms?: number;
+  // Multi-voice compares: best-matching voice and each voice's score
+  voice?: string | null;
+  voice_scores?: Record<string, number> | null;
+  // Segmented compares: per-mora and per-word scores and timings (ms)
+  morae?: MoraScore[] | null;
+  words?: WordScore[] | null;
+}
+
+export interface MoraScore {
+  mora: string;
+  word_index: number;
+  start_ms: number;
+  end_ms: number;
+  score: number | null;
+  user_start_ms: number | null;
+  user_end_ms: number | null;
+}
+
+export interface WordScore {
+  surface: string;
+  start_ms: number;
+  end_ms: number;
+  score: number | null;
 }
 
 export async function comparePronunciation(
@@ -87,6 +113,7 @@ export interface TTSWithPitchResponse {
   voiced_curve: number[];
   duration_ms: number;
   time_step_ms: number;
+  tts_key: string;
 }
 
 export interface TTSWithPitchResult {
@@ -96,6 +123,7 @@ export interface TTSWithPitchResult {
   voicedCurve: number[];
   durationMs: number;
   timeStepMs: number;
+  ttsKey: string;
 }
 
 export async function getTTSWithPitch(
@@ -115,6 +143,7 @@ export async function getTTSWithPitch(
     voicedCurve: data.voiced_curve,
     durationMs: data.duration_ms,
     timeStepMs: data.time_step_ms,
+    ttsKey: data.tts_key,
   };
 }
 